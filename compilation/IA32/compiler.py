@@ -1,7 +1,15 @@
+from concurrent.futures import ProcessPoolExecutor
 from typing import Tuple
 
-from compilation.IA32.utils import produce_offset_table, produce_class_vtable
+from compilation.IA32.utils import produce_offset_table, produce_class_vtable, get_label_allocator, LabelAllocator, \
+    get_layout_engine
+from compilation.IA32.layout import LayoutEngine
 from compilation.IA32.template_factories import *
+from compilation.IA32.register_factories import *
+from compilation.IA32.peephole import PeepholeOptimizer
+from compilation.IA32.emitter import Emitter, StreamEmitter
+from compilation.IA32.context import FunctionContext, start_worker, produce_functions
+from compilation.constant_folding import ConstantFolder, copy_program
 from compilation.type_system.primitives import Primitive
 from compilation.parsing import Parser
 
@@ -12,11 +20,18 @@ class ProgramCompiler:
     """
 
     @staticmethod
-    def create_default() -> "ProgramCompiler":
+    def create_default(backend: str = "stack", workers: int = 1) -> "ProgramCompiler":
         """
         Creates a default compiler.
+        :param backend: the code generation scheme, 'stack' evaluates expressions on the stack and 'registers' keeps
+        temporaries and locals in registers.
+        :param workers: the amount of processes that produce the code of functions.
         :return: an elang compiler.
         """
+        if backend == "registers":
+            return ProgramCompiler.create_register_allocating(workers)
+        if backend != "stack":
+            raise Exception("Unknown backend {0}".format(backend))
         return ProgramCompiler({
             Function: FunctionTemplateFactory(),
             MultiplicationOperator: MultiplyTemplateFactory(),
@@ -40,26 +55,95 @@ class ProgramCompiler:
             ArrayInitializer: ArrayInitializeTemplateFactory(),
             ElangClass: ElangClassTemplateFactory(),
             DotOperator: DotOperatorTemplateFactory()
-        })
+        }, workers=workers)
 
-    def __init__(self, factories: Dict[type, TemplateFactory], verbose: bool = True) -> None:
+    @staticmethod
+    def create_register_allocating(workers: int = 1) -> "ProgramCompiler":
+        """
+        Creates a compiler that allocates registers. Classes, objects and arrays are still produced by the stack
+        machine.
+        :param workers: the amount of processes that produce the code of functions.
+        :return: an elang compiler.
+        """
+        return ProgramCompiler({
+            Function: FunctionRegisterFactory(),
+            MultiplicationOperator: MultiplyRegisterFactory(),
+            SubtractOperator: SubtractionRegisterFactory(),
+            AdditionOperator: AdditionRegisterFactory(),
+            DivisionOperator: DivisionRegisterFactory(),
+            ArrayIndexer: ArrayIndexerRegisterFactory(),
+            Assignment: AssignmentRegisterFactory(),
+            DecimalConstantValue: DecimalConstantRegisterFactory(),
+            Variable: VariableRegisterFactory(),
+            PointerVariable: PointerVariableRegisterFactory(),
+            Return: ReturnRegisterFactory(),
+            FunctionCall: FunctionCallRegisterFactory(),
+            Equal: LogicalEqualRegisterFactory(),
+            LogicalGreater: LogicalGreaterRegisterFactory(),
+            LogicalAnd: LogicalAndRegisterFactory(),
+            LogicalOr: LogicalOrRegisterFactory(),
+            NewOperator: NewOperatorTemplateFactory(),
+            If: IfRegisterFactory(),
+            While: WhileRegisterFactory(),
+            ArrayInitializer: ArrayInitializeTemplateFactory(),
+            ElangClass: ElangClassTemplateFactory(),
+            DotOperator: DotOperatorTemplateFactory()
+        }, workers=workers)
+
+    def __init__(self, factories: Dict[type, TemplateFactory], verbose: bool = True, workers: int = 1) -> None:
         self.factories = factories
+        # The amount of processes that produce the code of functions, they are produced in this process if it is 1.
+        self.workers = workers
         self.size_bundle = {
             "int": 4
         }
         self.verbose = False
+        # Whether the conditions of if and while statements jump on their comparisons, instead of producing a value
+        # that is tested.
+        self.branch_conditions = True
+        # Whether indexers check that their index is inside of the array, False for unchecked release builds. Checks
+        # that the range analysis proves redundant are dropped either way.
+        self.bounds_checks = True
+        # The largest alignment of a member variable, None to align every member to its size.
+        self.packing = None
+        # Computes the constant parts of the programs before they are compiled, None to compile them as they are.
+        self.constant_folder = ConstantFolder()
+        # Rewrites the emitted instructions before they are written, None to write them as they are produced.
+        self.peephole = PeepholeOptimizer.create_default()
 
     def compile_dependency(self, dependency):
         parser = Parser.create_default()
         dp_program = parser.parse_file(dependency)
 
-    def compile_program(self, program: Program, compilation_bundle) -> Tuple[str, str, str]:
+    def fold_constants(self, program: Program) -> Program:
+        """
+        This function folds the constants of a program and of the programs that it includes. The folder rewrites the
+        code that it folds, so a copy of the program is folded: the program can be compiled again, and the included
+        programs are shared with the other programs that include them through the module cache.
+        :param program: the program.
+        :return: the folded copy of the program.
+        """
+        program = copy_program(program)
+        programs, folded = [program], set()
+        while len(programs) is not 0:
+            current = programs.pop()
+            if id(current) in folded:
+                continue
+            folded.add(id(current))
+            self.constant_folder.fold(current)
+            programs += [include.program for include in current.includes.values()]
+        return program
+
+    def compile_program(self, program: Program, compilation_bundle, emitter: Emitter) -> Tuple[str, str]:
         """
         This function compiles a program.
         :param program: the program to compile.
-        :return: None.
+        :param emitter: the emitter that the code of the functions is appended to.
+        :return: tuple of the data segment and the initialization code of the program.
         """
-        text_segment, data_segment, init_segment = "", "", ""
+        data_segment, init_segment = "", ""
+        # The initialization code of the programs is emitted into main.
+        get_label_allocator(compilation_bundle).enter("main")
         for init_statement in program.variables_init:
             init_segment += self.factories[type(init_statement)].produce(init_statement, self.factories,
                                                                          compilation_bundle)
@@ -70,8 +154,7 @@ class ProgramCompiler:
                          )
         for dependency in program.includes:
             compilation_bundle["program"] = program.includes[dependency].program
-            dp_text, dp_data, dp_init = self.compile_program(program.includes[dependency].program, compilation_bundle)
-            text_segment += dp_text
+            dp_data, dp_init = self.compile_program(program.includes[dependency].program, compilation_bundle, emitter)
             data_segment += dp_data
             init_segment += dp_init
         compilation_bundle["program"] = program
@@ -81,44 +164,81 @@ class ProgramCompiler:
             vtables[elang_class] = produce_class_vtable(program.classes[elang_class], self.size_bundle)
         vtables[program] = produce_class_vtable(program, self.size_bundle)
         compilation_bundle["vtables"] = vtables
+        for elang_class in program.classes.values():
+            for f_name, function in elang_class.functions.items():
+                # Calls to methods find the called function by this name, before or after the function is produced.
+                function.name = f"{elang_class.name}_{f_name}"
+        compilation_bundle["produced_functions"] = None
+        if self.workers > 1:
+            compilation_bundle["produced_functions"] = self.produce_functions(program, compilation_bundle)
         for elang_class in program.classes.keys():
-            text_segment += self.factories[ElangClass].produce(program.classes[elang_class], self.factories,
-                                                               compilation_bundle)
+            self.factories[ElangClass].emit(program.classes[elang_class], self.factories, compilation_bundle, emitter)
 
         # for f_name in program.functions:
         #     text_segment += self.compile_function(program, program.functions[f_name]) + "\n"
         for var in program.variables.keys():
             if var not in program.includes:
-                data_segment += f"{var}: times {program.variables[var].get_size(self.size_bundle)} db 0\n"
+                data_segment += f"{var}: times {get_layout_engine(compilation_bundle).get_size(program.variables[var])}" \
+                                " db 0\n"
         for include in program.includes:
             data_segment += f"{include}: times {self.size_bundle['int']} db 0\n"
-        return text_segment, data_segment, init_segment
+        return data_segment, init_segment
+
+    def produce_functions(self, program: Program, compilation_bundle: Dict) -> Dict[str, str]:
+        """
+        This function produces the code of all of the functions of a program in other processes.
+        :param program: the program.
+        :param compilation_bundle: the compilation bundle of the program.
+        :return: the code of every function by the name of the function, the peephole optimizer already rewrote it.
+        """
+        contexts = []
+        for elang_class in program.classes.values():
+            for function in elang_class.functions.values():
+                contexts.append(FunctionContext.create(function, elang_class, compilation_bundle))
+        if len(contexts) <= 1:
+            return {}
+        # The processes start with all of the contexts, and every task produces every n-th function.
+        chunks = [list(range(start, len(contexts), self.workers)) for start in range(min(self.workers, len(contexts)))]
+        with ProcessPoolExecutor(max_workers=len(chunks), initializer=start_worker,
+                                 initargs=(self.factories, self.peephole, contexts)) as executor:
+            results = list(executor.map(produce_functions, chunks))
+        produced = {}
+        for indices, (chunk_assembly, hits) in zip(chunks, results):
+            for idx, assembly in zip(indices, chunk_assembly):
+                produced[contexts[idx].function.name] = assembly
+            for name, rule_hits in hits.items():
+                self.peephole.hits[name] += rule_hits
+        return produced
 
     def compile(self, program: Program, destination_file: str) -> None:
         """
         This function compiles a program.
+        The code of every function is written as soon as it is produced, and the data section follows the text section.
         :param program: the program to compile.
         :param destination_file: the destination path to write the output to.
         :return: None.
         """
+        if self.constant_folder is not None:
+            program = self.fold_constants(program)
         compilation_bundle = {"scope": program.scope, "size_bundle": self.size_bundle,
                               "program": program,
-                              "verbose": self.verbose}
-        text_segment, data_segment, init_statements = self.compile_program(program, compilation_bundle)
-        text_segment += ("main:\n"
+                              "verbose": self.verbose, "labels": LabelAllocator(),
+                              "branch_conditions": self.branch_conditions,
+                              "bounds_checks": self.bounds_checks,
+                              "layouts": LayoutEngine(self.size_bundle, self.packing)}
+        with open(destination_file, "w") as out:
+            out.write("section .text\n"
+                      "extern malloc\n"
+                      "global main\n")
+            emitter = StreamEmitter(out, self.peephole)
+            data_segment, init_statements = self.compile_program(program, compilation_bundle, emitter)
+            emitter.emit("main:\n"
                          f"{init_statements}"
                          f"call {program.name}_main\n")
-        data_segment += f"{program.name}: times 4 db 0\n"
-        assembly = ""
-        if len(data_segment) is not 0:
-            assembly += ("section .data\n"
-                         f"{data_segment}")
-        assembly += ("section .text\n"
-                     "extern malloc\n"
-                     "global main\n"
-                     f"{text_segment}")
-        with open(destination_file, "w") as out:
-            out.write(assembly)
+            emitter.flush()
+            data_segment += f"{program.name}: times 4 db 0\n"
+            out.write("section .data\n"
+                      f"{data_segment}")
 
     def compile_function(self, program, function) -> str:
         """
@@ -132,4 +252,6 @@ class ProgramCompiler:
                                                 {"stack_size": stack_size, "offset_table": offset_table,
                                                  "scope": function.scope, "size_bundle": self.size_bundle,
                                                  "program": program,
-                                                 "verbose": self.verbose})
+                                                 "verbose": self.verbose,
+                                                 "branch_conditions": self.branch_conditions,
+                                                 "bounds_checks": self.bounds_checks})
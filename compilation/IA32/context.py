@@ -0,0 +1,92 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from compilation.models.base import Function, ElangClass, Program, Scope
+from compilation.IA32.emitter import Emitter
+from compilation.IA32.peephole import PeepholeOptimizer
+from compilation.IA32.layout import LayoutEngine
+from compilation.IA32.utils import produce_offset_table, LabelAllocator, get_layout_engine
+
+
+class FunctionContext(NamedTuple):
+    """
+    The information that the code of a single function is produced from.
+    Every function is produced with a bundle of its own that is created from its context, so the changes that the
+    factories make to the bundle never reach other functions, and functions can be produced in any order and in other
+    processes.
+    """
+    function: Function
+    # The scope of the class that holds the function.
+    scope: Scope
+    program: Program
+    vtables: Dict
+    size_bundle: Dict
+    offset_table: Dict[str, int]
+    stack_size: int
+    verbose: bool
+    layouts: LayoutEngine
+    branch_conditions: bool
+    bounds_checks: bool
+
+    @staticmethod
+    def create(function: Function, elang_class: ElangClass, bundle: Dict) -> "FunctionContext":
+        """
+        Creates the context of a function.
+        :param function: the function.
+        :param elang_class: the class that holds the function.
+        :param bundle: the compilation bundle of the program.
+        :return: the context of the function.
+        """
+        layouts = get_layout_engine(bundle)
+        offset_table, stack_size = produce_offset_table(function, bundle["size_bundle"], layouts)
+        return FunctionContext(function, elang_class.scope, bundle["program"], bundle["vtables"],
+                               dict(bundle["size_bundle"]), offset_table, stack_size, bundle["verbose"], layouts,
+                               bool(bundle.get("branch_conditions")), bundle.get("bounds_checks") is not False)
+
+    def create_bundle(self) -> Dict:
+        """
+        This function creates the compilation bundle of the function.
+        :return: a new compilation bundle.
+        """
+        return {"scope": self.scope, "program": self.program, "vtables": self.vtables,
+                "size_bundle": dict(self.size_bundle), "offset_table": dict(self.offset_table),
+                "stack_size": self.stack_size, "verbose": self.verbose, "labels": LabelAllocator(),
+                "layouts": self.layouts, "branch_conditions": self.branch_conditions,
+                "bounds_checks": self.bounds_checks}
+
+
+def produce_function(context: FunctionContext, factories: Dict, peephole: PeepholeOptimizer = None) -> str:
+    """
+    This function produces the code of a function.
+    :param context: the context of the function.
+    :param factories: the template factories.
+    :param peephole: the peephole optimizer that rewrites the code, None to return the code as it is produced.
+    :return: the code of the function.
+    """
+    emitter = Emitter()
+    factories[Function].emit(context.function, factories, context.create_bundle(), emitter)
+    if peephole is None:
+        return emitter.getvalue()
+    return peephole.optimize(emitter.getvalue())
+
+
+# The state of a code generation process, it is set once when the process starts, so that the program is not sent to
+# the process with every task.
+worker_state: Dict = {}
+
+
+def start_worker(factories: Dict, peephole: Optional[PeepholeOptimizer], contexts: List[FunctionContext]) -> None:
+    worker_state["factories"], worker_state["peephole"], worker_state["contexts"] = factories, peephole, contexts
+
+
+def produce_functions(indices: List[int]) -> Tuple[List[str], Dict[str, int]]:
+    """
+    This function produces the code of a part of the functions, it is the task of a code generation process.
+    :param indices: the indices of the functions, in the contexts that the process started with.
+    :return: tuple of the code of every function in the order of the indices, and the rewrites of the peephole rules.
+    """
+    peephole = worker_state["peephole"]
+    if peephole is not None:
+        peephole.hits = {name: 0 for name in peephole.hits}
+    produced = [produce_function(worker_state["contexts"][idx], worker_state["factories"], peephole)
+                for idx in indices]
+    return produced, peephole.hits if peephole is not None else {}
@@ -0,0 +1,75 @@
+from typing import List, TextIO
+
+from compilation.IA32.peephole import PeepholeOptimizer
+
+
+class Emitter:
+    """
+    Destination of the assembly code that the template factories produce.
+    The code is appended in pieces, which are joined once, instead of being copied into the code of every enclosing
+    template.
+    """
+
+    def __init__(self):
+        self.chunks: List[str] = []
+
+    def emit(self, assembly: str) -> None:
+        """
+        This function appends assembly code.
+        :param assembly: the assembly code, one instruction per line.
+        :return: None.
+        """
+        if len(assembly) is not 0:
+            self.chunks.append(assembly)
+
+    def emit_optimized(self, assembly: str) -> None:
+        """
+        This function appends assembly code that the peephole optimizer already rewrote.
+        :param assembly: the assembly code, it holds entire functions.
+        :return: None.
+        """
+        self.emit(assembly)
+
+    def flush(self) -> None:
+        """
+        This function marks the end of a function, the code before it does not change anymore.
+        :return: None.
+        """
+        pass
+
+    def getvalue(self) -> str:
+        return "".join(self.chunks)
+
+
+class StreamEmitter(Emitter):
+    """
+    Emitter that writes the code of every function to a file once the function is complete, so that only a single
+    function is held in memory. The peephole optimizer rewrites the code of every function before it is written,
+    its rules never cross a function.
+    """
+
+    def __init__(self, out: TextIO, peephole: PeepholeOptimizer = None):
+        """
+        Initializes a new stream emitter.
+        :param out: the file to write to.
+        :param peephole: the peephole optimizer, None to write the code as it is emitted.
+        """
+        super(StreamEmitter, self).__init__()
+        self.out = out
+        self.peephole = peephole
+
+    def flush(self) -> None:
+        if len(self.chunks) is 0:
+            return
+        assembly = "".join(self.chunks)
+        self.chunks = []
+        if self.peephole is not None:
+            assembly = self.peephole.optimize(assembly)
+        self.out.write(assembly)
+
+    def emit_optimized(self, assembly: str) -> None:
+        self.flush()
+        self.out.write(assembly)
+
+    def getvalue(self) -> str:
+        raise Exception("The code of a stream emitter is written to its file")
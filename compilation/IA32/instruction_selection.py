@@ -0,0 +1,138 @@
+from typing import Dict, Optional, Tuple
+
+from compilation.models.base import Compilable, Variable, PointerVariable
+from compilation.models.arrays import Array, StackLayer
+from compilation.models.operators import ArrayIndexer
+from compilation.models.values import DecimalConstantValue
+from compilation.type_system.base import Type
+from compilation.IA32.utils import get_layout_engine
+
+# The jump that tests the same comparison after its operands are swapped.
+SWAPPED_JUMPS = {"ja": "jb", "jbe": "jae", "jb": "ja", "jae": "jbe", "je": "je", "jne": "jne"}
+# Scales of an index inside of an address.
+ADDRESS_SCALES = (1, 2, 4, 8)
+
+
+def get_immediate(expression: Compilable) -> Optional[int]:
+    """
+    This function returns the value of an operand that can be an immediate of an instruction.
+    :param expression: the operand.
+    :return: the value of the operand, None if it is not a constant.
+    """
+    if isinstance(expression, DecimalConstantValue):
+        return expression.evaluate()
+    return None
+
+
+def get_shift(value: int) -> Optional[int]:
+    """
+    This function returns the shift that multiplies or divides by a value.
+    :param value: the value.
+    :return: the exponent of the value, None if the value is not a power of two.
+    """
+    if value <= 0 or value & (value - 1) is not 0:
+        return None
+    return value.bit_length() - 1
+
+
+def select_multiply(register: str, value: int) -> str:
+    """
+    This function selects the instructions that multiply a register by a constant.
+    :param register: the register, it holds the product afterwards.
+    :param value: the constant.
+    :return: assembly code.
+    """
+    if value is 0:
+        return f"xor {register}, {register}\n"
+    shift = get_shift(value)
+    if shift is not None:
+        return f"shl {register}, {shift}\n" if shift is not 0 else ""
+    if value - 1 in ADDRESS_SCALES:
+        return f"lea {register}, [{register} + {register} * {value - 1}]\n"
+    return f"imul {register}, {register}, {value}\n"
+
+
+def select_divide(register: str, value: int) -> Optional[str]:
+    """
+    This function selects the instructions that divide a register by a constant, without div.
+    :param register: the register, it holds the quotient afterwards.
+    :param value: the constant.
+    :return: assembly code, None if the division needs div.
+    """
+    shift = get_shift(value)
+    if shift is None:
+        return None
+    return f"shr {register}, {shift}\n" if shift is not 0 else ""
+
+
+def select_scaled_address(base: str, index: str, scale: int, displacement: int) -> str:
+    """
+    This function selects the instructions that set a base register to the address of a cell of an array.
+    :param base: the register of the start of the array, it holds the address afterwards.
+    :param index: the register of the index, it is changed when the scale is not a scale of an address.
+    :param scale: the size of a cell.
+    :param displacement: the offset of the first cell.
+    :return: assembly code.
+    """
+    if scale in ADDRESS_SCALES:
+        scaled = index if scale is 1 else f"{index} * {scale}"
+        return f"lea {base}, [{base} + {scaled} + {displacement}]\n"
+    return select_multiply(index, scale) + f"lea {base}, [{base} + {index} + {displacement}]\n"
+
+
+def get_indexed_type(indexer_expression: ArrayIndexer) -> Tuple[int, Optional[Type]]:
+    """
+    This function finds the array that an indexer indexes.
+    :param indexer_expression: the indexer.
+    :return: tuple of the amount of indexers between the indexer and the array, and the type of the array, None if the
+    array is not a variable.
+    """
+    depth, array = 0, indexer_expression.left
+    while isinstance(array, ArrayIndexer):
+        depth, array = depth + 1, array.left
+    if not isinstance(array, (Variable, PointerVariable)) or array.symbol is None:
+        return depth, None
+    return depth, array.symbol.var_type
+
+
+def is_array_element(indexer_expression: ArrayIndexer) -> bool:
+    """
+    This function checks if the cell of an indexer holds an element of its array, the cells of the other dimensions are
+    sub arrays, which are used by their address.
+    :param indexer_expression: the indexer.
+    :return: True if the indexer indexes the last dimension of its array, or an array of an unknown type.
+    """
+    depth, var_type = get_indexed_type(indexer_expression)
+    return not isinstance(var_type, Array) or depth == len(var_type.layers) - 1
+
+
+def get_array_header(indexer_expression: ArrayIndexer, bundle: Dict) -> Optional[Dict]:
+    """
+    This function finds the header of the array that an indexer indexes, when it is known before the program runs.
+    Arrays that are declared with constant sizes store the same header that their type describes.
+    :param indexer_expression: the indexer.
+    :param bundle: the compilation bundle.
+    :return: the header of the indexed array, with its array size and cell size, None if it is only known at run time.
+    """
+    depth, var_type = get_indexed_type(indexer_expression)
+    if not isinstance(var_type, Array) or not all(isinstance(layer, StackLayer) for layer in var_type.layers):
+        return None
+    return get_layout_engine(bundle).get_array_layout(var_type).metadata[depth]
+
+
+def select_bounds_check(index: str, size: str, label: str) -> str:
+    """
+    This function selects the instructions that exit the program when an index is outside of its array.
+    :param index: the operand of the index.
+    :param size: the operand of the size of the array.
+    :param label: the unique id of the label that the instructions jump to when the index is in bounds.
+    :return: assembly code.
+    """
+    return (
+        f"cmp {index}, {size}\n"
+        f"jb loc_{label}\n"
+        "mov eax, 0\n"
+        "mov ebx, 0\n"
+        "int 0x80\n"
+        f"loc_{label}:\n"
+    )
@@ -0,0 +1,108 @@
+from typing import Dict, List, Optional
+
+from compilation.headers import CompileAsPointer
+from compilation.models.arrays import Array
+from compilation.models.base import ElangClass
+from compilation.type_system.base import Type
+
+
+class ClassLayout:
+    """
+    The layout of the objects of a class on the heap.
+    """
+    __slots__ = ("size", "alignment", "offsets")
+
+    def __init__(self, size: int, alignment: int, offsets: Dict[str, int]):
+        """
+        Initializes a new class layout.
+        :param size: the size of an object, a multiple of the alignment.
+        :param alignment: the largest alignment of a member variable.
+        :param offsets: the offset of every member variable from the start of the object.
+        """
+        self.size = size
+        self.alignment = alignment
+        self.offsets = offsets
+
+
+class ArrayLayout:
+    """
+    The layout of an array that is stored on the stack or inside of an object, with the headers of its sub arrays.
+    """
+    __slots__ = ("size", "metadata")
+
+    def __init__(self, size: int, metadata: List[Dict]):
+        self.size = size
+        self.metadata = metadata
+
+
+class LayoutEngine:
+    """
+    Computes the sizes of types, the offsets of member variables and the headers of arrays once per compilation.
+    Member variables are aligned to their size, up to the packing. Larger members are placed first, so that smaller
+    members fill the space that alignment would otherwise leave empty.
+    """
+
+    def __init__(self, size_bundle: Dict, packing: Optional[int] = None):
+        """
+        Initializes a new layout engine.
+        :param size_bundle: the size bundle of the compiler.
+        :param packing: the largest alignment of a member variable, None to align every member to its size.
+        """
+        self.size_bundle = size_bundle
+        self.packing = packing
+        self.classes: Dict[str, ClassLayout] = {}
+        # Array types are declared once per variable, they are keyed by their id.
+        self.arrays: Dict[int, ArrayLayout] = {}
+
+    def get_size(self, var_type: Type) -> int:
+        """
+        This function returns the size of a variable of a type.
+        :param var_type: the type.
+        :return: the size in bytes, classes are stored as a pointer.
+        """
+        if isinstance(var_type, Array):
+            return self.get_array_layout(var_type).size
+        if isinstance(var_type, CompileAsPointer):
+            return self.size_bundle["int"]
+        return var_type.get_size(self.size_bundle)
+
+    def get_alignment(self, var_type: Type) -> int:
+        # Arrays start with their headers, which are ints.
+        alignment = self.size_bundle["int"] if isinstance(var_type, CompileAsPointer) else self.get_size(var_type)
+        if self.packing is not None:
+            alignment = min(alignment, self.packing)
+        return max(alignment, 1)
+
+    def get_class_layout(self, elang_class: ElangClass) -> ClassLayout:
+        """
+        This function returns the layout of a class, it is computed the first time it is requested.
+        :param elang_class: the class.
+        :return: the layout of the class.
+        """
+        layout = self.classes.get(elang_class.name)
+        if layout is None:
+            layout = self.classes[elang_class.name] = self.produce_class_layout(elang_class)
+        return layout
+
+    def produce_class_layout(self, elang_class: ElangClass) -> ClassLayout:
+        members = sorted(elang_class.variables.items(), key=lambda member: -self.get_alignment(member[1]))
+        offsets, size, class_alignment = {}, 0, 1
+        for name, var_type in members:
+            alignment = self.get_alignment(var_type)
+            size += -size % alignment
+            offsets[name] = size
+            size += self.get_size(var_type)
+            class_alignment = max(class_alignment, alignment)
+        return ClassLayout(size + -size % class_alignment, class_alignment, offsets)
+
+    def get_array_layout(self, array: Array) -> ArrayLayout:
+        """
+        This function returns the layout of an array, it is computed the first time it is requested.
+        :param array: the array type.
+        :return: the layout of the array.
+        """
+        layout = self.arrays.get(id(array))
+        if layout is None:
+            layout = self.arrays[id(array)] = ArrayLayout(array.get_size(self.size_bundle),
+                                                          array.get_metadata(self.size_bundle))
+        return layout
@@ -0,0 +1,340 @@
+import re
+from itertools import zip_longest
+from typing import Callable, Dict, List, Match, Optional, Tuple
+
+REGISTER = r"(?:eax|ebx|ecx|edx|esi|edi)"
+IMMEDIATE = r"-?(?:0x[0-9a-fA-F]+|[0-9]+)"
+SYMBOL = r"[A-Za-z_][\w.]*"
+ADDRESS = r"\[[^\]\n]+\]"
+MEMORY = f"(?:DWORD )?{ADDRESS}"
+VALUE = f"(?:{IMMEDIATE}|{SYMBOL}|{MEMORY})"
+# Instructions that only change their first operand and the flags.
+SIMPLE_INSTRUCTION = r"(?:mov|lea|add|sub|imul|shl|shr|xor|cmp|test) [^\n]+"
+
+REGISTER_ALIASES = {
+    "eax": ("eax", "ax", "al", "ah"),
+    "ebx": ("ebx", "bx", "bl", "bh"),
+    "ecx": ("ecx", "cx", "cl", "ch"),
+    "edx": ("edx", "dx", "dl", "dh"),
+    "esi": ("esi", "si"),
+    "edi": ("edi", "di"),
+}
+REGISTER_PATTERNS = {register: re.compile(r"\b(?:" + "|".join(aliases) + r")\b")
+                     for register, aliases in REGISTER_ALIASES.items()}
+# Registers that are read by instructions without being operands.
+IMPLICIT_READS = {"div": ("eax", "edx"), "mul": ("eax", "edx"), "idiv": ("eax", "edx"), "cdq": ("eax",)}
+# Instructions that only write their first operand.
+DESTINATION_WRITES = ("mov", "lea", "pop")
+# The result of a rule whose instructions match while its condition does not, it may match after other rewrites.
+DEFERRED: List[str] = []
+# Functions receive their arguments on the stack, and may change these registers.
+CALL_CLOBBERS = ("eax", "ecx", "edx")
+
+
+def split_instruction(line: str) -> List[str]:
+    """
+    This function splits an instruction into its operation and operands.
+    :param line: the instruction.
+    :return: list of the operation followed by the operands.
+    """
+    operation, _, operands = line.partition(" ")
+    return [operation] + [operand.strip() for operand in operands.split(",")] if operands else [operation]
+
+
+def mentions(register: str, text: str) -> bool:
+    return REGISTER_PATTERNS[register].search(text) is not None
+
+
+def is_dead(register: str, lines: List[Optional[str]], start: int, labels: Dict[str, int]) -> bool:
+    """
+    This function checks if the value of a register is overwritten before it is read, on every path that leaves an
+    instruction. Jumps are followed to their labels, only eax is read by a return, and calls read no registers.
+    :param register: the register.
+    :param lines: the instructions, removed instructions are None.
+    :param start: the index of the first instruction after the value is set.
+    :param labels: the index of every label.
+    :return: True if the value of the register is never read, False otherwise.
+    """
+    pending, visited = [start], set()
+    while len(pending) is not 0:
+        index = pending.pop()
+        while index < len(lines):
+            if index in visited:
+                break
+            visited.add(index)
+            line = lines[index]
+            index += 1
+            if line is None or len(line) is 0 or line.startswith(";") or line.endswith(":"):
+                continue
+            parts = split_instruction(line)
+            operation = parts[0]
+            if operation.startswith("j"):
+                if parts[1] not in labels:
+                    return False
+                pending.append(labels[parts[1]])
+                if operation == "jmp":
+                    break
+                continue
+            if operation == "ret":
+                if register == "eax":
+                    return False
+                break
+            if operation == "int" or register in IMPLICIT_READS.get(operation, ()):
+                return False
+            if operation == "call" and not mentions(register, parts[1]):
+                if register in CALL_CLOBBERS:
+                    break
+                continue
+            if operation in DESTINATION_WRITES and parts[1] == register:
+                if len(parts) > 2 and mentions(register, parts[2]):
+                    return False
+                break
+            if operation == "xor" and parts[1] == parts[2] == register:
+                break
+            if mentions(register, line[len(operation):]):
+                return False
+        else:
+            return False
+    return True
+
+
+class PeepholeRule:
+    """
+    Rewrite of a window of consecutive instructions into fewer instructions.
+    """
+
+    def __init__(self, name: str, pattern: List[str], replacement: List[str],
+                 condition: Callable[[Match, List[Optional[str]], int, Dict[str, int]], bool] = None):
+        """
+        Initializes a new peephole rule.
+        :param name: the name of the rule, hits are counted by name.
+        :param pattern: regular expression for every instruction of the window, groups can be referred to by the
+        patterns of the instructions that follow.
+        :param replacement: the instructions that replace the window, formatted with the groups of the pattern.
+        :param condition: condition on the match, the instructions, the index after the window and the labels.
+        """
+        if len(replacement) > len(pattern):
+            raise Exception("Peephole rule {0} does not shrink the code".format(name))
+        self.name = name
+        self.size = len(pattern)
+        # The operation of every instruction of the window, None if the pattern of the instruction matches any.
+        self.operations = [None if instruction.startswith("(") else instruction.split(" ")[0]
+                           for instruction in pattern]
+        self.pattern = re.compile("\n".join(pattern))
+        self.replacement = replacement
+        self.condition = condition
+
+    def matches_operations(self, operations: List[Optional[str]], window: List[int]) -> bool:
+        """
+        This function checks the operations of a window before its instructions are matched.
+        :param operations: the operation of every instruction.
+        :param window: the indexes of the instructions of the window, it can be longer than the rule.
+        :return: True if the operations of the window match the rule, False otherwise.
+        """
+        if len(window) < self.size:
+            return False
+        for position, operation in zip(window, self.operations):
+            if operation is not None and operations[position] != operation:
+                return False
+        return True
+
+    def apply(self, lines: List[Optional[str]], window: List[int], labels: Dict[str, int]) -> Optional[List[str]]:
+        """
+        This function matches the rule at a window of instructions.
+        :param lines: the instructions, removed instructions are None.
+        :param window: the indexes of the instructions of the window.
+        :param labels: the index of every label.
+        :return: the instructions that replace the window, None if the rule does not match, DEFERRED if the
+        instructions match and the condition does not.
+        """
+        match = self.pattern.fullmatch("\n".join(lines[index] for index in window))
+        if match is None:
+            return None
+        if self.condition is not None and not self.condition(match, lines, window[-1] + 1, labels):
+            return DEFERRED
+        groups = match.groupdict(default="")
+        return [instruction.format(**groups) for instruction in self.replacement]
+
+
+def is_stored_off_stack(match: Match, lines: List[Optional[str]], end: int, labels: Dict[str, int]) -> bool:
+    return "esp" not in match.group("b")
+
+
+def is_moved_across(match: Match, lines: List[Optional[str]], end: int, labels: Dict[str, int]) -> bool:
+    middle = match.group("mid")
+    return "esp" not in middle and not mentions(match.group("b"), middle) \
+        and split_instruction(middle)[1] != match.group("a")
+
+
+def is_stored_through_dead(match: Match, lines: List[Optional[str]], end: int, labels: Dict[str, int]) -> bool:
+    address, value = match.group("r"), match.group("a")
+    return value != address and "esp" not in match.group("m") and not mentions(value, match.group("m")) \
+        and is_dead(address, lines, end, labels)
+
+
+def is_forwarded(match: Match, lines: List[Optional[str]], end: int, labels: Dict[str, int]) -> bool:
+    register = match.group("r")
+    return not mentions(register, match.group("s")) and is_dead(register, lines, end, labels)
+
+
+class PeepholeOptimizer:
+    """
+    Pass that rewrites short sequences of emitted instructions into cheaper equivalents.
+    Every rule of the table is tried at every instruction, and the instructions are scanned again until no rule
+    matches. The number of rewrites of every rule is counted.
+    """
+
+    @staticmethod
+    def create_default() -> "PeepholeOptimizer":
+        """
+        Creates a default peephole optimizer.
+        :return: a peephole optimizer.
+        """
+        return PeepholeOptimizer([
+            PeepholeRule("push-pop-same", [f"push (?P<a>{REGISTER})", "pop (?P=a)"], []),
+            PeepholeRule("push-pop-move", [f"push (?P<a>{VALUE})", f"pop (?P<b>{REGISTER})"], ["mov {b}, {a}"]),
+            PeepholeRule("push-pop-store", [f"push (?P<a>{REGISTER})", f"pop (?P<b>{MEMORY})"], ["mov {b}, {a}"],
+                         is_stored_off_stack),
+            PeepholeRule("push-pop-across", [f"push (?P<a>{REGISTER}|{IMMEDIATE}|{SYMBOL})",
+                                             f"(?P<mid>{SIMPLE_INSTRUCTION})", f"pop (?P<b>{REGISTER})"],
+                         ["mov {b}, {a}", "{mid}"], is_moved_across),
+            PeepholeRule("self-move", [f"mov (?P<a>{REGISTER}), (?P=a)"], []),
+            PeepholeRule("address-load", [f"lea (?P<r>{REGISTER}), (?P<m>{ADDRESS})", r"mov (?P=r), \[(?P=r)\]"],
+                         ["mov {r}, {m}"]),
+            PeepholeRule("address-store", [f"lea (?P<r>{REGISTER}), (?P<m>{ADDRESS})", f"pop (?P<a>{REGISTER})",
+                                           r"mov \[(?P=r)\], (?P=a)"],
+                         ["pop {a}", "mov {m}, {a}"], is_stored_through_dead),
+            PeepholeRule("address-move", [f"lea (?P<r>{REGISTER}), (?P<m>{ADDRESS})",
+                                          fr"mov \[(?P=r)\], (?P<a>{REGISTER})"],
+                         ["mov {m}, {a}"], is_stored_through_dead),
+            PeepholeRule("global-store", [f"mov (?P<r>{REGISTER}), (?P<m>{SYMBOL})", f"pop (?P<a>{REGISTER})",
+                                          r"mov (?P<size>DWORD )?\[(?P=r)\], (?P=a)"],
+                         ["pop {a}", "mov {size}[{m}], {a}"], is_stored_through_dead),
+            PeepholeRule("global-move", [f"mov (?P<r>{REGISTER}), (?P<m>{SYMBOL})",
+                                         fr"mov (?P<size>DWORD )?\[(?P=r)\], (?P<a>{REGISTER})"],
+                         ["mov {size}[{m}], {a}"], is_stored_through_dead),
+            PeepholeRule("forward-load", [f"mov (?P<r>{REGISTER}), (?P<x>{VALUE})", f"mov (?P<s>{REGISTER}), (?P=r)"],
+                         ["mov {s}, {x}"], is_forwarded),
+            PeepholeRule("forward-store", [f"mov (?P<r>{REGISTER}), (?P<x>{REGISTER})",
+                                           f"mov (?P<s>{MEMORY}), (?P=r)"], ["mov {s}, {x}"], is_forwarded),
+            PeepholeRule("forward-store-immediate", [f"mov (?P<r>{REGISTER}), (?P<x>{IMMEDIATE}|{SYMBOL})",
+                                                     f"mov (?:DWORD )?(?P<s>{ADDRESS}), (?P=r)"],
+                         ["mov DWORD {s}, {x}"], is_forwarded),
+        ])
+
+    def __init__(self, rules: List[PeepholeRule]):
+        self.rules = rules
+        self.first_operations = set(rule.operations[0] for rule in rules)
+        # The rules that can match, by the operations of the first two instructions of a window.
+        self.rules_by_operations: Dict[Tuple[str, Optional[str]], List[PeepholeRule]] = {}
+        self.hits: Dict[str, int] = {rule.name: 0 for rule in rules}
+
+    def optimize(self, assembly: str) -> str:
+        """
+        This function rewrites assembly code until no rule matches.
+        The first pass scans every instruction. A rewrite only changes the windows that overlap it, which are scanned
+        again right away, and the windows whose condition failed are scanned again by the next pass, since their
+        conditions depend on instructions outside of them.
+        :param assembly: the assembly code, one instruction per line.
+        :return: the optimized assembly code.
+        """
+        lines: List[Optional[str]] = assembly.splitlines()
+        # Removed instructions are marked instead of deleted, so the indexes of the labels stay valid.
+        operations = [line.split(" ", 1)[0] for line in lines]
+        labels = {line[:-1]: index for index, line in enumerate(lines) if line.endswith(":")}
+        deferred = set()
+        changed = self.scan(lines, operations, labels, 0, len(lines), deferred)
+        while changed and len(deferred) is not 0:
+            pending, deferred = sorted(deferred), set()
+            changed = False
+            for index in pending:
+                changed = self.scan(lines, operations, labels, index, index + 1, deferred) or changed
+        return "".join(line + "\n" for line in lines if line is not None)
+
+    def scan(self, lines: List[Optional[str]], operations: List[Optional[str]], labels: Dict[str, int], start: int,
+             stop: int, deferred: set) -> bool:
+        """
+        This function rewrites the windows that start in a range of instructions.
+        :param lines: the instructions, removed instructions are None.
+        :param operations: the operation of every instruction, None for removed instructions.
+        :param labels: the index of every label.
+        :param start: the index of the first window.
+        :param stop: the index after the last window, the range grows over the windows that were rewritten.
+        :param deferred: the indexes of the windows whose condition failed are added to it.
+        :return: True if an instruction was rewritten, False otherwise.
+        """
+        longest = max(rule.size for rule in self.rules)
+        changed = False
+        index = start
+        while index < stop:
+            if operations[index] not in self.first_operations:
+                index += 1
+                continue
+            window = self.get_window(operations, index, longest)
+            rules = self.get_rules(operations[index], operations[window[1]] if len(window) > 1 else None)
+            for rule in rules:
+                if not rule.matches_operations(operations, window):
+                    continue
+                replacement = rule.apply(lines, window[:rule.size], labels)
+                if replacement is None:
+                    continue
+                if replacement is DEFERRED:
+                    deferred.add(index)
+                    continue
+                for position, instruction in zip_longest(window[:rule.size], replacement):
+                    lines[position] = instruction
+                    operations[position] = instruction.split(" ", 1)[0] if instruction is not None else None
+                self.hits[rule.name] += 1
+                changed = True
+                stop = max(stop, index + 1)
+                # The rewrite can complete a window that starts before it.
+                for _ in range(longest - 1):
+                    index = self.get_previous(operations, index)
+                break
+            else:
+                index += 1
+        return changed
+
+    def get_rules(self, first: str, second: Optional[str]) -> List[PeepholeRule]:
+        """
+        This function returns the rules that can match a window, in the order of the rule table.
+        :param first: the operation of the first instruction of the window.
+        :param second: the operation of the second instruction of the window, None if there is none.
+        :return: list of the rules.
+        """
+        key = (first, second)
+        if key not in self.rules_by_operations:
+            self.rules_by_operations[key] = [
+                rule for rule in self.rules if rule.operations[0] == first and
+                (rule.size is 1 or (second is not None and rule.operations[1] in (None, second)))]
+        return self.rules_by_operations[key]
+
+    @staticmethod
+    def get_window(operations: List[Optional[str]], index: int, size: int) -> List[int]:
+        """
+        This function finds the indexes of consecutive instructions, skipping removed instructions.
+        :param operations: the operation of every instruction, None for removed instructions.
+        :param index: the index of the first instruction.
+        :param size: the maximal amount of instructions.
+        :return: list of the indexes, shorter than the size at the end of the code.
+        """
+        window = []
+        while len(window) < size and index < len(operations):
+            if operations[index] is not None:
+                window.append(index)
+            index += 1
+        return window
+
+    @staticmethod
+    def get_previous(operations: List[Optional[str]], index: int) -> int:
+        index -= 1
+        while index > 0 and operations[index] is None:
+            index -= 1
+        return max(index, 0)
+
+    def report(self) -> str:
+        """
+        This function describes the number of rewrites of every rule.
+        :return: a line for every rule that matched.
+        """
+        return "".join(f"{name}: {hits}\n" for name, hits in self.hits.items() if hits is not 0)
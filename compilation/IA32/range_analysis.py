@@ -0,0 +1,163 @@
+from typing import Dict, Optional, Set
+
+from compilation.models.base import *
+from compilation.models.keywords import Return, If, While
+from compilation.models.operators import *
+from compilation.models.values import DecimalConstantValue, FunctionCall
+from compilation.type_system.primitives import Primitive
+from compilation.IA32.instruction_selection import get_array_header
+
+
+class RangeAnalysis:
+    """
+    Analysis of the values of the int locals of a function, that finds the indexers whose index is always inside of
+    the indexed array, so their bounds check can be dropped.
+    Indexes are compared unsigned, so only upper bounds are tracked: the condition of a while or if statement that
+    compares a constant with a local, as in `n > i`, bounds the local inside of its body, until a statement of the body
+    assigns the local. A while loop forgets the bounds of every local that its body assigns, since its condition is
+    checked again after the body.
+    """
+
+    def __init__(self, bundle: Dict):
+        """
+        Initializes a new range analysis.
+        :param bundle: the compilation bundle, the headers of the arrays are taken from its layouts.
+        """
+        self.bundle = bundle
+        self.scope_tree: ScopeTree = bundle["program"].scope_tree
+        self.function: Function = None
+        self.in_bounds: Set[int] = set()
+
+    def find_in_bounds(self, function: Function) -> Set[int]:
+        """
+        This function finds the indexers of a function whose index is always smaller than the size of their array.
+        The indexers are kept by their id, so the result is valid only for the function objects that were analyzed.
+        :param function: the function.
+        :return: set of the ids of the indexers.
+        """
+        self.function, self.in_bounds = function, set()
+        self.analyze_scopeable(function, {})
+        in_bounds, self.function, self.in_bounds = self.in_bounds, None, set()
+        return in_bounds
+
+    def analyze_scopeable(self, scopeable: Scopeable, bounds: Dict[Symbol, int]) -> None:
+        """
+        This function finds the indexers of the statements of a scopeable that are in bounds.
+        :param scopeable: the scopeable.
+        :param bounds: the bounds that hold when the body starts, the exclusive upper bound of every bounded local.
+        """
+        bounds = dict(bounds)
+        for statement in scopeable.body:
+            if isinstance(statement, VariableDeclaration):
+                continue
+            if isinstance(statement, While):
+                assigned = self.get_assigned(statement)
+                loop_bounds = {symbol: bound for symbol, bound in bounds.items() if symbol not in assigned}
+                self.collect_in_bounds(statement.condition, loop_bounds)
+                self.add_condition_bounds(statement.condition, loop_bounds)
+                self.analyze_scopeable(statement, loop_bounds)
+            elif isinstance(statement, If):
+                self.collect_in_bounds(statement.condition, bounds)
+                if_bounds = dict(bounds)
+                self.add_condition_bounds(statement.condition, if_bounds)
+                self.analyze_scopeable(statement, if_bounds)
+            else:
+                self.collect_in_bounds(statement.expression if isinstance(statement, Return) else statement, bounds)
+            for symbol in self.get_assigned(statement):
+                bounds.pop(symbol, None)
+
+    def add_condition_bounds(self, condition: Compilable, bounds: Dict[Symbol, int]) -> None:
+        """
+        This function adds the bounds that hold when a condition is true.
+        :param condition: the condition.
+        :param bounds: the bounds, they are updated.
+        """
+        if isinstance(condition, LogicalAnd):
+            self.add_condition_bounds(condition.left, bounds)
+            self.add_condition_bounds(condition.right, bounds)
+        elif isinstance(condition, LogicalGreater) and isinstance(condition.right, Variable) \
+                and self.is_tracked(condition.right.symbol):
+            bound = self.get_bound(condition.left, bounds)
+            if bound is not None:
+                # The local is smaller than the largest value of the left side.
+                symbol = condition.right.symbol
+                bounds[symbol] = min(bounds.get(symbol, bound - 1), bound - 1)
+
+    def get_bound(self, expression: Compilable, bounds: Dict[Symbol, int]) -> Optional[int]:
+        """
+        This function finds an upper bound of the unsigned value of an expression.
+        :param expression: the expression.
+        :param bounds: the bounds of the locals.
+        :return: a value that the expression is always smaller than, None if the expression is not bounded.
+        """
+        if isinstance(expression, DecimalConstantValue):
+            return (expression.evaluate() & WORD_MASK) + 1
+        if isinstance(expression, Variable):
+            return bounds.get(expression.symbol)
+        if not isinstance(expression, (AdditionOperator, MultiplicationOperator, DivisionOperator)):
+            return None
+        left, right = self.get_bound(expression.left, bounds), self.get_bound(expression.right, bounds)
+        if isinstance(expression, DivisionOperator):
+            divisor = right - 1 if isinstance(expression.right, DecimalConstantValue) else 0
+            return (left - 1) // divisor + 1 if left is not None and divisor > 0 else None
+        if left is None or right is None:
+            return None
+        # The largest value of the operation, which is exact as long as the operation does not wrap.
+        largest = (left - 1) + (right - 1) if isinstance(expression, AdditionOperator) else (left - 1) * (right - 1)
+        return largest + 1 if largest <= WORD_MASK else None
+
+    def collect_in_bounds(self, expression: Compilable, bounds: Dict[Symbol, int]) -> None:
+        if isinstance(expression, ArrayIndexer):
+            header = get_array_header(expression, self.bundle)
+            bound = self.get_bound(expression.right, bounds)
+            if header is not None and bound is not None and bound <= header["array_size"]:
+                self.in_bounds.add(id(expression))
+        if isinstance(expression, FunctionCall):
+            for argument in expression.arguments:
+                self.collect_in_bounds(argument, bounds)
+        elif isinstance(expression, BinaryOperator):
+            self.collect_in_bounds(expression.left, bounds)
+            self.collect_in_bounds(expression.right, bounds)
+        elif isinstance(expression, UnaryOperator):
+            self.collect_in_bounds(expression.obj, bounds)
+
+    def get_assigned(self, statement: Compilable) -> Set[Symbol]:
+        """
+        This function finds the locals that a statement assigns, including the statements of its body.
+        :param statement: the statement.
+        :return: set of the symbols of the locals.
+        """
+        assigned = set()
+        if isinstance(statement, Scopeable):
+            for inner_statement in statement.body:
+                assigned |= self.get_assigned(inner_statement)
+        elif isinstance(statement, Assignment) and isinstance(statement.left, Variable):
+            assigned.add(statement.left.symbol)
+        return assigned
+
+    def is_tracked(self, symbol: Symbol) -> bool:
+        """
+        This function checks if the bounds of a local are tracked, int locals of the analyzed function that are
+        declared by its statements, which no call can assign.
+        :param symbol: the symbol of the local.
+        :return: True if the local is tracked, False otherwise.
+        """
+        if symbol is None or symbol.define_line is None:
+            return False
+        if not isinstance(symbol.var_type, Primitive) or symbol.var_type.name != "int":
+            return False
+        # Symbols of other programs are not in the tree of the compiled program, and are never locals.
+        return symbol.scope is self.function.scope or \
+            symbol.scope in self.scope_tree and self.scope_tree.is_descendant(symbol.scope, self.function.scope)
+
+
+def needs_bounds_check(indexer_expression: ArrayIndexer, bundle: Dict) -> bool:
+    """
+    This function checks if the code of an indexer checks the bounds of its index.
+    :param indexer_expression: the indexer.
+    :param bundle: the compilation bundle.
+    :return: False in unchecked builds and for indexers that are always in bounds, True otherwise.
+    """
+    if bundle.get("bounds_checks") is False:
+        return False
+    return id(indexer_expression) not in bundle.get("in_bounds", ())
@@ -0,0 +1,256 @@
+from typing import Dict, List, Optional, Tuple
+
+from compilation.models.base import Scopeable, Function, Variable, PointerVariable, BinaryOperator, UnaryOperator, \
+    Compilable
+from compilation.models.keywords import If, While, Return, VariableDeclaration
+from compilation.models.operators import DotOperator, ArrayIndexer
+from compilation.models.values import FunctionCall
+from compilation.type_system.primitives import Primitive
+
+# Locals are allocated to the registers that are not used by mul/div or by the return value.
+LOCAL_REGISTERS = ("ebx", "esi", "edi")
+TEMPORARY_REGISTERS = ("eax", "ecx", "edx")
+# Every use inside of a loop counts as this many uses of the enclosing code.
+LOOP_WEIGHT = 10
+
+
+class LiveInterval:
+    """
+    The range of statements in which a local variable is alive.
+    """
+    __slots__ = ("name", "start", "end", "weight", "register", "symbols")
+
+    def __init__(self, name: str, position: int, weight: int):
+        self.name = name
+        self.start = position
+        self.end = position
+        self.weight = weight
+        self.register: Optional[str] = None
+        # The declarations that the mentions of the name are bound to.
+        self.symbols = set()
+
+    def __repr__(self):
+        return f"LiveInterval({self.name}, {self.start}, {self.end}, {self.register})"
+
+
+class RegisterAllocation:
+    """
+    The registers of the locals of a single function.
+    The statements of the function are numbered in the order they are emitted, a local is alive from the first to the
+    last statement that mentions it, and it holds its register for that entire range.
+    """
+
+    def __init__(self, positions: Dict[int, int], intervals: Dict[str, LiveInterval]):
+        """
+        Initializes a new register allocation.
+        :param positions: the number of every statement of the function, keyed by the id of the statement.
+        :param intervals: the live intervals of the locals that were allocated a register.
+        """
+        self.positions = positions
+        self.intervals = intervals
+        # While code of the stack machine runs, the locals are read from and written to the stack.
+        self.suspended = 0
+
+    def get_register(self, name: str, position: int) -> Optional[str]:
+        """
+        This function finds the register of a local.
+        :param name: the name of the local.
+        :param position: the number of the current statement.
+        :return: the register of the local, None if the local is on the stack.
+        """
+        interval = self.intervals.get(name)
+        if self.suspended is not 0 or interval is None or not interval.start <= position <= interval.end:
+            return None
+        return interval.register
+
+    def get_active(self, position: int) -> List[LiveInterval]:
+        """
+        This function returns the locals that hold a register at a statement.
+        :param position: the number of the statement.
+        :return: list of the live intervals of the locals.
+        """
+        if self.suspended is not 0:
+            return []
+        return [interval for interval in self.intervals.values() if interval.start <= position <= interval.end]
+
+    def get_used_registers(self) -> List[str]:
+        return sorted(set(interval.register for interval in self.intervals.values()))
+
+
+class RegisterPool:
+    """
+    The registers that hold the temporary values of expressions.
+    """
+
+    def __init__(self, registers: List[str]):
+        self.free = list(registers)
+        self.held: List[str] = []
+
+    def has_free(self) -> bool:
+        return len(self.free) is not 0
+
+    def allocate(self) -> str:
+        if len(self.free) is 0:
+            raise Exception("No free registers")
+        register = self.free.pop(0)
+        self.held.append(register)
+        return register
+
+    def release(self, register: str) -> None:
+        if register in self.held:
+            self.held.remove(register)
+            self.free.insert(0, register)
+
+    def suspend(self) -> List[str]:
+        """
+        This function frees all of the registers, while code of the stack machine runs. The caller saves the registers
+        that are held.
+        :return: the registers that were held.
+        """
+        held = self.held
+        self.free, self.held = self.free + held, []
+        return held
+
+    def resume(self, held: List[str]) -> None:
+        self.free = [register for register in self.free if register not in held]
+        self.held = list(held)
+
+
+def _collect_mentions(expression: Compilable, position: int, weight: int, intervals: Dict[str, LiveInterval],
+                      addressed: set) -> None:
+    if isinstance(expression, PointerVariable):
+        addressed.add(expression.name)
+    elif isinstance(expression, Variable):
+        if expression.name in intervals:
+            interval = intervals[expression.name]
+            interval.start, interval.end = min(interval.start, position), max(interval.end, position)
+            interval.weight += weight
+        else:
+            interval = intervals[expression.name] = LiveInterval(expression.name, position, weight)
+        interval.symbols.add(expression.symbol)
+    elif isinstance(expression, FunctionCall):
+        for argument in expression.arguments:
+            _collect_mentions(argument, position, weight, intervals, addressed)
+    elif isinstance(expression, DotOperator):
+        # Members are not locals, only the left side and the expressions that are used by members are mentions.
+        _collect_mentions(expression.left, position, weight, intervals, addressed)
+        member = expression.right
+        while isinstance(member, ArrayIndexer):
+            _collect_mentions(member.right, position, weight, intervals, addressed)
+            member = member.left
+        if isinstance(member, FunctionCall):
+            for argument in member.arguments:
+                _collect_mentions(argument, position, weight, intervals, addressed)
+        elif not isinstance(member, Variable):
+            _collect_mentions(member, position, weight, intervals, addressed)
+    elif isinstance(expression, BinaryOperator):
+        _collect_mentions(expression.left, position, weight, intervals, addressed)
+        _collect_mentions(expression.right, position, weight, intervals, addressed)
+    elif isinstance(expression, UnaryOperator):
+        _collect_mentions(expression.obj, position, weight, intervals, addressed)
+
+
+def number_statements(function: Function) -> Tuple[Dict[int, int], Dict[str, LiveInterval], List[Tuple[int, int]],
+                                                     set]:
+    """
+    This function numbers the statements of a function in the order they are emitted, and collects the mentions of
+    every variable.
+    :param function: the function.
+    :return: tuple of the statement numbers keyed by the id of the statement, the intervals between the first and last
+    mention of every variable, the ranges of the loops, and the names of the variables that are used as pointers.
+    """
+    positions: Dict[int, int] = {}
+    intervals: Dict[str, LiveInterval] = {}
+    loops: List[Tuple[int, int]] = []
+    addressed = set()
+
+    def number_body(scopeable: Scopeable, weight: int) -> None:
+        for statement in scopeable.body:
+            position = len(positions)
+            positions[id(statement)] = position
+            if isinstance(statement, If) or isinstance(statement, While):
+                body_weight = weight * LOOP_WEIGHT if isinstance(statement, While) else weight
+                _collect_mentions(statement.condition, position, body_weight, intervals, addressed)
+                number_body(statement, body_weight)
+                if isinstance(statement, While):
+                    loops.append((position, len(positions) - 1))
+            elif isinstance(statement, Return):
+                _collect_mentions(statement.expression, position, weight, intervals, addressed)
+            elif not isinstance(statement, VariableDeclaration) and not isinstance(statement, Scopeable):
+                _collect_mentions(statement, position, weight, intervals, addressed)
+
+    number_body(function, 1)
+    return positions, intervals, loops, addressed
+
+
+def extend_over_loops(intervals: List[LiveInterval], loops: List[Tuple[int, int]]) -> None:
+    """
+    This function extends the intervals that overlap a loop over the entire loop, values that are alive in a loop are
+    alive in its next iteration as well.
+    :param intervals: the live intervals.
+    :param loops: the ranges of the loops.
+    :return: None.
+    """
+    for interval in intervals:
+        changed = True
+        while changed:
+            changed = False
+            for start, end in loops:
+                if interval.start <= end and interval.end >= start and \
+                        (interval.start > start or interval.end < end):
+                    interval.start, interval.end = min(interval.start, start), max(interval.end, end)
+                    changed = True
+
+
+def linear_scan(intervals: List[LiveInterval], registers: Tuple[str, ...]) -> None:
+    """
+    This function allocates registers to live intervals by a linear scan over the intervals, ordered by their start.
+    When no register is free, the interval with the least weighted uses between the current interval and the active
+    intervals stays on the stack.
+    :param intervals: the live intervals, their register is set.
+    :param registers: the registers to allocate.
+    :return: None.
+    """
+    free = list(registers)
+    active: List[LiveInterval] = []
+    for interval in sorted(intervals, key=lambda current: (current.start, current.end, current.name)):
+        for expired in sorted(active, key=lambda current: current.end):
+            if expired.end >= interval.start:
+                break
+            active.remove(expired)
+            free.append(expired.register)
+        if len(free) is not 0:
+            interval.register = free.pop(0)
+            active.append(interval)
+            continue
+        spilled = min(active + [interval], key=lambda current: (current.weight, -current.end))
+        if spilled is not interval:
+            interval.register, spilled.register = spilled.register, None
+            active.remove(spilled)
+            active.append(interval)
+
+
+def allocate_registers(function: Function, offset_table: Dict[str, int], size_bundle: Dict) -> RegisterAllocation:
+    """
+    This function allocates registers to the locals of a function.
+    Only int locals that are declared by a statement of the function, and whose address is never taken, are allocated.
+    :param function: the function.
+    :param offset_table: the offset table of the function.
+    :param size_bundle: the size bundle of the compiler.
+    :return: the register allocation of the function.
+    """
+    positions, intervals, loops, addressed = number_statements(function)
+    candidates = []
+    for name, interval in intervals.items():
+        if name in addressed or name not in offset_table or offset_table[name] > 0 or len(interval.symbols) is not 1:
+            continue
+        symbol = next(iter(interval.symbols))
+        # Arguments and members have no declaring statement, and globals are declared in the root scope.
+        if symbol is None or symbol.define_line is None or symbol.scope.parent_scope is None:
+            continue
+        if isinstance(symbol.var_type, Primitive) and symbol.var_type.get_size(size_bundle) == size_bundle["int"]:
+            candidates.append(interval)
+    extend_over_loops(candidates, loops)
+    linear_scan(candidates, LOCAL_REGISTERS)
+    return RegisterAllocation(positions, {interval.name: interval for interval in candidates
+                                          if interval.register is not None})
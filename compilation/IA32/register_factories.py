@@ -0,0 +1,777 @@
+from typing import Dict, Tuple, List, Optional
+
+from compilation.models.values import *
+from compilation.models.keywords import *
+from compilation.models.operators import *
+from compilation.IA32.template_factories import TemplateFactory
+from compilation.IA32.emitter import Emitter
+from compilation.IA32.register_allocation import RegisterPool, allocate_registers, LOCAL_REGISTERS, \
+    TEMPORARY_REGISTERS
+from compilation.IA32.utils import get_unique_id, get_memory_access_prefix, is_global_variable, \
+    is_always_taken, get_label_allocator
+from compilation.IA32.instruction_selection import get_immediate, get_shift, select_multiply, select_divide, \
+    select_scaled_address, get_array_header, is_array_element, select_bounds_check, SWAPPED_JUMPS
+from compilation.IA32.range_analysis import RangeAnalysis, needs_bounds_check
+
+# The location of an operand that was spilled to the stack, because no register was free for the next operand.
+SPILLED = "DWORD [esp]"
+# The instructions of the operations that a chain of operations is produced with, see produce_chain.
+CHAIN_INSTRUCTIONS = {AdditionOperator: "add", SubtractOperator: "sub", MultiplicationOperator: "imul"}
+
+
+def get_local_register(name: str, bundle: Dict):
+    """
+    This function finds the register of a local at the current statement.
+    :param name: the name of the local.
+    :param bundle: the compilation bundle.
+    :return: the register of the local, None if the local is on the stack.
+    """
+    if bundle.get("allocation") is None:
+        return None
+    return bundle["allocation"].get_register(name, bundle["position"])
+
+
+def get_active_locals(bundle: Dict) -> List[Tuple[str, str]]:
+    """
+    This function returns the locals that hold a register at the current statement.
+    :param bundle: the compilation bundle.
+    :return: list of tuples of the register and the stack location of every local.
+    """
+    if bundle.get("allocation") is None:
+        return []
+    return [(interval.register, get_stack_location(interval.name, bundle))
+            for interval in bundle["allocation"].get_active(bundle["position"])]
+
+
+def get_stack_location(name: str, bundle: Dict) -> str:
+    offset = bundle["offset_table"][name]
+    return f"[ebp + {offset}]" if offset > 0 else f"[ebp - {-offset}]"
+
+
+def produce_operand(expression: Compilable, factories: Dict[type, TemplateFactory], bundle: Dict,
+                    address: bool = False) -> Tuple[str, str]:
+    """
+    This function produces the value of an expression into a temporary register. Expressions that have no register
+    factory are produced by the stack machine, and their value is popped into a register.
+    :param expression: the expression.
+    :param factories: the template factories.
+    :param bundle: the compilation bundle.
+    :param address: whether an indexer produces the address of its cell, that is assigned to or indexed again.
+    :return: tuple of the assembly code and the register that holds the value.
+    """
+    factory = factories[type(expression)]
+    if address and isinstance(expression, ArrayIndexer):
+        return factory.produce_address(expression, factories, bundle)
+    if isinstance(factory, RegisterTemplateFactory):
+        return factory.produce_value(expression, factories, bundle)
+    held = bundle["registers"].suspend()
+    active = get_active_locals(bundle)
+    assembly = "".join(f"push {register}\n" for register in held)
+    assembly += "".join(f"mov {location}, {register}\n" for register, location in active)
+    assembly += produce_suspended(expression, factory, factories, bundle)
+    bundle["registers"].resume(held)
+    register = bundle["registers"].allocate()
+    assembly += f"pop {register}\n"
+    assembly += "".join(f"pop {held_register}\n" for held_register in held[::-1])
+    assembly += "".join(f"mov {register}, {location}\n" for register, location in active)
+    return assembly, register
+
+
+def produce_branch(condition: Compilable, factories: Dict[type, TemplateFactory], bundle: Dict, target: str,
+                   jump_if: bool) -> str:
+    """
+    This function produces a jump on the truth value of a condition. Conditions that have no register factory are
+    produced into a register by the stack machine, and the register is tested.
+    :param condition: the condition.
+    :param factories: the template factories.
+    :param bundle: the compilation bundle.
+    :param target: the id of the label to jump to.
+    :param jump_if: the truth value of the condition that jumps, the code falls through on the other one.
+    :return: the assembly code.
+    """
+    factory = factories[type(condition)]
+    if isinstance(factory, RegisterTemplateFactory):
+        return factory.produce_branch(condition, factories, bundle, target, jump_if)
+    assembly, register = produce_operand(condition, factories, bundle)
+    bundle["registers"].release(register)
+    return assembly + (
+        f"test {register}, {register}\n"
+        f"{'jnz' if jump_if else 'jz'} loc_{target}\n"
+    )
+
+
+def produce_comparison(first: Compilable, second: Compilable, factories: Dict[type, TemplateFactory], bundle: Dict,
+                       jump: str, target: str) -> str:
+    """
+    This function produces a comparison of two operands, and a jump on its result.
+    :param first: the operand that is evaluated first, it is the left operand of the comparison.
+    :param second: the operand that is evaluated second.
+    :param factories: the template factories.
+    :param bundle: the compilation bundle.
+    :param jump: the conditional jump instruction.
+    :param target: the id of the label to jump to.
+    :return: the assembly code.
+    """
+    value = get_immediate(second)
+    if value is None and get_immediate(first) is not None:
+        value, first, jump = get_immediate(first), second, SWAPPED_JUMPS[jump]
+    if value is not None:
+        # A local is compared in its register.
+        register = get_local_register(first.name, bundle) if type(first) is Variable else None
+        assembly = ""
+        if register is None:
+            assembly, register = produce_operand(first, factories, bundle)
+            bundle["registers"].release(register)
+        return assembly + f"cmp {register}, {value}\n" + f"{jump} loc_{target}\n"
+    assembly, first_register, second_register, cleanup = produce_operands(first, second, factories, bundle)
+    bundle["registers"].release(first_register)
+    bundle["registers"].release(second_register)
+    # The spilled operand is released with lea, add would change the flags of the comparison.
+    release = "lea esp, [esp + 4]\n" if len(cleanup) is not 0 else ""
+    return assembly + f"cmp {first_register}, {second_register}\n" + release + f"{jump} loc_{target}\n"
+
+
+def produce_immediate_operation(expression: BinaryOperator, factories: Dict[type, TemplateFactory], bundle: Dict,
+                                commutative: bool) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+    """
+    This function produces the operand of a binary operation whose other operand is a constant.
+    :param expression: the operation.
+    :param factories: the template factories.
+    :param bundle: the compilation bundle.
+    :param commutative: whether the constant can be the left operand.
+    :return: tuple of the assembly code, the register of the operand, and the constant, all None if the right
+    operand (or for commutative operations, either operand) is not a constant.
+    """
+    value, operand = get_immediate(expression.right), expression.left
+    if value is None and commutative:
+        value, operand = get_immediate(expression.left), expression.right
+    if value is None:
+        return None, None, None
+    assembly, register = produce_operand(operand, factories, bundle)
+    return assembly, register, value
+
+
+def produce_chain(expression: BinaryOperator, factories: Dict[type, TemplateFactory],
+                  bundle: Dict) -> Tuple[Optional[str], Optional[str]]:
+    """
+    This function produces a left deep chain of arithmetic operations whose right operands are constants or locals,
+    as in `x + i - 2 * j`, into a single register. The operations are applied to the register in a loop, so the
+    length of the chain is not limited by the recursion limit.
+    The innermost left operand is evaluated before the right operands instead of after them, which is the same since
+    no expression can assign a local.
+    :param expression: the outermost operation of the chain.
+    :param factories: the template factories.
+    :param bundle: the compilation bundle.
+    :return: tuple of the assembly code and the register that holds the value, both None if the expression is not a
+    chain of at least two operations.
+    """
+    operations = []
+    while type(expression) in CHAIN_INSTRUCTIONS and (get_immediate(expression.right) is not None or
+                                                      type(expression.right) is Variable and
+                                                      not is_global_variable(expression.right, bundle)):
+        operations.append(expression)
+        expression = expression.left
+    if len(operations) < 2:
+        return None, None
+    assembly, register = produce_operand(expression, factories, bundle)
+    for operation in operations[::-1]:
+        value, instruction = get_immediate(operation.right), CHAIN_INSTRUCTIONS[type(operation)]
+        if value is not None and instruction == "imul":
+            assembly += select_multiply(register, value)
+            continue
+        if value is None:
+            value = get_local_register(operation.right.name, bundle)
+        if value is None:
+            value = get_stack_location(operation.right.name, bundle)
+        assembly += f"{instruction} {register}, {value}\n"
+    return assembly, register
+
+
+def produce_suspended(compilable: Compilable, factory: TemplateFactory, factories: Dict[type, TemplateFactory],
+                      bundle: Dict) -> str:
+    """
+    This function produces a compilable with a factory of the stack machine. The locals are read from the stack while
+    the stack machine runs, the caller stores them beforehand and loads them afterwards.
+    :param compilable: the compilable.
+    :param factory: the factory of the stack machine.
+    :param factories: the template factories.
+    :param bundle: the compilation bundle.
+    :return: the assembly code.
+    """
+    if bundle.get("allocation") is not None:
+        bundle["allocation"].suspended += 1
+    try:
+        return factory.produce(compilable, factories, bundle)
+    finally:
+        if bundle.get("allocation") is not None:
+            bundle["allocation"].suspended -= 1
+
+
+def emit_body(scopeable: Scopeable, factories: Dict[type, TemplateFactory], bundle: Dict, emitter: Emitter) -> None:
+    """
+    This function emits the statements of a scope.
+    :param scopeable: the scope.
+    :param factories: the template factories.
+    :param bundle: the compilation bundle.
+    :param emitter: the emitter to append the assembly code to.
+    :return: None.
+    """
+    for statement in scopeable.body:
+        if isinstance(statement, VariableDeclaration):
+            continue
+        if bundle.get("allocation") is not None:
+            bundle["position"] = bundle["allocation"].positions[id(statement)]
+        factory = factories[type(statement)]
+        if isinstance(factory, RegisterTemplateFactory):
+            factory.emit_statement(statement, factories, bundle, emitter)
+            continue
+        active = get_active_locals(bundle)
+        emitter.emit("".join(f"mov {location}, {register}\n" for register, location in active))
+        emitter.emit(produce_suspended(statement, factory, factories, bundle))
+        emitter.emit("".join(f"mov {register}, {location}\n" for register, location in active))
+
+
+def produce_operands(first: Compilable, second: Compilable, factories: Dict[type, TemplateFactory], bundle: Dict,
+                     read_only: bool = True, address: bool = False) -> Tuple[str, str, str, str]:
+    """
+    This function produces the operands of a binary operation, in the order they are evaluated.
+    The first operand is only read by the operation, so a local that is in a register is used in place. If no register
+    is left for the second operand, the first operand is spilled to the stack.
+    :param first: the operand that is evaluated first.
+    :param second: the operand that is evaluated second, the result of the operation is stored in its register.
+    :param factories: the template factories.
+    :param bundle: the compilation bundle.
+    :param read_only: whether a local register can be used as the first operand.
+    :param address: whether an indexer that is the second operand produces the address of its cell.
+    :return: tuple of the assembly code, the location of the first operand, the register of the second operand, and
+    the assembly code that releases the spilled operand.
+    """
+    pool = bundle["registers"]
+    first_register = get_local_register(first.name, bundle) if read_only and type(first) is Variable else None
+    if first_register is not None:
+        assembly = ""
+    else:
+        assembly, first_register = produce_operand(first, factories, bundle)
+    cleanup = ""
+    if first_register in pool.held and not pool.has_free():
+        assembly += f"push {first_register}\n"
+        pool.release(first_register)
+        first_register, cleanup = SPILLED, "add esp, 4\n"
+    second_assembly, second_register = produce_operand(second, factories, bundle, address)
+    return assembly + second_assembly, first_register, second_register, cleanup
+
+
+def save_registers(bundle: Dict) -> Tuple[str, str]:
+    """
+    This function saves the registers that are in use around code that changes all of the registers (a call).
+    :param bundle: the compilation bundle.
+    :return: tuple of the assembly code that saves the registers and the assembly code that restores them.
+    """
+    registers = list(bundle["registers"].held) + [register for register, _ in get_active_locals(bundle)]
+    return "".join(f"push {register}\n" for register in registers), \
+        "".join(f"pop {register}\n" for register in registers[::-1])
+
+
+class RegisterTemplateFactory(TemplateFactory):
+    """
+    Interface for the factories of the register allocating backend.
+    The value of an expression is produced into a register instead of being pushed to the stack, locals are kept in
+    the registers that the linear scan allocated to them.
+    """
+
+    def produce_value(self, obj: Compilable, factories: Dict[type, TemplateFactory], bundle: Dict) -> Tuple[str, str]:
+        """
+        This function produces assembly code that evaluates an expression into a temporary register. At least one
+        temporary register is free when it is called.
+        :param obj: the expression.
+        :param factories: the template factories.
+        :param bundle: a bundle of extra information to use.
+        :return: tuple of the assembly code and the register that holds the value, the caller releases it.
+        """
+        pass
+
+    def produce_statement(self, obj: Compilable, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
+        assembly, register = self.produce_value(obj, factories, bundle)
+        bundle["registers"].release(register)
+        return assembly
+
+    def produce_branch(self, obj: Compilable, factories: Dict[type, TemplateFactory], bundle: Dict, target: str,
+                       jump_if: bool) -> str:
+        assembly, register = self.produce_value(obj, factories, bundle)
+        bundle["registers"].release(register)
+        return assembly + (
+            f"test {register}, {register}\n"
+            f"{'jnz' if jump_if else 'jz'} loc_{target}\n"
+        )
+
+    def emit_statement(self, obj: Compilable, factories: Dict[type, TemplateFactory], bundle: Dict,
+                       emitter: Emitter) -> None:
+        emitter.emit(self.produce_statement(obj, factories, bundle))
+
+    def produce(self, obj: Compilable, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
+        """
+        This function produces the value of an expression on the stack, for the factories of the stack machine.
+        """
+        if bundle.get("registers") is None:
+            # Code outside of functions (initializers) has no register allocation, every register is a temporary.
+            bundle["registers"], bundle["allocation"] = RegisterPool(TEMPORARY_REGISTERS + LOCAL_REGISTERS), None
+            try:
+                return self.produce(obj, factories, bundle)
+            finally:
+                bundle["registers"] = None
+        assembly, register = self.produce_value(obj, factories, bundle)
+        bundle["registers"].release(register)
+        return assembly + f"push {register}\n"
+
+
+class RegisterStatementTemplateFactory(RegisterTemplateFactory):
+    """
+    Interface for the factories of statements that have no value.
+    The factories implement produce_statement, or emit_statement for statements that hold other statements.
+    """
+
+    def produce(self, obj: Compilable, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
+        emitter = Emitter()
+        self.emit(obj, factories, bundle, emitter)
+        return emitter.getvalue()
+
+    def produce_statement(self, obj: Compilable, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
+        emitter = Emitter()
+        self.emit_statement(obj, factories, bundle, emitter)
+        return emitter.getvalue()
+
+    def emit(self, obj: Compilable, factories: Dict[type, TemplateFactory], bundle: Dict, emitter: Emitter) -> None:
+        if bundle.get("registers") is None:
+            bundle["registers"], bundle["allocation"] = RegisterPool(TEMPORARY_REGISTERS + LOCAL_REGISTERS), None
+            try:
+                self.emit_statement(obj, factories, bundle, emitter)
+            finally:
+                bundle["registers"] = None
+            return
+        self.emit_statement(obj, factories, bundle, emitter)
+
+
+class DecimalConstantRegisterFactory(RegisterTemplateFactory):
+    def produce_value(self, decimal_value_expression: DecimalConstantValue, factories: Dict[type, TemplateFactory],
+                      bundle: Dict) -> Tuple[str, str]:
+        register = bundle["registers"].allocate()
+        return self.add_verbose(bundle) + f"mov {register}, {decimal_value_expression.value}\n", register
+
+    def produce_branch(self, decimal_value_expression: DecimalConstantValue, factories: Dict[type, TemplateFactory],
+                       bundle: Dict, target: str, jump_if: bool) -> str:
+        if (decimal_value_expression.evaluate() is not 0) is jump_if:
+            return self.add_verbose(bundle) + f"jmp loc_{target}\n"
+        return self.add_verbose(bundle)
+
+
+class VariableRegisterFactory(RegisterTemplateFactory):
+    def produce_value(self, variable_expression: Variable, factories: Dict[type, TemplateFactory],
+                      bundle: Dict) -> Tuple[str, str]:
+        assembly = self.add_verbose(bundle)
+        local_register = get_local_register(variable_expression.name, bundle)
+        register = bundle["registers"].allocate()
+        if local_register is not None:
+            assembly += f"mov {register}, {local_register}\n"
+        elif is_global_variable(variable_expression, bundle):
+            var_type = variable_expression.symbol.var_type
+            assembly += f"mov {register}, {get_memory_access_prefix(var_type, bundle['size_bundle'])} " \
+                        f"[{variable_expression.name}]\n"
+        elif variable_expression.name in bundle["offset_table"]:
+            assembly += f"mov {register}, {get_stack_location(variable_expression.name, bundle)}\n"
+        else:
+            raise Exception("Variable {0} has no storage".format(variable_expression.name))
+        return assembly, register
+
+
+class PointerVariableRegisterFactory(RegisterTemplateFactory):
+    def produce_value(self, variable_expression: PointerVariable, factories: Dict[type, TemplateFactory],
+                      bundle: Dict) -> Tuple[str, str]:
+        assembly = self.add_verbose(bundle)
+        register = bundle["registers"].allocate()
+        if is_global_variable(variable_expression, bundle):
+            assembly += f"mov {register}, {variable_expression.name}\n"
+        elif variable_expression.name in bundle["offset_table"]:
+            assembly += f"lea {register}, {get_stack_location(variable_expression.name, bundle)}\n"
+        else:
+            raise Exception("Variable {0} has no storage".format(variable_expression.name))
+        return assembly, register
+
+
+class AdditionRegisterFactory(RegisterTemplateFactory):
+    def produce_value(self, plus_expression: AdditionOperator, factories: Dict[type, TemplateFactory],
+                      bundle: Dict) -> Tuple[str, str]:
+        assembly, register = produce_chain(plus_expression, factories, bundle)
+        if assembly is not None:
+            return self.add_verbose(bundle) + assembly, register
+        assembly, register, value = produce_immediate_operation(plus_expression, factories, bundle, True)
+        if assembly is not None:
+            return self.add_verbose(bundle) + assembly + f"add {register}, {value}\n", register
+        assembly, right, left, cleanup = produce_operands(plus_expression.right, plus_expression.left, factories,
+                                                          bundle)
+        bundle["registers"].release(right)
+        return self.add_verbose(bundle) + assembly + f"add {left}, {right}\n" + cleanup, left
+
+
+class SubtractionRegisterFactory(RegisterTemplateFactory):
+    def produce_value(self, minus_expression: SubtractOperator, factories: Dict[type, TemplateFactory],
+                      bundle: Dict) -> Tuple[str, str]:
+        assembly, register = produce_chain(minus_expression, factories, bundle)
+        if assembly is not None:
+            return self.add_verbose(bundle) + assembly, register
+        assembly, register, value = produce_immediate_operation(minus_expression, factories, bundle, False)
+        if assembly is not None:
+            return self.add_verbose(bundle) + assembly + f"sub {register}, {value}\n", register
+        assembly, right, left, cleanup = produce_operands(minus_expression.right, minus_expression.left, factories,
+                                                          bundle)
+        bundle["registers"].release(right)
+        return self.add_verbose(bundle) + assembly + f"sub {left}, {right}\n" + cleanup, left
+
+
+class MultiplyRegisterFactory(RegisterTemplateFactory):
+    def produce_value(self, mult_expression: MultiplicationOperator, factories: Dict[type, TemplateFactory],
+                      bundle: Dict) -> Tuple[str, str]:
+        assembly, register = produce_chain(mult_expression, factories, bundle)
+        if assembly is not None:
+            return self.add_verbose(bundle) + assembly, register
+        assembly, register, value = produce_immediate_operation(mult_expression, factories, bundle, True)
+        if assembly is not None:
+            return self.add_verbose(bundle) + assembly + select_multiply(register, value), register
+        assembly, right, left, cleanup = produce_operands(mult_expression.right, mult_expression.left, factories,
+                                                          bundle)
+        bundle["registers"].release(right)
+        # The low half of the product is the same for signed and unsigned multiplication.
+        return self.add_verbose(bundle) + assembly + f"imul {left}, {right}\n" + cleanup, left
+
+
+class DivisionRegisterFactory(RegisterTemplateFactory):
+    def produce_value(self, div_expression: DivisionOperator, factories: Dict[type, TemplateFactory],
+                      bundle: Dict) -> Tuple[str, str]:
+        value = get_immediate(div_expression.right)
+        if value is not None and get_shift(value) is not None:
+            assembly, register = produce_operand(div_expression.left, factories, bundle)
+            return self.add_verbose(bundle) + assembly + select_divide(register, value), register
+        assembly, right, left, cleanup = produce_operands(div_expression.right, div_expression.left, factories,
+                                                          bundle)
+        # div uses eax and edx, the temporaries that are held in them are saved.
+        saved = [register for register in ("eax", "edx")
+                 if register in bundle["registers"].held and register not in (left, right)]
+        assembly += f"push {right}\n"
+        assembly += "".join(f"push {register}\n" for register in saved)
+        assembly += f"mov eax, {left}\n" if left != "eax" else ""
+        assembly += (
+            "xor edx, edx\n"
+            f"div DWORD [esp + {4 * len(saved)}]\n"
+        )
+        assembly += f"mov {left}, eax\n" if left != "eax" else ""
+        assembly += "".join(f"pop {register}\n" for register in saved[::-1])
+        assembly += "add esp, 4\n" + cleanup
+        bundle["registers"].release(right)
+        return self.add_verbose(bundle) + assembly, left
+
+
+class LogicalEqualRegisterFactory(RegisterTemplateFactory):
+    def produce_value(self, equal_expression: Equal, factories: Dict[type, TemplateFactory],
+                      bundle: Dict) -> Tuple[str, str]:
+        not_equal = get_unique_id(bundle, "notequal")
+        assembly, left, right, cleanup = produce_operands(equal_expression.left, equal_expression.right, factories,
+                                                          bundle)
+        bundle["registers"].release(left)
+        return self.add_verbose(bundle) + assembly + (
+            f"cmp {left}, {right}\n"
+            f"mov {right}, 0\n"
+            f"jne loc_{not_equal}\n"
+            f"mov {right}, 1\n"
+            f"loc_{not_equal}:\n"
+        ) + cleanup, right
+
+    def produce_branch(self, equal_expression: Equal, factories: Dict[type, TemplateFactory], bundle: Dict,
+                       target: str, jump_if: bool) -> str:
+        return self.add_verbose(bundle) + produce_comparison(equal_expression.left, equal_expression.right, factories,
+                                                             bundle, "je" if jump_if else "jne", target)
+
+
+class LogicalGreaterRegisterFactory(RegisterTemplateFactory):
+    def produce_value(self, greater_expression: LogicalGreater, factories: Dict[type, TemplateFactory],
+                      bundle: Dict) -> Tuple[str, str]:
+        not_greater = get_unique_id(bundle, "notgreater")
+        assembly, left, right, cleanup = produce_operands(greater_expression.left, greater_expression.right,
+                                                          factories, bundle)
+        bundle["registers"].release(left)
+        return self.add_verbose(bundle) + assembly + (
+            f"cmp {left}, {right}\n"
+            f"mov {right}, 0\n"
+            f"jbe loc_{not_greater}\n"
+            f"mov {right}, 1\n"
+            f"loc_{not_greater}:\n"
+        ) + cleanup, right
+
+    def produce_branch(self, greater_expression: LogicalGreater, factories: Dict[type, TemplateFactory], bundle: Dict,
+                       target: str, jump_if: bool) -> str:
+        return self.add_verbose(bundle) + produce_comparison(greater_expression.left, greater_expression.right,
+                                                             factories, bundle, "ja" if jump_if else "jbe", target)
+
+
+class LogicalAndRegisterFactory(RegisterTemplateFactory):
+    def produce_value(self, and_expression: LogicalAnd, factories: Dict[type, TemplateFactory],
+                      bundle: Dict) -> Tuple[str, str]:
+        end = get_unique_id(bundle, "and")
+        assembly, left, right, cleanup = produce_operands(and_expression.left, and_expression.right, factories,
+                                                          bundle)
+        bundle["registers"].release(left)
+        return self.add_verbose(bundle) + assembly + (
+            f"test {right}, {right}\n"
+            f"mov {right}, 0\n"
+            f"jz loc_{end}\n"
+            f"cmp {left}, 0\n"
+            f"jz loc_{end}\n"
+            f"mov {right}, 1\n"
+            f"loc_{end}:\n"
+        ) + cleanup, right
+
+    def produce_branch(self, and_expression: LogicalAnd, factories: Dict[type, TemplateFactory], bundle: Dict,
+                       target: str, jump_if: bool) -> str:
+        left, right = and_expression.left, and_expression.right
+        if not jump_if:
+            return self.add_verbose(bundle) + produce_branch(left, factories, bundle, target, False) + \
+                produce_branch(right, factories, bundle, target, False)
+        # The right operand is skipped when the left operand is false.
+        end = get_unique_id(bundle, "and")
+        return self.add_verbose(bundle) + produce_branch(left, factories, bundle, end, False) + \
+            produce_branch(right, factories, bundle, target, True) + f"loc_{end}:\n"
+
+
+class LogicalOrRegisterFactory(RegisterTemplateFactory):
+    def produce_value(self, or_expression: LogicalOr, factories: Dict[type, TemplateFactory],
+                      bundle: Dict) -> Tuple[str, str]:
+        end = get_unique_id(bundle, "or")
+        assembly, left, right, cleanup = produce_operands(or_expression.left, or_expression.right, factories,
+                                                          bundle)
+        bundle["registers"].release(left)
+        return self.add_verbose(bundle) + assembly + (
+            f"test {right}, {right}\n"
+            f"mov {right}, 1\n"
+            f"jnz loc_{end}\n"
+            f"cmp {left}, 0\n"
+            f"jnz loc_{end}\n"
+            f"mov {right}, 0\n"
+            f"loc_{end}:\n"
+        ) + cleanup, right
+
+    def produce_branch(self, or_expression: LogicalOr, factories: Dict[type, TemplateFactory], bundle: Dict,
+                       target: str, jump_if: bool) -> str:
+        left, right = or_expression.left, or_expression.right
+        if jump_if:
+            return self.add_verbose(bundle) + produce_branch(left, factories, bundle, target, True) + \
+                produce_branch(right, factories, bundle, target, True)
+        # The right operand is skipped when the left operand is true.
+        end = get_unique_id(bundle, "or")
+        return self.add_verbose(bundle) + produce_branch(left, factories, bundle, end, True) + \
+            produce_branch(right, factories, bundle, target, False) + f"loc_{end}:\n"
+
+
+class ArrayIndexerRegisterFactory(RegisterTemplateFactory):
+    def produce_value(self, indexer_expression: ArrayIndexer, factories: Dict[type, TemplateFactory],
+                      bundle: Dict) -> Tuple[str, str]:
+        assembly, register = self.produce_address(indexer_expression, factories, bundle)
+        if is_array_element(indexer_expression):
+            assembly += f"mov {register}, [{register}]\n"
+        return assembly, register
+
+    def produce_address(self, indexer_expression: ArrayIndexer, factories: Dict[type, TemplateFactory],
+                        bundle: Dict) -> Tuple[str, str]:
+        """
+        This function produces the address of the cell of an indexer, that is assigned to or indexed again.
+        :param indexer_expression: the indexer.
+        :param factories: the template factories.
+        :param bundle: the compilation bundle.
+        :return: tuple of the assembly code and the register that holds the address.
+        """
+        checked = needs_bounds_check(indexer_expression, bundle)
+        passed_boundary_check = get_unique_id(bundle, "inbounds") if checked else None
+        assembly, index, address, cleanup = produce_operands(indexer_expression.right, indexer_expression.left,
+                                                             factories, bundle, read_only=False, address=True)
+        assembly = self.add_verbose(bundle) + assembly
+        header = get_array_header(indexer_expression, bundle)
+        if header is not None and index != SPILLED:
+            # The size of the array and of its cells are immediates, the header is not read.
+            bundle["registers"].release(index)
+            if checked:
+                assembly += select_bounds_check(index, header["array_size"], passed_boundary_check)
+            return assembly + select_scaled_address(address, index, header["cell_size"], 8), address
+        if index == SPILLED:
+            # Only the register of the address is left, the index is read from the stack.
+            assembly += f"push {address}\n"
+            if checked:
+                assembly += f"mov {address}, [{address}]\n" + \
+                            select_bounds_check("[esp + 4]", address, passed_boundary_check) + \
+                            f"mov {address}, [esp]\n"
+            return assembly + (
+                f"mov {address}, [{address} + 4]\n"
+                f"imul {address}, [esp + 4]\n"
+                f"add {address}, [esp]\n"
+                f"add {address}, 8\n"
+                "add esp, 4\n"
+            ) + cleanup, address
+        bundle["registers"].release(index)
+        if checked:
+            # Check if index is off bounds
+            assembly += select_bounds_check(index, f"[{address}]", passed_boundary_check)
+        return assembly + (
+            f"imul {index}, [{address} + 4]\n"
+            f"lea {address}, [{address} + {index} + 8]\n"
+        ), address
+
+
+class FunctionCallRegisterFactory(RegisterTemplateFactory):
+    def produce_value(self, function_call: FunctionCall, factories: Dict[type, TemplateFactory],
+                      bundle: Dict) -> Tuple[str, str]:
+        save, restore = save_registers(bundle)
+        assembly = self.add_verbose(bundle) + save
+        for arg in function_call.arguments[::-1]:
+            arg_assembly, register = produce_operand(arg, factories, bundle)
+            bundle["registers"].release(register)
+            assembly += arg_assembly + f"push {register}\n"
+        f_name = function_call.name
+        if function_call.symbol.scope is bundle["program"].scope:
+            f_name = bundle["program"].name + "_" + f_name
+        assembly += f"call {f_name}\n"
+        if len(function_call.arguments) is not 0:
+            assembly += f"add esp, {len(function_call.arguments) * 4}\n"
+        register = bundle["registers"].allocate()
+        assembly += f"mov {register}, eax\n" if register != "eax" else ""
+        return assembly + restore, register
+
+
+class AssignmentRegisterFactory(RegisterStatementTemplateFactory):
+    def produce_statement(self, assigment_expression: Assignment, factories: Dict[type, TemplateFactory],
+                          bundle: Dict) -> str:
+        assembly = self.add_verbose(bundle)
+        left = assigment_expression.left
+        if not isinstance(left, Variable):
+            operands_assembly, value, address, cleanup = produce_operands(assigment_expression.right, left,
+                                                                          factories, bundle, address=True)
+            assembly += operands_assembly
+            # A spilled value is popped straight into its destination.
+            assembly += f"pop DWORD [{address}]\n" if value == SPILLED else f"mov [{address}], {value}\n"
+            bundle["registers"].release(value)
+            bundle["registers"].release(address)
+            return assembly
+        value_assembly, value = produce_operand(assigment_expression.right, factories, bundle)
+        assembly += value_assembly
+        local_register = get_local_register(left.name, bundle)
+        if local_register is not None:
+            assembly += f"mov {local_register}, {value}\n"
+        elif is_global_variable(left, bundle):
+            assembly += f"mov {get_memory_access_prefix(left.symbol.var_type, bundle['size_bundle'])} " \
+                        f"[{left.name}], {value}\n"
+        else:
+            assembly += f"mov {get_stack_location(left.name, bundle)}, {value}\n"
+        bundle["registers"].release(value)
+        return assembly
+
+
+class ReturnRegisterFactory(RegisterStatementTemplateFactory):
+    def produce_statement(self, return_expression: Return, factories: Dict[type, TemplateFactory],
+                          bundle: Dict) -> str:
+        assembly, register = produce_operand(return_expression.expression, factories, bundle)
+        bundle["registers"].release(register)
+        assembly = self.add_verbose(bundle) + assembly
+        assembly += f"mov eax, {register}\n" if register != "eax" else ""
+        return assembly + (
+            "leave\n"
+            "ret\n"
+        )
+
+
+class IfRegisterFactory(RegisterStatementTemplateFactory):
+    def emit_statement(self, if_expression: If, factories: Dict[type, TemplateFactory], bundle: Dict,
+                       emitter: Emitter) -> None:
+        skip_if_id = get_unique_id(bundle, "endif")
+        prev_scope = bundle["scope"]
+        bundle["scope"] = if_expression.scope
+        emitter.emit(self.add_verbose(bundle))
+        always_taken = is_always_taken(if_expression.condition)
+        if not always_taken and bundle.get("branch_conditions"):
+            emitter.emit(produce_branch(if_expression.condition, factories, bundle, skip_if_id, False))
+        elif not always_taken:
+            condition_assembly, condition = produce_operand(if_expression.condition, factories, bundle)
+            bundle["registers"].release(condition)
+            emitter.emit(condition_assembly + (
+                f"test {condition}, {condition}\n"
+                f"jz loc_{skip_if_id}\n"
+            ))
+        emit_body(if_expression, factories, bundle, emitter)
+        if not always_taken:
+            emitter.emit(f"loc_{skip_if_id}:\n")
+        bundle["scope"] = prev_scope
+
+
+class WhileRegisterFactory(RegisterStatementTemplateFactory):
+    def emit_statement(self, while_expression: While, factories: Dict[type, TemplateFactory], bundle: Dict,
+                       emitter: Emitter) -> None:
+        loop_start = get_unique_id(bundle, "while")
+        prev_scope = bundle["scope"]
+        bundle["scope"] = while_expression.scope
+        if bundle.get("branch_conditions") and not is_always_taken(while_expression.condition):
+            # The condition is tested after the body, so every iteration jumps once, back to the start of the loop.
+            loop_condition = get_unique_id(bundle, "whilecondition")
+            position = bundle.get("position")
+            emitter.emit(
+                f"{self.add_verbose(bundle)}"
+                f"jmp loc_{loop_condition}\n"
+                f"loc_{loop_start}:\n"
+            )
+            emit_body(while_expression, factories, bundle, emitter)
+            # The locals of the condition are in the registers they are in at the while statement.
+            bundle["position"] = position
+            emitter.emit(f"loc_{loop_condition}:\n" +
+                         produce_branch(while_expression.condition, factories, bundle, loop_start, True))
+            bundle["scope"] = prev_scope
+            return
+        loop_end = get_unique_id(bundle, "endwhile")
+        emitter.emit(
+            f"{self.add_verbose(bundle)}"
+            f"loc_{loop_start}:\n"
+        )
+        if not is_always_taken(while_expression.condition):
+            condition_assembly, condition = produce_operand(while_expression.condition, factories, bundle)
+            bundle["registers"].release(condition)
+            emitter.emit(condition_assembly + (
+                f"test {condition}, {condition}\n"
+                f"jz loc_{loop_end}\n"
+            ))
+        emit_body(while_expression, factories, bundle, emitter)
+        emitter.emit(
+            f"jmp loc_{loop_start}\n"
+            f"loc_{loop_end}:\n"
+        )
+        bundle["scope"] = prev_scope
+
+
+class FunctionRegisterFactory(RegisterStatementTemplateFactory):
+    def emit_statement(self, function: Function, factories: Dict[type, TemplateFactory], bundle: Dict,
+                       emitter: Emitter) -> None:
+        prev_scope = bundle["scope"]
+        bundle["scope"] = function.scope
+        get_label_allocator(bundle).enter(function.name)
+        if bundle.get("bounds_checks") is not False:
+            bundle["in_bounds"] = RangeAnalysis(bundle).find_in_bounds(function)
+        allocation = allocate_registers(function, bundle["offset_table"], bundle["size_bundle"])
+        # The local registers that no local was allocated are used for temporaries.
+        temporaries = TEMPORARY_REGISTERS + tuple(register for register in LOCAL_REGISTERS
+                                                  if register not in allocation.get_used_registers())
+        stack_allocation_line = f"sub esp, {bundle['stack_size']}\n" if bundle["stack_size"] is not 0 else ""
+        emitter.emit(f"{self.add_verbose(bundle)}"
+                     f"{function.name}:\n"
+                     "push ebp\n"
+                     "mov ebp, esp\n"
+                     f"{stack_allocation_line}")
+        bundle["allocation"], bundle["registers"], bundle["position"] = allocation, RegisterPool(temporaries), 0
+        emit_body(function, factories, bundle, emitter)
+        bundle["allocation"], bundle["registers"] = None, None
+        if not any(isinstance(statement, Return) for statement in function.body):
+            emitter.emit(
+                "leave\n"
+                "ret\n"
+            )
+        bundle["scope"] = prev_scope
@@ -1,10 +1,16 @@
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 from compilation.models.values import *
 from compilation.models.keywords import *
 from compilation.models.operators import *
-from compilation.IA32.utils import get_unique_id, produce_offset_table, produce_class_member_offset_table, \
-    unpack_dot_operator, get_memory_access_prefix
+from compilation.IA32.utils import get_unique_id, produce_offset_table, \
+    unpack_dot_operator, get_memory_access_prefix, is_global_variable, is_always_taken, get_label_allocator, \
+    get_layout_engine
 from compilation.models.arrays import ArrayInitializer
+from compilation.IA32.emitter import Emitter
+from compilation.IA32.context import FunctionContext
+from compilation.IA32.instruction_selection import get_immediate, select_multiply, select_divide, \
+    select_scaled_address, get_array_header, is_array_element, select_bounds_check, SWAPPED_JUMPS
+from compilation.IA32.range_analysis import RangeAnalysis, needs_bounds_check
 
 
 class TemplateFactory:
@@ -22,15 +28,72 @@ class TemplateFactory:
         """
         pass
 
+    def emit(self, object: Compilable, factories: Dict[type, "TemplateFactory"], bundle: Dict,
+             emitter: Emitter) -> None:
+        """
+        This function appends the assembly code of a compilable model to an emitter. Factories of models that hold
+        statements override it, so that the code of the statements is not copied into the code of the model.
+        :param object: the object to assemble.
+        :param factories: the factories of the other compilabe objects.
+        :param bundle: a bundle of extra information to use.
+        :param emitter: the emitter to append the assembly code to.
+        :return: None.
+        """
+        emitter.emit(self.produce(object, factories, bundle))
+
+    def produce_branch(self, object: Compilable, factories: Dict[type, "TemplateFactory"], bundle: Dict, target: str,
+                       jump_if: bool) -> str:
+        """
+        This function produces assembly code that jumps on the truth value of a condition, instead of pushing it.
+        Factories of comparisons and logical operators override it, to jump on the flags of their comparisons.
+        :param object: the condition.
+        :param factories: the factories of the other compilabe objects.
+        :param bundle: a bundle of extra information to use.
+        :param target: the id of the label to jump to.
+        :param jump_if: the truth value of the condition that jumps, the code falls through on the other one.
+        :return: assembly code.
+        """
+        return (
+            f"{self.produce(object, factories, bundle)}"
+            "pop eax\n"
+            "test eax, eax\n"
+            f"{'jnz' if jump_if else 'jz'} loc_{target}\n"
+        )
+
     def add_verbose(self, bundle):
         if bundle["verbose"]:
             return f";{type(self).__name__}\n"
         return ""
 
 
+def produce_immediate_comparison(first: Compilable, second: Compilable, factories: Dict[type, TemplateFactory],
+                                 bundle: Dict, jump: str, target: str) -> Optional[str]:
+    """
+    This function produces a comparison of an operand with a constant, and a jump on its result.
+    :param first: the left operand of the comparison.
+    :param second: the right operand of the comparison.
+    :param factories: the template factories.
+    :param bundle: the compilation bundle.
+    :param jump: the conditional jump instruction, for the operands in their order.
+    :param target: the id of the label to jump to.
+    :return: the assembly code, None if neither operand is a constant.
+    """
+    value = get_immediate(second)
+    if value is None:
+        value, first, jump = get_immediate(first), second, SWAPPED_JUMPS[jump]
+    if value is None:
+        return None
+    return (
+        f"{factories[type(first)].produce(first, factories, bundle)}"
+        "pop eax\n"
+        f"cmp eax, {value}\n"
+        f"{jump} loc_{target}\n"
+    )
+
+
 class LogicalAndTemplateFactory(TemplateFactory):
     def produce(self, and_expression: LogicalAnd, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
-        end = get_unique_id()
+        end = get_unique_id(bundle, "and")
         assembly = self.add_verbose(bundle)
         assembly += (
             f"{factories[type(and_expression.left)].produce(and_expression.left, factories, bundle)}"
@@ -48,11 +111,23 @@ class LogicalAndTemplateFactory(TemplateFactory):
         )
         return assembly
 
+    def produce_branch(self, and_expression: LogicalAnd, factories: Dict[type, TemplateFactory], bundle: Dict,
+                       target: str, jump_if: bool) -> str:
+        left, right = and_expression.left, and_expression.right
+        assembly = self.add_verbose(bundle)
+        if not jump_if:
+            return assembly + factories[type(left)].produce_branch(left, factories, bundle, target, False) + \
+                factories[type(right)].produce_branch(right, factories, bundle, target, False)
+        # The right operand is skipped when the left operand is false.
+        end = get_unique_id(bundle, "and")
+        return assembly + factories[type(left)].produce_branch(left, factories, bundle, end, False) + \
+            factories[type(right)].produce_branch(right, factories, bundle, target, True) + f"loc_{end}:\n"
+
 
 class LogicalOrTemplateFactory(TemplateFactory):
     def produce(self, or_expression: LogicalOr, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
-        valid = get_unique_id()
-        invalid = get_unique_id()
+        valid = get_unique_id(bundle, "ortrue")
+        invalid = get_unique_id(bundle, "orfalse")
         assembly = self.add_verbose(bundle)
         assembly += (
             f"{factories[type(or_expression.left)].produce(or_expression.left, factories, bundle)}"
@@ -72,10 +147,22 @@ class LogicalOrTemplateFactory(TemplateFactory):
         )
         return assembly
 
+    def produce_branch(self, or_expression: LogicalOr, factories: Dict[type, TemplateFactory], bundle: Dict,
+                       target: str, jump_if: bool) -> str:
+        left, right = or_expression.left, or_expression.right
+        assembly = self.add_verbose(bundle)
+        if jump_if:
+            return assembly + factories[type(left)].produce_branch(left, factories, bundle, target, True) + \
+                factories[type(right)].produce_branch(right, factories, bundle, target, True)
+        # The right operand is skipped when the left operand is true.
+        end = get_unique_id(bundle, "or")
+        return assembly + factories[type(left)].produce_branch(left, factories, bundle, end, True) + \
+            factories[type(right)].produce_branch(right, factories, bundle, target, False) + f"loc_{end}:\n"
+
 
 class LogicalGreaterTemplateFactory(TemplateFactory):
     def produce(self, greater_expression: LogicalGreater, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
-        not_greater = get_unique_id()
+        not_greater = get_unique_id(bundle, "notgreater")
         assembly = self.add_verbose(bundle)
         assembly += (
             f"{factories[type(greater_expression.left)].produce(greater_expression.left, factories, bundle)}"
@@ -91,10 +178,27 @@ class LogicalGreaterTemplateFactory(TemplateFactory):
         )
         return assembly
 
+    def produce_branch(self, greater_expression: LogicalGreater, factories: Dict[type, TemplateFactory], bundle: Dict,
+                       target: str, jump_if: bool) -> str:
+        jump = "ja" if jump_if else "jbe"
+        immediate_branch = produce_immediate_comparison(greater_expression.left, greater_expression.right, factories,
+                                                        bundle, jump, target)
+        if immediate_branch is not None:
+            return self.add_verbose(bundle) + immediate_branch
+        return (
+            f"{self.add_verbose(bundle)}"
+            f"{factories[type(greater_expression.left)].produce(greater_expression.left, factories, bundle)}"
+            f"{factories[type(greater_expression.right)].produce(greater_expression.right, factories, bundle)}"
+            "pop ebx\n"
+            "pop eax\n"
+            "cmp eax, ebx\n"
+            f"{jump} loc_{target}\n"
+        )
+
 
 class LogicalEqualTemplateFactory(TemplateFactory):
     def produce(self, equal_expression: Equal, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
-        not_equal = get_unique_id()
+        not_equal = get_unique_id(bundle, "notequal")
         assembly = self.add_verbose(bundle)
         assembly += (
             f"{factories[type(equal_expression.left)].produce(equal_expression.left, factories, bundle)}"
@@ -110,6 +214,23 @@ class LogicalEqualTemplateFactory(TemplateFactory):
         )
         return assembly
 
+    def produce_branch(self, equal_expression: Equal, factories: Dict[type, TemplateFactory], bundle: Dict,
+                       target: str, jump_if: bool) -> str:
+        jump = "je" if jump_if else "jne"
+        immediate_branch = produce_immediate_comparison(equal_expression.left, equal_expression.right, factories,
+                                                        bundle, jump, target)
+        if immediate_branch is not None:
+            return self.add_verbose(bundle) + immediate_branch
+        return (
+            f"{self.add_verbose(bundle)}"
+            f"{factories[type(equal_expression.left)].produce(equal_expression.left, factories, bundle)}"
+            f"{factories[type(equal_expression.right)].produce(equal_expression.right, factories, bundle)}"
+            "pop eax\n"
+            "pop ebx\n"
+            "cmp eax, ebx\n"
+            f"{jump} loc_{target}\n"
+        )
+
 
 class FunctionCallTemplateFactory(TemplateFactory):
     def produce(self, function_call: FunctionCall, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
@@ -123,7 +244,7 @@ class FunctionCallTemplateFactory(TemplateFactory):
             arguments_size=len(function_call.arguments) * 4) if len(function_call.arguments) is not 0 else ""
         assembly = self.add_verbose(bundle)
         f_name = function_call.name
-        if bundle["scope"].search_function_scope(f_name).name == bundle["program"].name:
+        if function_call.symbol.scope is bundle["program"].scope:
             f_name = bundle["program"].name + "_" + f_name
 
         assembly += ("{argument_preparation}"
@@ -154,38 +275,49 @@ class ReturnTemplateFactory(TemplateFactory):
 
 class FunctionTemplateFactory(TemplateFactory):
     def produce(self, function: Function, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
+        emitter = Emitter()
+        self.emit(function, factories, bundle, emitter)
+        return emitter.getvalue()
+
+    def emit(self, function: Function, factories: Dict[type, TemplateFactory], bundle: Dict,
+             emitter: Emitter) -> None:
         prev_scope = bundle["scope"]
         bundle["scope"] = function.scope
-        body_assembly = ""
+        get_label_allocator(bundle).enter(function.name)
+        if bundle.get("bounds_checks") is not False:
+            bundle["in_bounds"] = RangeAnalysis(bundle).find_in_bounds(function)
+        stack_allocation_line = "sub esp, {stack_size}\n".format(stack_size=bundle["stack_size"]) \
+            if bundle["stack_size"] is not 0 else ""
+        emitter.emit((f"{self.add_verbose(bundle)}"
+                      "{name}:\n"
+                      "push ebp\n"
+                      "mov ebp, esp\n"
+                      "{stack_allocation_line}").format(name=function.name,
+                                                        stack_allocation_line=stack_allocation_line))
         has_ret = False
         for expression in function.body:
             if isinstance(expression, Return):
                 has_ret = True
             if not isinstance(expression, VariableDeclaration):
-                body_assembly += factories[type(expression)].produce(expression, factories, bundle)
-        stack_allocation_line = "sub esp, {stack_size}\n".format(stack_size=bundle["stack_size"]) \
-            if bundle["stack_size"] is not 0 else ""
-        function_assembly = (f"{self.add_verbose(bundle)}"
-                             "{name}:\n"
-                             "push ebp\n"
-                             "mov ebp, esp\n"
-                             "{stack_allocation_line}"
-                             "{function_body}").format(
-            name=function.name, stack_allocation_line=stack_allocation_line,
-            function_body=body_assembly)
+                factories[type(expression)].emit(expression, factories, bundle, emitter)
         if not has_ret:
-            function_assembly += (
+            emitter.emit(
                 "leave\n"
                 "ret\n"
             )
         bundle["scope"] = prev_scope
-        return function_assembly
 
 
 class MultiplyTemplateFactory(TemplateFactory):
     def produce(self, mult_expression: MultiplicationOperator, factories: Dict[type, TemplateFactory],
                 bundle: Dict) -> str:
         assembly = self.add_verbose(bundle)
+        value, operand = get_immediate(mult_expression.right), mult_expression.left
+        if value is None:
+            value, operand = get_immediate(mult_expression.left), mult_expression.right
+        if value is not None:
+            return assembly + factories[type(operand)].produce(operand, factories, bundle) + "pop eax\n" + \
+                select_multiply("eax", value) + "push eax\n"
         assembly += factories[type(mult_expression.right)].produce(mult_expression.right, factories, bundle) \
                     + factories[type(mult_expression.left)].produce(mult_expression.left, factories, bundle)
         assembly += (
@@ -201,6 +333,15 @@ class MultiplyTemplateFactory(TemplateFactory):
 class AdditionTemplateFactory(TemplateFactory):
     def produce(self, plus_expression: AdditionOperator, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
         assembly = self.add_verbose(bundle)
+        value, operand = get_immediate(plus_expression.right), plus_expression.left
+        if value is None:
+            value, operand = get_immediate(plus_expression.left), plus_expression.right
+        if value is not None:
+            return assembly + factories[type(operand)].produce(operand, factories, bundle) + (
+                "pop eax\n"
+                f"add eax, {value}\n"
+                "push eax\n"
+            )
         assembly += factories[type(plus_expression.right)].produce(plus_expression.right, factories, bundle) \
                     + factories[type(plus_expression.left)].produce(plus_expression.left, factories, bundle)
         assembly += (
@@ -215,6 +356,14 @@ class AdditionTemplateFactory(TemplateFactory):
 class SubtractionTemplateFactory(TemplateFactory):
     def produce(self, minus_expression: SubtractOperator, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
         assembly = self.add_verbose(bundle)
+        value = get_immediate(minus_expression.right)
+        if value is not None:
+            return assembly + factories[type(minus_expression.left)].produce(minus_expression.left, factories,
+                                                                             bundle) + (
+                "pop eax\n"
+                f"sub eax, {value}\n"
+                "push eax\n"
+            )
         assembly += factories[type(minus_expression.right)].produce(minus_expression.right, factories, bundle) \
                     + factories[type(minus_expression.left)].produce(minus_expression.left, factories, bundle)
         assembly += (
@@ -229,6 +378,19 @@ class SubtractionTemplateFactory(TemplateFactory):
 class DivisionTemplateFactory(TemplateFactory):
     def produce(self, div_expression: DivisionOperator, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
         assembly = self.add_verbose(bundle)
+        value = get_immediate(div_expression.right)
+        if value is not None and value is not 0:
+            left = factories[type(div_expression.left)].produce(div_expression.left, factories, bundle)
+            shift = select_divide("eax", value)
+            if shift is not None:
+                return assembly + left + "pop eax\n" + shift + "push eax\n"
+            return assembly + left + (
+                "pop eax\n"
+                f"mov ecx, {value}\n"
+                "xor edx, edx\n"
+                "div ecx\n"
+                "push eax\n"
+            )
         assembly += factories[type(div_expression.right)].produce(div_expression.right, factories, bundle) \
                     + factories[type(div_expression.left)].produce(div_expression.left, factories, bundle)
         assembly += (
@@ -241,22 +403,36 @@ class DivisionTemplateFactory(TemplateFactory):
         return assembly
 
 
+def produce_array_address(expression: Compilable, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
+    """
+    This function produces the address of an expression that is assigned to or indexed, indexers produce the address of
+    their cell instead of its value.
+    :param expression: the expression.
+    :param factories: the template factories.
+    :param bundle: the compilation bundle.
+    :return: the assembly code, that pushes the address.
+    """
+    if isinstance(expression, ArrayIndexer):
+        return factories[ArrayIndexer].produce_address(expression, factories, bundle)
+    return factories[type(expression)].produce(expression, factories, bundle)
+
+
 class AssignmentTemplateFactory(TemplateFactory):
     def produce(self, assigment_expression: Assignment, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
         assembly = self.add_verbose(bundle)
         assembly += factories[type(assigment_expression.right)].produce(assigment_expression.right, factories, bundle)
         if assigment_expression.left.has_ptr_type():
             assembly += (
-                f"{factories[type(assigment_expression.left)].produce(assigment_expression.left, factories, bundle)}"
+                f"{produce_array_address(assigment_expression.left, factories, bundle)}"
                 "pop edi\n"
                 "pop eax\n"
                 "mov [edi], eax\n"
             )
-        elif assigment_expression.left.name in bundle["program"].variables.keys():
+        elif is_global_variable(assigment_expression.left, bundle):
             assembly += (
                 f"mov edi, {assigment_expression.left.name}\n"
                 "pop eax\n"
-                f"mov {get_memory_access_prefix(bundle['program'].variables[assigment_expression.left.name], bundle['size_bundle'])} [edi], eax\n"
+                f"mov {get_memory_access_prefix(assigment_expression.left.symbol.var_type, bundle['size_bundle'])} [edi], eax\n"
             )
         elif assigment_expression.left.name in bundle["offset_table"] \
                 and bundle["offset_table"][assigment_expression.left.name] > 0:
@@ -283,12 +459,24 @@ class DecimalConstantTemplateFactory(TemplateFactory):
         )
         return assembly
 
+    def produce_branch(self, decimal_value_expression: DecimalConstantValue, factories: Dict[type, TemplateFactory],
+                       bundle: Dict, target: str, jump_if: bool) -> str:
+        if (decimal_value_expression.evaluate() is not 0) is jump_if:
+            return self.add_verbose(bundle) + f"jmp loc_{target}\n"
+        return self.add_verbose(bundle)
+
 
 class VariableTemplateFactory(TemplateFactory):
     def produce(self, variable_expression: Variable, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
         assembly = self.add_verbose(bundle)
 
-        if variable_expression.name in bundle["offset_table"] and bundle["offset_table"][variable_expression.name] > 0:
+        if is_global_variable(variable_expression, bundle):
+            var_type = variable_expression.symbol.var_type
+            assembly += (
+                f"mov edi, {get_memory_access_prefix(var_type, bundle['size_bundle'])} [{variable_expression.name}]\n"
+                "push edi\n"
+            )
+        elif variable_expression.name in bundle["offset_table"] and bundle["offset_table"][variable_expression.name] > 0:
             assembly += (
                 "lea edi, [ebp + {var_offset}]\n"
                 "mov edi, [edi]\n"
@@ -301,68 +489,94 @@ class VariableTemplateFactory(TemplateFactory):
                 "mov edi, [edi]\n"
                 "push edi\n".format(var_offset=-bundle["offset_table"][variable_expression.name])
             )
-        elif variable_expression.name in bundle["program"].variables:
-            var_type = bundle["program"].scope.defined_variables[variable_expression.name]["type"]
-            assembly += (
-                f"mov edi, {get_memory_access_prefix(var_type, bundle['size_bundle'])} [{variable_expression.name}]\n"
-                "push edi\n"
-            )
         return assembly
 
 
 class IfTemplateFactory(TemplateFactory):
     def produce(self, if_expression: If, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
-        skip_if_id = get_unique_id()
-        body_assembly = ""
+        emitter = Emitter()
+        self.emit(if_expression, factories, bundle, emitter)
+        return emitter.getvalue()
+
+    def emit(self, if_expression: If, factories: Dict[type, TemplateFactory], bundle: Dict,
+             emitter: Emitter) -> None:
+        skip_if_id = get_unique_id(bundle, "endif")
         prev_scope = bundle["scope"]
         bundle["scope"] = if_expression.scope
+        emitter.emit(self.add_verbose(bundle))
+        always_taken = is_always_taken(if_expression.condition)
+        if not always_taken and bundle.get("branch_conditions"):
+            emitter.emit(factories[type(if_expression.condition)].produce_branch(if_expression.condition, factories,
+                                                                                 bundle, skip_if_id, False))
+        elif not always_taken:
+            emitter.emit(
+                f"{factories[type(if_expression.condition)].produce(if_expression.condition, factories, bundle)}"
+                "pop eax\n"
+                "test eax, eax\n"
+                f"jz loc_{skip_if_id}\n"
+            )
         for expression in if_expression.body:
             if not isinstance(expression, VariableDeclaration):
-                body_assembly += factories[type(expression)].produce(expression, factories, bundle)
-        assembly = self.add_verbose(bundle)
-        assembly += (
-            f"{factories[type(if_expression.condition)].produce(if_expression.condition, factories, bundle)}"
-            "pop eax\n"
-            "test eax, eax\n"
-            f"jz loc_{skip_if_id}\n"
-            f"{body_assembly}"
-            f"loc_{skip_if_id}:\n"
-        )
+                factories[type(expression)].emit(expression, factories, bundle, emitter)
+        if not always_taken:
+            emitter.emit(f"loc_{skip_if_id}:\n")
         bundle["scope"] = prev_scope
-        return assembly
 
 
 class WhileTemplateFactory(TemplateFactory):
     def produce(self, while_expression: While, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
+        emitter = Emitter()
+        self.emit(while_expression, factories, bundle, emitter)
+        return emitter.getvalue()
 
-        loop_start = get_unique_id()
-        loop_end = get_unique_id()
-        body_assembly = ""
+    def emit(self, while_expression: While, factories: Dict[type, TemplateFactory], bundle: Dict,
+             emitter: Emitter) -> None:
+        loop_start = get_unique_id(bundle, "while")
         prev_scope = bundle["scope"]
         bundle["scope"] = while_expression.scope
-        for expression in while_expression.body:
-            if not isinstance(expression, VariableDeclaration):
-                body_assembly += factories[type(expression)].produce(expression, factories, bundle)
-        assembly = (
+        condition = while_expression.condition
+        if bundle.get("branch_conditions") and not is_always_taken(condition):
+            # The condition is tested after the body, so every iteration jumps once, back to the start of the loop.
+            loop_condition = get_unique_id(bundle, "whilecondition")
+            emitter.emit(
+                f"{self.add_verbose(bundle)}"
+                f"jmp loc_{loop_condition}\n"
+                f"loc_{loop_start}:\n"
+            )
+            for expression in while_expression.body:
+                if not isinstance(expression, VariableDeclaration):
+                    factories[type(expression)].emit(expression, factories, bundle, emitter)
+            emitter.emit(f"loc_{loop_condition}:\n" +
+                         factories[type(condition)].produce_branch(condition, factories, bundle, loop_start, True))
+            bundle["scope"] = prev_scope
+            return
+        loop_end = get_unique_id(bundle, "endwhile")
+        emitter.emit(
             f"{self.add_verbose(bundle)}"
             f"loc_{loop_start}:\n"
-            f"{factories[type(while_expression.condition)].produce(while_expression.condition, factories, bundle)}"
-            "pop eax\n"
-            "test eax, eax\n"
-            f"jz loc_{loop_end}\n"
-            f"{body_assembly}"
+        )
+        if not is_always_taken(condition):
+            emitter.emit(
+                f"{factories[type(condition)].produce(condition, factories, bundle)}"
+                "pop eax\n"
+                "test eax, eax\n"
+                f"jz loc_{loop_end}\n"
+            )
+        for expression in while_expression.body:
+            if not isinstance(expression, VariableDeclaration):
+                factories[type(expression)].emit(expression, factories, bundle, emitter)
+        emitter.emit(
             f"jmp loc_{loop_start}\n"
             f"loc_{loop_end}:\n"
         )
         bundle["scope"] = prev_scope
-        return assembly
 
 
 class ArrayInitializeTemplateFactory(TemplateFactory):
     def produce(self, array: ArrayInitializer, factories: Dict[type, TemplateFactory], bundle: Dict,
                 heap_table: Dict = None) -> str:
 
-        arrays_metadata = array.array.get_metadata(bundle["size_bundle"])
+        arrays_metadata = get_layout_engine(bundle).get_array_layout(array.array).metadata
         assembly = self.add_verbose(bundle)
         if not heap_table:
             array_start_offset = bundle["offset_table"][array.variable_name]
@@ -385,20 +599,48 @@ class ArrayInitializeTemplateFactory(TemplateFactory):
 
 class ArrayIndexerTemplateFactory(TemplateFactory):
     def produce(self, indexer_expression: ArrayIndexer, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
-        passed_boundary_check = get_unique_id()
+        assembly = self.produce_address(indexer_expression, factories, bundle)
+        if is_array_element(indexer_expression):
+            assembly += (
+                "pop edi\n"
+                "push DWORD [edi]\n"
+            )
+        return assembly
+
+    def produce_address(self, indexer_expression: ArrayIndexer, factories: Dict[type, TemplateFactory],
+                        bundle: Dict) -> str:
+        """
+        This function produces the address of the cell of an indexer, that is assigned to or indexed again.
+        :param indexer_expression: the indexer.
+        :param factories: the template factories.
+        :param bundle: the compilation bundle.
+        :return: the assembly code, that pushes the address.
+        """
+        checked = needs_bounds_check(indexer_expression, bundle)
+        passed_boundary_check = get_unique_id(bundle, "inbounds") if checked else None
         assembly = self.add_verbose(bundle)
+        header = get_array_header(indexer_expression, bundle)
+        if header is not None:
+            # The size of the array and of its cells are immediates, the header is not read.
+            return assembly + (
+                f"{factories[type(indexer_expression.right)].produce(indexer_expression.right, factories, bundle)}"
+                f"{produce_array_address(indexer_expression.left, factories, bundle)}"
+                "pop edi\n"
+                "pop eax\n"
+                f"{select_bounds_check('eax', header['array_size'], passed_boundary_check) if checked else ''}"
+                f"{select_scaled_address('edi', 'eax', header['cell_size'], 8)}"
+                "push edi\n"
+            )
         assembly += (
             f"{factories[type(indexer_expression.right)].produce(indexer_expression.right, factories, bundle)}\n"
-            f"{factories[type(indexer_expression.left)].produce(indexer_expression.left, factories, bundle)}\n"
+            f"{produce_array_address(indexer_expression.left, factories, bundle)}\n"
             "pop edi\n"
             "pop eax\n"
-            "mov ebx, [edi]\n"
-            "cmp eax, ebx\n"  # Check if index is off bounds
-            f"jb loc_{passed_boundary_check}\n"
-            "mov eax, 0\n"
-            "mov ebx, 0\n"
-            "int 0x80\n"
-            f"loc_{passed_boundary_check}:\n"
+        )
+        if checked:
+            # Check if index is off bounds
+            assembly += "mov ebx, [edi]\n" + select_bounds_check("eax", "ebx", passed_boundary_check)
+        assembly += (
             "mov ecx, [edi + 4]\n"
             "xor edx, edx\n"
             "mul ecx\n"
@@ -413,7 +655,12 @@ class ArrayIndexerTemplateFactory(TemplateFactory):
 class PointerVariableTemplateFactory(TemplateFactory):
     def produce(self, variable_expression: Variable, factories: Dict[type, TemplateFactory], bundle: Dict) -> str:
         assembly = self.add_verbose(bundle)
-        if variable_expression.name in bundle["offset_table"] and bundle["offset_table"][variable_expression.name] > 0:
+        if is_global_variable(variable_expression, bundle):
+            assembly += (
+                f"mov edi, {variable_expression.name}\n"
+                "push edi\n"
+            )
+        elif variable_expression.name in bundle["offset_table"] and bundle["offset_table"][variable_expression.name] > 0:
             assembly += (
                 "lea edi, [ebp + {var_offset}]\n"
                 "push edi\n".format(var_offset=bundle["offset_table"][variable_expression.name])
@@ -424,11 +671,6 @@ class PointerVariableTemplateFactory(TemplateFactory):
                 "lea edi, [ebp - {var_offset}]\n"
                 "push edi\n".format(var_offset=-bundle["offset_table"][variable_expression.name])
             )
-        elif variable_expression.name in bundle["program"].variables:
-            assembly += (
-                f"mov edi, {variable_expression.name}\n"
-                "push edi\n"
-            )
         return assembly
 
 
@@ -441,7 +683,7 @@ class NewOperatorTemplateFactory(TemplateFactory):
         assert issubclass(type(class_type), ElangClass)
 
         assembly += (
-            f"push {class_type.get_malloc_size(bundle['size_bundle'])}\n"
+            f"push {get_layout_engine(bundle).get_class_layout(class_type).size}\n"
             "call malloc\n"
             "add esp, 4\n"
             "push eax\n"
@@ -460,21 +702,33 @@ class NewOperatorTemplateFactory(TemplateFactory):
 
 class ElangClassTemplateFactory(TemplateFactory):
     def produce(self, elang_class: ElangClass, factories, bundle: Dict) -> str:
-        assembly = self.add_verbose(bundle)
+        emitter = Emitter()
+        self.emit(elang_class, factories, bundle, emitter)
+        return emitter.getvalue()
+
+    def emit(self, elang_class: ElangClass, factories, bundle: Dict, emitter: Emitter) -> None:
+        emitter.emit(self.add_verbose(bundle))
         prev_scope = bundle["scope"]
         bundle["scope"] = elang_class.scope
         plt_section = ""
+        # Functions that were produced and optimized by other processes, by their name.
+        produced = bundle.get("produced_functions") or {}
         for f_name in elang_class.functions:
-            elang_class.functions[f_name].name = f"{elang_class.name}_{f_name}"
-            offset_table, stack_size = produce_offset_table(elang_class.functions[f_name], bundle["size_bundle"])
-            bundle["offset_table"], bundle["stack_size"] = offset_table, stack_size
-            assembly += factories[Function].produce(elang_class.functions[f_name], factories, bundle)
+            function = elang_class.functions[f_name]
+            function.name = f"{elang_class.name}_{f_name}"
+            if function.name in produced:
+                emitter.emit_optimized(produced[function.name])
+            else:
+                context = FunctionContext.create(function, elang_class, bundle)
+                factories[Function].emit(function, factories, context.create_bundle(), emitter)
+            emitter.flush()
             plt_section += (
                 f"vt_{elang_class.name}_{f_name}:\n"  # properly set up vtable
                 f"jmp {elang_class.name}_{f_name}\n"
             )
         if len(elang_class.variables_init) is not 0:
-            assembly += (
+            get_label_allocator(bundle).enter(f"init_{elang_class.name}")
+            emitter.emit(
                 f"init_{elang_class.name}:\n"
                 "push ebp\n"
                 "mov ebp, esp\n"
@@ -483,10 +737,10 @@ class ElangClassTemplateFactory(TemplateFactory):
                 assert isinstance(init_statement, ArrayInitializer)
                 # TODO: If I ever want to enable default values for globals that are not arrays, I need to pass
                 # heap_table to the assignment operator, variable and pointer variable.
-                array_init = ArrayInitializeTemplateFactory().produce(init_statement, factories, bundle,
-                                                                      heap_table=produce_class_member_offset_table(
-                                                                          elang_class, bundle['size_bundle']))
-                assembly += (
+                array_init = ArrayInitializeTemplateFactory().produce(
+                    init_statement, factories, bundle,
+                    heap_table=get_layout_engine(bundle).get_class_layout(elang_class).offsets)
+                emitter.emit(
                     f"lea edi, [ebp + 8]\n"
                     "mov edi, [edi]\n"
                     "push edi\n"
@@ -494,9 +748,10 @@ class ElangClassTemplateFactory(TemplateFactory):
                     "leave\n"
                     "ret\n"
                 )
-        assembly += plt_section
+            emitter.flush()
+        emitter.emit(plt_section)
+        emitter.flush()
         bundle["scope"] = prev_scope
-        return assembly
 
 
 class DotOperatorTemplateFactory(TemplateFactory):
@@ -515,12 +770,8 @@ class DotOperatorTemplateFactory(TemplateFactory):
                 "push eax\n"
             )
         assert isinstance(dot.left, FunctionCall) or isinstance(dot.left, PointerVariable)
-        if isinstance(dot.left, FunctionCall):
-            return assembly, bundle["program"].functions[dot.left.name].return_type
-        if isinstance(dot.left, PointerVariable):
-            if dot.left.name in bundle["program"].includes:
-                return assembly, bundle["program"].includes[dot.left.name].program
-            return assembly, bundle["scope"].search_variable(dot.left.name)["type"]
+        # The type of a variable is the type of its declaration, and the type of a call is the return type.
+        return assembly, dot.left.symbol.var_type
 
     def produce(self, dot: DotOperator, factories: Dict[type, "TemplateFactory"], bundle: Dict) -> str:
         assembly = self.add_verbose(bundle)
@@ -530,8 +781,7 @@ class DotOperatorTemplateFactory(TemplateFactory):
         for idx, current_dot in enumerate(dot_dfs):
             assert issubclass(type(current_type), ElangClass)
             if isinstance(current_dot.right, PointerVariable):
-                mv_offset = produce_class_member_offset_table(current_type, bundle["size_bundle"])
-                # TODO: move mv offset table somewhere else
+                mv_offset = get_layout_engine(bundle).get_class_layout(current_type).offsets
                 assembly += (
                     "pop eax\n"
                     f"add eax, {mv_offset[current_dot.right.name]}\n"
@@ -572,5 +822,5 @@ class DotOperatorTemplateFactory(TemplateFactory):
             f"{argument_clean_up_line}"
             f"push eax\n"
         )
-        return assembly, [current_type.functions[function].return_type for function in current_type.functions if
-                          current_type.functions[function].name == f"{current_type.name}_{function_call.name}"][0]
+        # Mentions are typed by the parsed classes, whose functions are not renamed when a folded copy is compiled.
+        return assembly, current_type.functions[function_call.name].return_type
@@ -1,10 +1,12 @@
-import uuid
 from typing import Tuple, Dict, List
 
 from compilation.headers import CompileAsPointer
-from compilation.models.base import Scopeable, Function, BinaryOperator, ElangClass, VariableDeclaration, Program
+from compilation.models.base import Scopeable, Function, BinaryOperator, ElangClass, VariableDeclaration, Program, \
+    Compilable
 from compilation.type_system.primitives import Primitive
 from compilation.models.operators import DotOperator, Type
+from compilation.models.values import DecimalConstantValue
+from compilation.IA32.layout import LayoutEngine
 
 
 def get_memory_access_prefix(var: Type, size_bundle: Dict):
@@ -19,22 +21,102 @@ def get_memory_access_prefix(var: Type, size_bundle: Dict):
         return "QWORD"
 
 
-def get_unique_id() -> str:
+def is_global_variable(variable: Compilable, bundle: Dict) -> bool:
+    """
+    This function checks if a variable mention is bound to a global variable of the program that is being compiled.
+    :param variable: the variable mention.
+    :param bundle: the compilation bundle.
+    :return: True if the variable is a global variable, False otherwise.
+    """
+    return variable.symbol is not None and variable.symbol.scope is bundle["program"].scope
+
+
+def is_always_taken(condition: Compilable) -> bool:
+    """
+    This function checks if the condition of an if or while statement is a constant that is never zero, the
+    constant folding pass replaces such conditions with 1.
+    :param condition: the condition.
+    :return: True if the condition is always true, False otherwise.
+    """
+    return isinstance(condition, DecimalConstantValue) and condition.evaluate() is not 0
+
+
+class LabelAllocator:
+    """
+    Allocator of the labels of the jumps inside of the compiled code.
+    Labels are named after the code they are in (a function, a class initializer or main) and numbered by a counter of
+    that code, so the labels of a function do not depend on the code that was compiled before it, and the same program
+    is always compiled to the same assembly.
+    """
+
+    def __init__(self):
+        self.scope = "main"
+        self.counters: Dict[str, int] = {}
+
+    def enter(self, scope: str) -> None:
+        """
+        This function sets the code that the next labels are in.
+        :param scope: the label of the code, labels of the assembly are unique so the scopes are unique as well.
+        :return: None.
+        """
+        self.scope = scope
+
+    def allocate(self, hint: str) -> str:
+        """
+        This function allocates a new label.
+        :param hint: readable description of the label, without underscores so that labels of different scopes never
+        collide.
+        :return: the label, unique within the compilation.
+        """
+        counter = self.counters.get(self.scope, 0)
+        self.counters[self.scope] = counter + 1
+        return f"{self.scope}_{hint}{counter}"
+
+
+def get_label_allocator(bundle: Dict) -> LabelAllocator:
+    """
+    This function returns the label allocator of a compilation, it is created when the bundle has none.
+    :param bundle: the compilation bundle.
+    :return: the label allocator.
+    """
+    if bundle.get("labels") is None:
+        bundle["labels"] = LabelAllocator()
+    return bundle["labels"]
+
+
+def get_layout_engine(bundle: Dict) -> LayoutEngine:
+    """
+    This function returns the layout engine of a compilation, it is created when the bundle has none.
+    :param bundle: the compilation bundle.
+    :return: the layout engine.
+    """
+    if bundle.get("layouts") is None:
+        bundle["layouts"] = LayoutEngine(bundle["size_bundle"])
+    return bundle["layouts"]
+
+
+def get_unique_id(bundle: Dict, hint: str) -> str:
     """
     This function returns a unique id for loc jumping.
+    :param bundle: the compilation bundle.
+    :param hint: readable description of the label.
     :return: a unique string id
     """
-    return uuid.uuid4().hex[:6].upper()
+    return get_label_allocator(bundle).allocate(hint)
 
 
-def produce_offset_table(scopeable: Scopeable, size_bundle: Dict) -> Tuple[Dict[str, int], int]:
+def produce_offset_table(scopeable: Scopeable, size_bundle: Dict,
+                         layouts: LayoutEngine = None) -> Tuple[Dict[str, int], int]:
     """
     This function produces an offset table for a scope.
     :param size_bundle: the bundle of type sizes.
     :param scopeable: the scope.
+    :param layouts: the layout engine of the compilation, None to compute the sizes of the variables again.
     :return: a dictionary that matches a variable (or argument) name, to it's offset in relation to ebp.
     """
     scope_table: Dict[str, int] = {}
+    if layouts is None:
+        layouts = LayoutEngine(size_bundle)
 
     arguments_size = 8
     if isinstance(scopeable, Function):
@@ -51,7 +133,7 @@ def produce_offset_table(scopeable: Scopeable, size_bundle: Dict) -> Tuple[Dict[
     while len(scopes) is not 0:
         current_scope = scopes.pop()
         for idx, key in enumerate(current_scope.scope.defined_variables):
-            scope_table[key] = stack_size - current_scope.scope.defined_variables[key]["type"].get_size(size_bundle)
+            scope_table[key] = stack_size - layouts.get_size(current_scope.scope.defined_variables[key]["type"])
             stack_size = scope_table[key]
         for compilable in current_scope.body:
             if issubclass(type(compilable), Scopeable):
@@ -0,0 +1,294 @@
+import copy
+from typing import Dict, List, Set
+
+from compilation.models.base import *
+from compilation.models.keywords import Return, If, While
+from compilation.models.operators import *
+from compilation.models.values import DecimalConstantValue, FunctionCall
+from compilation.type_system.primitives import Primitive
+
+# Operators whose value is computed by evaluate() when both of their operands are constant.
+FOLDABLE_OPERATORS = (MultiplicationOperator, DivisionOperator, AdditionOperator, SubtractOperator, LogicalAnd,
+                      LogicalOr, LogicalGreater, Equal)
+
+
+def copy_program(program: Program) -> Program:
+    """
+    This function copies the code of a program and of the programs that it includes: their classes, functions,
+    statements and expressions. Symbols, scopes and types are shared with the program, so passes that rewrite the code
+    of the copy leave the program as it is.
+    :param program: the program.
+    :return: the copy of the program.
+    """
+    classes: Dict[int, ElangClass] = {}
+    programs, originals = [program], []
+    while len(programs) is not 0:
+        current = programs.pop()
+        if id(current) in classes:
+            continue
+        originals.append(current)
+        # A program is one of its classes.
+        for elang_class in current.classes.values():
+            classes[id(elang_class)] = copy.copy(elang_class)
+        programs += [include.program for include in current.includes.values()]
+    for original in originals:
+        for elang_class in original.classes.values():
+            copied = classes[id(elang_class)]
+            copied_functions = copy_code(list(elang_class.functions.values()), classes)
+            functions = {id(function): copied_function for function, copied_function
+                         in zip(elang_class.functions.values(), copied_functions)}
+            copied.functions = {f_name: functions[id(function)] for f_name, function in elang_class.functions.items()}
+            copied.constructor = functions[id(elang_class.constructor)] if elang_class.constructor is not None else None
+            copied.body = [functions.get(id(statement), statement) for statement in elang_class.body]
+            copied.variables_init = copy_code(elang_class.variables_init, classes)
+            copied.classes = {name: classes.get(id(sub_class), sub_class)
+                              for name, sub_class in elang_class.classes.items()}
+        copied = classes[id(original)]
+        copied.includes = {name: copy.copy(include) for name, include in original.includes.items()}
+        for include in copied.includes.values():
+            include.program = classes[id(include.program)]
+    return classes[id(program)]
+
+
+def copy_code(statements: List[Compilable], classes: Dict[int, ElangClass]) -> List[Compilable]:
+    """
+    This function copies statements, and the statements and expressions inside of them. The trees are copied by a loop
+    instead of by recursion, an expression can be far deeper than the recursion limit. Mentions and constants are
+    shared, the folder replaces them instead of changing them.
+    :param statements: the statements.
+    :param classes: the copies of the classes by the id of the class, calls to constructors are bound to the copies.
+    :return: the copies of the statements.
+    """
+    def copy_model(model):
+        # The models have slots, which copy.copy handles several times slower than assigning them.
+        if isinstance(model, BinaryOperator):
+            copied = object.__new__(type(model))
+            copied.left, copied.right = model.left, model.right
+        elif isinstance(model, FunctionCall):
+            copied = object.__new__(type(model))
+            copied.arguments, copied.name, copied.symbol = model.arguments, model.name, model.symbol
+            copied.constructor_call = classes.get(id(model.constructor_call), model.constructor_call)
+        elif isinstance(model, UnaryOperator):
+            copied = object.__new__(type(model))
+            copied.obj = model.obj
+        elif isinstance(model, Return):
+            copied = object.__new__(type(model))
+            copied.expression = model.expression
+        elif isinstance(model, Scopeable):
+            copied = copy.copy(model)
+        else:
+            return model
+        pending.append(copied)
+        return copied
+
+    pending = []
+    copies = [copy_model(statement) for statement in statements]
+    while len(pending) is not 0:
+        model = pending.pop()
+        if isinstance(model, Scopeable):
+            model.body = [copy_model(statement) for statement in model.body]
+            if isinstance(model, If) or isinstance(model, While):
+                model.condition = copy_model(model.condition)
+        elif isinstance(model, BinaryOperator):
+            model.left, model.right = copy_model(model.left), copy_model(model.right)
+        elif isinstance(model, UnaryOperator):
+            model.obj = copy_model(model.obj)
+        elif isinstance(model, Return):
+            model.expression = copy_model(model.expression)
+        elif isinstance(model, FunctionCall):
+            model.arguments = [copy_model(argument) for argument in model.arguments]
+    return copies
+
+
+class ConstantFolder:
+    """
+    Pass that computes the constant parts of expressions before code is generated.
+    Operators with constant operands are replaced by their value, and the locals that are assigned a constant once
+    are replaced by the constant after the assignment. If and while statements whose condition is false are dropped,
+    and the condition of the ones that are always taken is replaced by 1.
+    """
+
+    def __init__(self):
+        self.constants: Dict[Symbol, int] = {}
+        self.candidates: Set[Symbol] = set()
+
+    def fold(self, program: Program) -> Program:
+        """
+        This function folds the constants of a program in place, the included programs are folded on their own.
+        :param program: the program to fold, the program itself is one of its classes.
+        :return: the program.
+        """
+        for elang_class in program.classes.values():
+            elang_class.variables_init = [self.fold_expression(statement) for statement in elang_class.variables_init]
+            for function in elang_class.functions.values():
+                self.fold_function(function)
+        return program
+
+    def fold_function(self, function: Function) -> None:
+        self.candidates = self.get_candidates(function)
+        self.constants = {}
+        self.fold_scopeable(function)
+        propagated = set(self.constants)
+        if len(propagated) is not 0:
+            # Assignments whose value was propagated to every mention are dropped.
+            read = set()
+            self.collect_reads(function, read)
+            self.drop_assignments(function, propagated - read)
+        self.candidates, self.constants = set(), {}
+
+    def get_candidates(self, function: Function) -> Set[Symbol]:
+        """
+        This function finds the locals of a function that can be propagated, int locals that are assigned exactly once
+        by a statement of the scope that declares them, and whose address is never taken.
+        :param function: the function.
+        :return: set of the symbols of the locals.
+        """
+        assignments: Dict[Symbol, int] = {}
+        candidates, addressed = set(), set()
+        scopeables = [function]
+        while len(scopeables) is not 0:
+            scopeable = scopeables.pop()
+            for statement in scopeable.body:
+                if isinstance(statement, Scopeable):
+                    self.collect_addressed(statement.condition, addressed)
+                    scopeables.append(statement)
+                    continue
+                if isinstance(statement, Assignment) and isinstance(statement.left, Variable) \
+                        and statement.left.symbol is not None:
+                    symbol = statement.left.symbol
+                    assignments[symbol] = assignments.get(symbol, 0) + 1
+                    if symbol.scope is scopeable.scope and symbol.define_line is not None \
+                            and isinstance(symbol.var_type, Primitive) and symbol.var_type.name == "int":
+                        candidates.add(symbol)
+                self.collect_addressed(statement.expression if isinstance(statement, Return) else statement, addressed)
+        return set(symbol for symbol in candidates if assignments[symbol] is 1 and symbol not in addressed)
+
+    def collect_addressed(self, expression: Compilable, addressed: Set[Symbol]) -> None:
+        if isinstance(expression, PointerVariable):
+            addressed.add(expression.symbol)
+        elif isinstance(expression, FunctionCall):
+            for argument in expression.arguments:
+                self.collect_addressed(argument, addressed)
+        elif isinstance(expression, BinaryOperator):
+            self.collect_addressed(expression.left, addressed)
+            self.collect_addressed(expression.right, addressed)
+        elif isinstance(expression, UnaryOperator):
+            self.collect_addressed(expression.obj, addressed)
+
+    def fold_scopeable(self, scopeable: Scopeable) -> None:
+        body = []
+        for statement in scopeable.body:
+            if isinstance(statement, If) or isinstance(statement, While):
+                statement.condition = self.fold_expression(statement.condition)
+                if isinstance(statement.condition, DecimalConstantValue):
+                    if statement.condition.evaluate() & WORD_MASK is 0:
+                        continue
+                    statement.condition = DecimalConstantValue(1)
+                self.fold_scopeable(statement)
+            elif isinstance(statement, Return):
+                statement.expression = self.fold_expression(statement.expression)
+            elif isinstance(statement, Assignment):
+                self.fold_assignment(statement)
+            elif not isinstance(statement, Scopeable) and not isinstance(statement, VariableDeclaration):
+                statement = self.fold_expression(statement)
+            body.append(statement)
+        scopeable.body = body
+
+    def fold_assignment(self, assignment: Assignment) -> None:
+        assignment.right = self.fold_expression(assignment.right)
+        if not isinstance(assignment.left, Variable):
+            assignment.left = self.fold_expression(assignment.left)
+        elif assignment.left.symbol in self.candidates and isinstance(assignment.right, DecimalConstantValue):
+            # The mentions that follow the assignment read the constant, the ones before it are left as they are.
+            self.constants[assignment.left.symbol] = assignment.right.evaluate() & WORD_MASK
+
+    def fold_expression(self, expression: Compilable) -> Compilable:
+        """
+        This function folds the constants of an expression.
+        :param expression: the expression.
+        :return: the folded expression, the expression itself if it changed in place.
+        """
+        if isinstance(expression, Variable):
+            if expression.symbol in self.constants:
+                return DecimalConstantValue(self.constants[expression.symbol])
+        elif isinstance(expression, FunctionCall):
+            expression.arguments = [self.fold_expression(argument) for argument in expression.arguments]
+        elif isinstance(expression, DotOperator):
+            expression.left = self.fold_member(expression.left)
+            expression.right = self.fold_member(expression.right)
+        elif isinstance(expression, ArrayIndexer):
+            expression.left = self.fold_member(expression.left)
+            expression.right = self.fold_expression(expression.right)
+        elif isinstance(expression, BinaryOperator):
+            expression.left = self.fold_expression(expression.left)
+            expression.right = self.fold_expression(expression.right)
+            if isinstance(expression, FOLDABLE_OPERATORS):
+                return self.fold_operator(expression)
+        elif isinstance(expression, UnaryOperator):
+            expression.obj = self.fold_expression(expression.obj)
+        return expression
+
+    def fold_member(self, expression: Compilable) -> Compilable:
+        """
+        This function folds the expressions that are used by a member (arguments and indexes), member names are not
+        bound to declarations.
+        :param expression: a side of a dot operator, or the left side of an array indexer.
+        :return: the folded member.
+        """
+        if isinstance(expression, Variable) or isinstance(expression, PointerVariable):
+            return expression
+        return self.fold_expression(expression)
+
+    @staticmethod
+    def fold_operator(operator: BinaryOperator) -> Compilable:
+        left, right = operator.left, operator.right
+        if isinstance(left, DecimalConstantValue) and isinstance(right, DecimalConstantValue):
+            if isinstance(operator, DivisionOperator) and right.evaluate() & WORD_MASK is 0:
+                # Division by zero is left to the generated code.
+                return operator
+            return DecimalConstantValue(operator.evaluate())
+        # Identities keep the other operand, which is still evaluated.
+        if isinstance(right, DecimalConstantValue):
+            value = right.evaluate() & WORD_MASK
+            if (value is 0 and (isinstance(operator, AdditionOperator) or isinstance(operator, SubtractOperator))) or \
+                    (value is 1 and (isinstance(operator, MultiplicationOperator) or
+                                     isinstance(operator, DivisionOperator))):
+                return left
+        if isinstance(left, DecimalConstantValue):
+            value = left.evaluate() & WORD_MASK
+            if (value is 0 and isinstance(operator, AdditionOperator)) or \
+                    (value is 1 and isinstance(operator, MultiplicationOperator)):
+                return right
+        return operator
+
+    def collect_reads(self, scopeable: Scopeable, read: Set[Symbol]) -> None:
+        for statement in scopeable.body:
+            if isinstance(statement, If) or isinstance(statement, While):
+                self.collect_mentions(statement.condition, read)
+                self.collect_reads(statement, read)
+            elif isinstance(statement, Return):
+                self.collect_mentions(statement.expression, read)
+            elif isinstance(statement, Assignment) and isinstance(statement.left, Variable):
+                self.collect_mentions(statement.right, read)
+            elif not isinstance(statement, Scopeable):
+                self.collect_mentions(statement, read)
+
+    def collect_mentions(self, expression: Compilable, mentions: Set[Symbol]) -> None:
+        if isinstance(expression, Variable) or isinstance(expression, PointerVariable):
+            mentions.add(expression.symbol)
+        elif isinstance(expression, FunctionCall):
+            for argument in expression.arguments:
+                self.collect_mentions(argument, mentions)
+        elif isinstance(expression, BinaryOperator):
+            self.collect_mentions(expression.left, mentions)
+            self.collect_mentions(expression.right, mentions)
+        elif isinstance(expression, UnaryOperator):
+            self.collect_mentions(expression.obj, mentions)
+
+    def drop_assignments(self, scopeable: Scopeable, unread: Set[Symbol]) -> None:
+        scopeable.body = [statement for statement in scopeable.body
+                          if not (isinstance(statement, Assignment) and isinstance(statement.left, Variable) and
+                                  statement.left.symbol in unread)]
+        for statement in scopeable.body:
+            if isinstance(statement, If) or isinstance(statement, While):
+                self.drop_assignments(statement, unread)
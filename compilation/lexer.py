@@ -0,0 +1,196 @@
+import io
+import re
+import sys
+from typing import List, Iterable, Iterator, TextIO
+
+DEFAULT_CHUNK_SIZE = 2 ** 16
+
+
+class Token:
+    """
+    Model for a single lexical token of the source code.
+    """
+    __slots__ = ("kind", "text", "position", "line")
+
+    def __init__(self, kind: str, text: str, position: int, line: int = 1):
+        """
+        Initializes a new token.
+        :param kind: the kind of the token ('keyword', 'identifier', 'number' or 'symbol').
+        :param text: the text of the token.
+        :param position: the offset of the token in the source code.
+        :param line: the line of the token in the source code.
+        """
+        self.kind = kind
+        self.text = text
+        self.position = position
+        self.line = line
+
+    def __repr__(self):
+        return f"Token({self.kind}, {self.text!r}, {self.position})"
+
+
+class Lexer:
+    """
+    Class responsible for splitting source code into tokens.
+    All of the token patterns are combined into one master pattern, so the source code is scanned exactly once.
+    """
+
+    def __init__(self, keywords: Iterable[str], symbols: Iterable[str]):
+        """
+        Initializes a new lexer.
+        :param keywords: the reserved words of the language, they take priority over identifiers.
+        :param symbols: the operators and punctuation of the language.
+        """
+        self.keywords = set(keywords)
+        # Longer symbols come first, so the alternation prefers the longest match ('==' over '=').
+        symbols_pattern = "|".join(re.escape(symbol) for symbol in sorted(symbols, key=len, reverse=True))
+        self.master_re = re.compile(r"(?P<whitespace>\s+)"
+                                    r"|(?P<number>\d+)"
+                                    r"|(?P<identifier>[a-zA-Z_]\w*)"
+                                    rf"|(?P<symbol>{symbols_pattern})"
+                                    r"|(?P<mismatch>.)", re.DOTALL)
+
+    def tokenize(self, source_code: str) -> List[Token]:
+        """
+        This function splits a source code into tokens.
+        :param source_code: the source code to split.
+        :return: list of the tokens in the source code.
+        """
+        return list(self.scan(io.StringIO(source_code)))
+
+    def scan(self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Token]:
+        """
+        This function lazily splits the source code of a stream into tokens, the stream is read in chunks.
+        :param stream: the text stream of the source code.
+        :param chunk_size: the amount of characters to read at once.
+        :return: generator of the tokens in the source code.
+        """
+        buffer, offset, line = "", 0, 1
+        end_of_stream = False
+        while not end_of_stream:
+            chunk = stream.read(chunk_size)
+            end_of_stream = len(chunk) is 0
+            buffer += chunk
+            scanned = 0
+            for match in self.master_re.finditer(buffer):
+                # A match that reaches the end of the chunk might continue in the next chunk ('=' of '==').
+                if match.end() == len(buffer) and not end_of_stream:
+                    break
+                scanned = match.end()
+                kind = match.lastgroup
+                text = match.group(kind)
+                if kind == "whitespace":
+                    line += text.count("\n")
+                    continue
+                if kind == "mismatch":
+                    raise Exception("Unexpected character '{0}' at line {1}".format(text, line))
+                if kind == "identifier" and text in self.keywords:
+                    kind = "keyword"
+                # Texts are interned, so repeated names share one string in the tokens and in the models.
+                yield Token(kind, sys.intern(text), offset + match.start(), line)
+            buffer = buffer[scanned:]
+            offset += scanned
+
+
+BRACKETS = {"{": "}", "(": ")", "[": "]"}
+CLOSING_BRACKETS = {closing: opening for opening, closing in BRACKETS.items()}
+
+
+def match_brackets(tokens: List[Token]) -> List[int]:
+    """
+    This function matches every bracket token ('{}', '()' and '[]') with the bracket that closes or opens it, in a
+    single pass over the tokens.
+    :param tokens: the tokens of a source file.
+    :return: list that holds for every bracket token the index of its matching bracket, and -1 for other tokens.
+    """
+    pairs = [-1] * len(tokens)
+    opened = []
+    for idx, token in enumerate(tokens):
+        if token.kind != "symbol":
+            continue
+        if token.text in BRACKETS:
+            opened.append(idx)
+        elif token.text in CLOSING_BRACKETS:
+            if len(opened) is 0:
+                raise Exception("Unbalanced '{0}' at line {1}".format(token.text, token.line))
+            if tokens[opened[-1]].text != CLOSING_BRACKETS[token.text]:
+                raise Exception("Unbalanced '{0}' at line {1}, closed by '{2}' at line {3}".format(
+                    tokens[opened[-1]].text, tokens[opened[-1]].line, token.text, token.line))
+            opening = opened.pop()
+            pairs[opening], pairs[idx] = idx, opening
+    if len(opened) is not 0:
+        raise Exception("Unbalanced '{0}' at line {1}".format(tokens[opened[-1]].text, tokens[opened[-1]].line))
+    return pairs
+
+
+class TokenStream:
+    """
+    A cursor over a shared buffer of tokens.
+    Factories advance the cursor instead of copying the remaining tokens, and nested scopes are parsed through bounded
+    views of the same buffer.
+    """
+
+    def __init__(self, tokens: List[Token], start: int = 0, end: int = None, pairs: List[int] = None):
+        """
+        Initializes a new token stream.
+        :param tokens: the shared token buffer.
+        :param start: the position of the first token of the stream in the buffer.
+        :param end: the position after the last token of the stream in the buffer.
+        :param pairs: the bracket table of the buffer, it is computed if it is not given.
+        """
+        self.tokens = tokens
+        self.position = start
+        self.end = len(tokens) if end is None else end
+        self.pairs = match_brackets(tokens) if pairs is None else pairs
+
+    def __len__(self) -> int:
+        return self.end - self.position
+
+    def __getitem__(self, offset: int) -> Token:
+        """
+        This function returns a token relative to the current position of the stream.
+        :param offset: the offset of the token from the current position, negative offsets count from the end.
+        :return: the token.
+        """
+        if offset < 0:
+            offset += len(self)
+        if not 0 <= offset < len(self):
+            raise Exception("Unexpected end of tokens")
+        return self.tokens[self.position + offset]
+
+    def __iter__(self) -> Iterator[Token]:
+        for position in range(self.position, self.end):
+            yield self.tokens[position]
+
+    def head(self, count: int) -> List[Token]:
+        """
+        This function returns the next tokens of the stream, without advancing it.
+        :param count: the amount of tokens to return.
+        :return: list of the next tokens.
+        """
+        return self.tokens[self.position:min(self.position + count, self.end)]
+
+    def advance(self, count: int = 1) -> "TokenStream":
+        self.position = min(self.position + count, self.end)
+        return self
+
+    def find_pair(self, position: int) -> int:
+        """
+        This function finds the bracket that matches the bracket at a position.
+        :param position: the position of a bracket in the buffer.
+        :return: the position of the matching bracket.
+        """
+        return self.pairs[position]
+
+    def seek(self, position: int) -> "TokenStream":
+        self.position = position
+        return self
+
+    def view(self, start: int, end: int) -> "TokenStream":
+        """
+        This function creates a new stream over a part of the same buffer.
+        :param start: the position of the first token of the view in the buffer.
+        :param end: the position after the last token of the view in the buffer.
+        :return: the new token stream.
+        """
+        return TokenStream(self.tokens, start, end, self.pairs)
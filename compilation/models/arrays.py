@@ -97,6 +97,8 @@ class ArrayInitializer(Compilable):
     """
     Class for describing an array initialization statement.
     """
+    __slots__ = ("array", "variable_name")
+
     def __init__(self, array: Array, variable_name):
         self.array = array
         self.variable_name = variable_name
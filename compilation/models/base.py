@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Dict, Iterator
 
 from compilation.type_system.base import Type
 from compilation.headers import CompileAsPointer
@@ -9,6 +9,7 @@ class Compilable:
     """
     Interface for unifying compilable models.
     """
+    __slots__ = ()
 
     def get_mentions(self) -> List[str]:
         """
@@ -38,7 +39,8 @@ class Scopeable(Compilable):
         return mentions
 
     def convert_ptr_types(self, var_list=[]):
-        pointer_variables = []
+        # The pointer variables of the enclosing scopes are pointers in this scope too, unless it declares them again.
+        pointer_variables = [variable for variable in var_list if variable not in self.scope.defined_variables]
         for variable in self.scope.defined_variables:
             if issubclass(type(self.scope.defined_variables[variable]["type"]), CompileAsPointer):
                 pointer_variables.append(variable)
@@ -51,9 +53,12 @@ class Variable(Compilable):
     """
     Model for variable mentions
     """
+    __slots__ = ("name", "symbol")
 
     def __init__(self, name: str):
         self.name = name
+        # The declaration of the variable, bound by the name resolution pass.
+        self.symbol: "Symbol" = None
 
     def is_constant(self):
         return False
@@ -72,9 +77,12 @@ class PointerVariable(Compilable):
     """
     Model for a variable that is a pointer type.
     """
+    __slots__ = ("name", "symbol")
 
     def __init__(self, name: str):
         self.name = name
+        # The declaration of the variable, bound by the name resolution pass.
+        self.symbol: "Symbol" = None
 
     def is_constant(self):
         return False
@@ -87,6 +95,8 @@ class PointerVariable(Compilable):
 
 
 class UnaryOperator(Compilable):
+    __slots__ = ("obj",)
+
     def __init__(self, obj: Compilable = None):
         self.obj = obj
 
@@ -108,6 +118,7 @@ class BinaryOperator(Compilable):
     """
     Interface for unifying operators.
     """
+    __slots__ = ("left", "right")
 
     def __init__(self, left: Compilable = None, right: Compilable = None):
         self.left = left
@@ -120,14 +131,25 @@ class BinaryOperator(Compilable):
         return self.left.is_constant() and self.right.is_constant()
 
     def convert_ptr_types(self, var_list):
-        if isinstance(self.left, Variable) and self.left.name in var_list:
-            self.left = self.left.to_ptr_type()
-        elif isinstance(self.left, BinaryOperator) or isinstance(self.left, UnaryOperator):
-            self.left.convert_ptr_types(var_list)
-        if isinstance(self.right, Variable) and self.right.name in var_list:
-            self.right = self.right.to_ptr_type()
-        elif isinstance(self.right, BinaryOperator) or isinstance(self.right, UnaryOperator):
-            self.right.convert_ptr_types(var_list)
+        # The nested operators are converted by this loop instead of by recursion, an expression can be far deeper
+        # than the recursion limit. Operators that convert their operands in their own way (dot operators) are called.
+        pending = [self]
+        while len(pending) is not 0:
+            operator = pending.pop()
+            if isinstance(operator.left, Variable) and operator.left.name in var_list:
+                operator.left = operator.left.to_ptr_type()
+            elif isinstance(operator.left, BinaryOperator) \
+                    and type(operator.left).convert_ptr_types is BinaryOperator.convert_ptr_types:
+                pending.append(operator.left)
+            elif isinstance(operator.left, Compilable):
+                operator.left.convert_ptr_types(var_list)
+            if isinstance(operator.right, Variable) and operator.right.name in var_list:
+                operator.right = operator.right.to_ptr_type()
+            elif isinstance(operator.right, BinaryOperator) \
+                    and type(operator.right).convert_ptr_types is BinaryOperator.convert_ptr_types:
+                pending.append(operator.right)
+            elif isinstance(operator.right, Compilable):
+                operator.right.convert_ptr_types(var_list)
 
     def has_ptr_type(self):
         if isinstance(self.left, PointerVariable) or isinstance(self.right, PointerVariable):
@@ -159,12 +181,21 @@ class Scope:
     def get_children(self):
         """
         This function gets all of the children of the scope
+        The descendants of every child come first, in the order of the children, and the children of the scope come
+        last.
         :return: list of all the child scopes of this scope
         """
         children = []
-        for child in self.children:
-            children += child.get_children()
-        return children + self.children
+        # A scope is pending twice, once to walk its children and once more to add them after their descendants.
+        pending = [(self, False)]
+        while len(pending) is not 0:
+            scope, walked = pending.pop()
+            if walked:
+                children += scope.children
+            else:
+                pending.append((scope, True))
+                pending += [(child, False) for child in scope.children[::-1]]
+        return children
 
     def get_global(self):
         if self.parent_scope is None:
@@ -181,6 +212,7 @@ class Scope:
         while p is not None:
             if p == parent:
                 return True
+            p = p.parent_scope
         return False
 
     def search_variable(self, name: str):
@@ -198,10 +230,91 @@ class Scope:
         return self.parent_scope.search_function_scope(name)
 
 
+class ScopeTree:
+    """
+    Index over a tree of scopes, built once per program.
+    Every scope is numbered when the walk enters it, and holds the last number that was given inside of its subtree,
+    so ancestry is checked by comparing numbers and the scopes of a subtree are a contiguous range of the walk.
+    """
+
+    def __init__(self, root: Scope):
+        """
+        Initializes a new scope tree index.
+        :param root: the root scope of the tree.
+        """
+        self.root = root
+        self.order: List[Scope] = []
+        self.enter: Dict[Scope, int] = {}
+        self.exit: Dict[Scope, int] = {}
+        pending = [root]
+        while len(pending) is not 0:
+            scope = pending.pop()
+            self.enter[scope] = len(self.order)
+            self.order.append(scope)
+            pending += scope.children[::-1]
+        # The walk is preorder, so the subtree of a scope ends where the subtree of its last child ends.
+        for scope in reversed(self.order):
+            self.exit[scope] = self.exit[scope.children[-1]] if len(scope.children) is not 0 else self.enter[scope]
+
+    def __contains__(self, scope: Scope) -> bool:
+        return scope in self.enter
+
+    def is_ancestor(self, ancestor: Scope, scope: Scope) -> bool:
+        """
+        This function checks if a scope is a strict ancestor of another scope.
+        :param ancestor: the possible ancestor.
+        :param scope: the possible descendant.
+        :return: True if the ancestor contains the scope and is not the scope itself, False otherwise.
+        """
+        return self.enter[ancestor] < self.enter[scope] <= self.exit[ancestor]
+
+    def is_descendant(self, scope: Scope, ancestor: Scope) -> bool:
+        """
+        This function checks if a scope is a strict descendant of another scope.
+        :param scope: the possible descendant.
+        :param ancestor: the possible ancestor.
+        :return: True if the scope is inside of the ancestor and is not the ancestor itself, False otherwise.
+        """
+        return self.is_ancestor(ancestor, scope)
+
+    def subtree(self, scope: Scope, include_root: bool = True) -> Iterator[Scope]:
+        """
+        This function walks the subtree of a scope, parents come before their children.
+        :param scope: the root of the subtree.
+        :param include_root: whether the root itself is generated.
+        :return: generator of the scopes of the subtree.
+        """
+        start = self.enter[scope] if include_root else self.enter[scope] + 1
+        for idx in range(start, self.exit[scope] + 1):
+            yield self.order[idx]
+
+
+class Symbol:
+    """
+    Model for a declaration that names are bound to by the name resolution pass.
+    """
+    __slots__ = ("name", "var_type", "scope", "define_line")
+
+    def __init__(self, name: str, var_type, scope: Scope, define_line: int = None):
+        """
+        Initializes a new symbol.
+        :param name: the declared name.
+        :param var_type: the type of a variable, or the return type of a function.
+        :param scope: the scope that holds the declaration.
+        :param define_line: the index of the declaration in the body of its scope, None for declarations that are not
+        statements (arguments, member variables and functions).
+        """
+        self.name = name
+        self.var_type = var_type
+        self.scope = scope
+        self.define_line = define_line
+
+
 class VariableDeclaration(Compilable):
     """
     Model for variable declaration
     """
+    __slots__ = ("name", "var_type")
 
     def __init__(self, name: str, var_type: Type):
         self.name = name
@@ -217,12 +330,16 @@ class Function(Scopeable):
     """
 
     def __init__(self, scope: Scope, name: str, signature: str, return_type: str, body: List[Compilable],
-                 arguments: List[VariableDeclaration]):
+                 arguments: List[VariableDeclaration], structure_hash: str = None):
         super(Function, self).__init__(scope, body)
         self.name = name
         self.signature = signature
         self.return_type = return_type
         self.arguments = arguments
+        # The hash of the tokens of the function, equal functions have equal hashes regardless of their formatting.
+        self.structure_hash = structure_hash
+        # The declarations outside of the function that it refers to, filled by the name resolution pass.
+        self.dependencies: List[str] = []
 
 
 class ElangClass(Scopeable, CompileAsPointer, Type):
@@ -281,13 +398,12 @@ class ElangClass(Scopeable, CompileAsPointer, Type):
             self.classes[subclass].append_name(name)
 
     def update_names_for_prefix(self, prefix):
-        self.name = prefix + '.' + self.name
-        temp_classes = self.classes.copy()
-        for sub_class in self.classes:
-            self.classes[sub_class].update_names_for_prefix(prefix)
-        self.classes = {}
-        for t in temp_classes:
-            self.classes[temp_classes[t].name] = temp_classes[t]
+        # self.classes holds every nested class exactly once, so each class is renamed exactly once.
+        nested_classes = [self] + list(self.classes.values())
+        for eclass in nested_classes:
+            eclass.name = prefix + '.' + eclass.name
+        for eclass in nested_classes:
+            eclass.classes = {sub_class.name: sub_class for sub_class in eclass.classes.values()}
 
 
 class Program(ElangClass):
@@ -310,6 +426,7 @@ class Program(ElangClass):
         for include in includes:
             self.includes[include.module_name] = include
         self.convert_ptr_types()
+        self.scope_tree = ScopeTree(global_scope)
 
     def resolve_exports(self) -> List[Compilable]:
         return [export.resolve(self) for export in self.exports]
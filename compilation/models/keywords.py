@@ -5,6 +5,7 @@ class Return(Compilable):
     """
     Model for the 'return' statement
     """
+    __slots__ = ("expression",)
 
     def __init__(self, expression: Compilable):
         self.expression = expression
@@ -12,6 +13,11 @@ class Return(Compilable):
     def get_mentions(self) -> List[str]:
         return self.expression.get_mentions()
 
+    def convert_ptr_types(self, var_list):
+        # A returned variable keeps its value, only the mentions inside of the returned expression are converted.
+        if isinstance(self.expression, Compilable):
+            self.expression.convert_ptr_types(var_list)
+
 
 class If(Scopeable):
     """
@@ -19,8 +25,15 @@ class If(Scopeable):
     """
 
     def __init__(self, scope: Scope, body: List[Compilable], condition: Compilable):
-        super(If, self).__init__(scope, body)
+        # The condition is set first, the scopeable converts it together with the body.
         self.condition = condition
+        super(If, self).__init__(scope, body)
+
+    def convert_ptr_types(self, var_list=[]):
+        # The condition is evaluated in the enclosing scope.
+        if isinstance(self.condition, Compilable):
+            self.condition.convert_ptr_types(var_list)
+        super(If, self).convert_ptr_types(var_list)
 
 
 class While(Scopeable):
@@ -28,5 +41,10 @@ class While(Scopeable):
     Model for while statements
     """
     def __init__(self, scope: Scope, body: List[Compilable], condition: Compilable):
-        super(While, self).__init__(scope, body)
         self.condition = condition
+        super(While, self).__init__(scope, body)
+
+    def convert_ptr_types(self, var_list=[]):
+        if isinstance(self.condition, Compilable):
+            self.condition.convert_ptr_types(var_list)
+        super(While, self).convert_ptr_types(var_list)
@@ -13,4 +13,6 @@ class Include:
     def __init__(self, file_name):
         self.file_name = file_name
         self.module_name = file_name.split('/')[-1].split('.')[0]
+        self.path = None
+        self.program = None
 
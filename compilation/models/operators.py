@@ -1,120 +1,121 @@
 from compilation.models.base import *
 
+# Values are unsigned 32 bit words, as in the generated code.
+WORD_MASK = 0xFFFFFFFF
+
 
 class MultiplicationOperator(BinaryOperator):
     """
     Model for multiplication operator
     """
+    __slots__ = ()
 
     def get_precedence(self):
         return 2
 
     def evaluate(self):
-        return self.left * self.right
+        return (self.left.evaluate() * self.right.evaluate()) & WORD_MASK
 
 
 class DivisionOperator(BinaryOperator):
     """
     Model for divide operator
     """
+    __slots__ = ()
 
     def get_precedence(self):
         return 2
 
     def evaluate(self):
-        return self.left // self.right
+        return (self.left.evaluate() & WORD_MASK) // (self.right.evaluate() & WORD_MASK)
 
 
 class AdditionOperator(BinaryOperator):
     """
     Model for addition operator
     """
+    __slots__ = ()
 
     def get_precedence(self):
         return 1
 
     def evaluate(self):
-        return self.left + self.right
-
-
-class LeftParenthesis:
-    """
-    Model for left parenthesis
-    """
-
-    def get_precedence(self):
-        return -1
-
-
-class RightParenthesis:
-    def get_precedence(self):
-        return -1
+        return (self.left.evaluate() + self.right.evaluate()) & WORD_MASK
 
 
 class SubtractOperator(BinaryOperator):
     """
     Model for subtraction operator
     """
+    __slots__ = ()
 
     def get_precedence(self):
         return 1
 
     def evaluate(self):
-        return self.left - self.right
+        return (self.left.evaluate() - self.right.evaluate()) & WORD_MASK
 
 
 class LogicalAnd(BinaryOperator):
+    __slots__ = ()
 
     def get_precedence(self):
         return 1
 
     def evaluate(self):
-        return 1 if self.left and self.right else 0
+        return 1 if self.left.evaluate() and self.right.evaluate() else 0
 
 
 class LogicalOr(BinaryOperator):
+    __slots__ = ()
 
     def get_precedence(self):
         return 1
 
     def evaluate(self):
-        return 1 if self.left or self.right else 0
+        return 1 if self.left.evaluate() or self.right.evaluate() else 0
 
 
 class LogicalGreater(BinaryOperator):
+    __slots__ = ()
 
     def get_precedence(self):
         return 1
 
     def evaluate(self):
-        return 1 if self.left > self.right else 0
+        return 1 if self.left.evaluate() & WORD_MASK > self.right.evaluate() & WORD_MASK else 0
 
 
 class Equal(BinaryOperator):
+    __slots__ = ()
 
     def get_precedence(self):
         return 1
 
     def evaluate(self):
-        return 1 if self.left == self.right else 0
+        return 1 if self.left.evaluate() & WORD_MASK == self.right.evaluate() & WORD_MASK else 0
 
 
 class Assignment(BinaryOperator):
     """
     Model for assignment operator
     """
+    __slots__ = ()
 
     def get_precedence(self):
         return 0
 
 
 class ArrayIndexer(BinaryOperator):
+    __slots__ = ()
 
     def get_precedence(self):
         return 4
 
 
 class DotOperator(BinaryOperator):
+    __slots__ = ()
+
     def get_precedence(self):
         return 3
 
@@ -135,6 +136,8 @@ class DotOperator(BinaryOperator):
 
 
 class NewOperator(UnaryOperator):
+    __slots__ = ()
+
     def get_precedence(self):
         return 3
 
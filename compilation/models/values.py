@@ -4,6 +4,8 @@ from compilation.models.base import Compilable
 
 
 class StringConstantValue:
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -21,6 +23,7 @@ class DecimalConstantValue:
     """
     Model for immediate decimal values.
     """
+    __slots__ = ("value",)
 
     def __init__(self, value: int):
         self.value = value
@@ -42,11 +45,14 @@ class FunctionCall(Compilable):
     """
     Model for function calls
     """
+    __slots__ = ("arguments", "name", "constructor_call", "symbol")
 
     def __init__(self, name: str, arguments: [], constructor_of: "ElangClass"):
         self.arguments = arguments
         self.name = name
         self.constructor_call = constructor_of
+        # The declaration of the called function, bound by the name resolution pass.
+        self.symbol = None
 
     def get_mentions(self) -> List[str]:
         mentions = []
@@ -54,6 +60,12 @@ class FunctionCall(Compilable):
             mentions += argument.get_mentions()
         return mentions
 
+    def convert_ptr_types(self, var_list):
+        # An argument that is a variable keeps its value, only the mentions inside of the arguments are converted.
+        for argument in self.arguments:
+            if isinstance(argument, Compilable):
+                argument.convert_ptr_types(var_list)
+
     def is_constant(self):
         return False
 
@@ -0,0 +1,97 @@
+import hashlib
+import os
+import pickle
+from typing import Dict, Optional
+
+from compilation.models.base import Program
+from compilation.precompiled import FORMAT_VERSION, PrecompiledFormatError, read_precompiled, write_precompiled
+
+DEFAULT_CACHE_DIRECTORY = ".elang_cache"
+
+
+class ModuleCache:
+    """
+    Cache of parsed modules, keyed by the absolute path of a module and the hash of its content.
+    Parsed programs are reused for the rest of the build, and are stored as precompiled modules in the cache directory
+    for later builds.
+    """
+
+    def __init__(self, directory: Optional[str] = DEFAULT_CACHE_DIRECTORY):
+        """
+        Initializes a new module cache.
+        :param directory: the directory that stores the serialized modules, None to keep the modules in memory only.
+        """
+        self.directory = directory
+        self.modules: Dict[str, Dict] = {}
+        self.keys: Dict[str, str] = {}
+
+    def get_key(self, path: str) -> str:
+        """
+        This function computes the cache key of a module, every module is hashed once per build.
+        :param path: the path to the module.
+        :return: the cache key of the module.
+        """
+        path = os.path.abspath(path)
+        if path not in self.keys:
+            digest = hashlib.sha256(f"{FORMAT_VERSION}:{path}:".encode())
+            with open(path, "rb") as f:
+                digest.update(f.read())
+            self.keys[path] = digest.hexdigest()
+        return self.keys[path]
+
+    def load(self, path: str) -> Optional[Program]:
+        """
+        This function loads a parsed module from the cache.
+        A module is only loaded if none of the modules that it includes have changed since it was stored.
+        :param path: the path to the module.
+        :return: the parsed module, None if the module is not cached.
+        """
+        key = self.get_key(path)
+        entry = self.modules.get(key)
+        if entry is None:
+            entry = self._read(key)
+        if entry is None or any(not os.path.exists(dependency) or self.get_key(dependency) != dependency_key
+                                for dependency, dependency_key in entry["dependencies"].items()):
+            return None
+        self.modules[key] = entry
+        return entry["program"]
+
+    def store(self, path: str, program: Program) -> None:
+        """
+        This function stores a parsed module in the cache.
+        :param path: the path to the module.
+        :param program: the parsed module.
+        :return: None.
+        """
+        key = self.get_key(path)
+        dependencies = {}
+        self._collect_dependencies(program, dependencies)
+        entry = {"program": program, "dependencies": dependencies}
+        self.modules[key] = entry
+        self._write(key, entry)
+
+    def _collect_dependencies(self, program: Program, dependencies: Dict[str, str]) -> None:
+        for include in program.includes.values():
+            path = os.path.abspath(include.path)
+            if path not in dependencies:
+                dependencies[path] = self.get_key(path)
+                self._collect_dependencies(include.program, dependencies)
+
+    def _read(self, key: str) -> Optional[Dict]:
+        if self.directory is None:
+            return None
+        try:
+            return read_precompiled(os.path.join(self.directory, key))
+        except (OSError, PrecompiledFormatError):
+            # A missing or stale cache file is the same as a cache miss.
+            return None
+
+    def _write(self, key: str, entry: Dict) -> None:
+        if self.directory is None:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            write_precompiled(os.path.join(self.directory, key), entry)
+        except (OSError, RecursionError, pickle.PicklingError):
+            # The module stays cached in memory, it will be parsed again by the next build.
+            pass
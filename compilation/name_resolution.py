@@ -0,0 +1,176 @@
+from typing import Dict, List, Tuple, Set
+
+from compilation.models.arrays import Array
+from compilation.models.base import *
+from compilation.models.keywords import Return, If, While
+from compilation.models.operators import DotOperator, ArrayIndexer
+from compilation.models.values import FunctionCall
+
+
+def describe_type(var_type) -> str:
+    """
+    This function describes a type by its name, types are referenced by name and not by their content.
+    :param var_type: the type, arguments hold the name of their type.
+    :return: the description of the type.
+    """
+    if isinstance(var_type, Array):
+        return describe_type(var_type.underlying_type) + "[]" * len(var_type.layers)
+    if isinstance(var_type, Type):
+        return var_type.name
+    return str(var_type)
+
+
+class NameResolver:
+    """
+    Pass that binds every variable mention and function call of a program to its declaration.
+    The names that are visible at every point are indexed while the scopes are walked, so each name is resolved with a
+    single lookup, and later passes read the bound symbol instead of searching the scope chain.
+    Every function also records the declarations outside of it that it refers to.
+    """
+
+    def __init__(self):
+        self.variables: Dict[str, List[Symbol]] = {}
+        self.functions: Dict[str, List[Symbol]] = {}
+        self.symbols: Dict[Tuple[Scope, str, str], Symbol] = {}
+        self.function: Function = None
+        self.local_scopes: Set[Scope] = set()
+        self.dependencies: Dict[str, None] = {}
+
+    def resolve(self, program: Program) -> Program:
+        """
+        This function binds the names of a program.
+        :param program: the program to resolve, the program itself is one of its classes.
+        :return: the program.
+        """
+        for elang_class in program.classes.values():
+            chain = []
+            scope = elang_class.scope
+            while scope is not None:
+                chain.append(scope)
+                scope = scope.parent_scope
+            for scope in chain[::-1]:
+                self.enter(scope)
+            for statement in elang_class.variables_init:
+                self.resolve_statement(statement)
+            for function in elang_class.functions.values():
+                self.resolve_function(function)
+            for scope in chain:
+                self.exit(scope)
+        return program
+
+    def resolve_function(self, function: Function) -> None:
+        arguments = [self.get_symbol("argument", function.scope, argument.name, argument.var_type)
+                     for argument in function.arguments]
+        for symbol in arguments:
+            self.variables.setdefault(symbol.name, []).append(symbol)
+        self.function, self.local_scopes, self.dependencies = function, {function.scope}, {}
+        self.resolve_scopeable(function)
+        function.dependencies = list(self.dependencies)
+        self.function, self.local_scopes, self.dependencies = None, set(), {}
+        for symbol in arguments:
+            self.variables[symbol.name].pop()
+
+    def resolve_scopeable(self, scopeable: Scopeable) -> None:
+        if self.function is not None:
+            self.local_scopes.add(scopeable.scope)
+        self.enter(scopeable.scope)
+        for statement in scopeable.body:
+            self.resolve_statement(statement)
+        self.exit(scopeable.scope)
+
+    def resolve_statement(self, statement: Compilable) -> None:
+        if isinstance(statement, If) or isinstance(statement, While):
+            self.resolve_expression(statement.condition)
+            self.resolve_scopeable(statement)
+        elif isinstance(statement, Return):
+            self.resolve_expression(statement.expression)
+        elif not isinstance(statement, Scopeable):
+            self.resolve_expression(statement)
+
+    def resolve_expression(self, expression: Compilable) -> None:
+        if isinstance(expression, Variable) or isinstance(expression, PointerVariable):
+            expression.symbol = self.lookup(self.variables, expression.name)
+            self.add_dependency(expression.name, expression.symbol, False)
+        elif isinstance(expression, FunctionCall):
+            if expression.constructor_call is None:
+                expression.symbol = self.lookup(self.functions, expression.name)
+                self.add_dependency(expression.name, expression.symbol, True)
+            for argument in expression.arguments:
+                self.resolve_expression(argument)
+        elif isinstance(expression, DotOperator):
+            self.resolve_expression(expression.left)
+            self.resolve_member(expression.right)
+        elif isinstance(expression, BinaryOperator):
+            self.resolve_expression(expression.left)
+            self.resolve_expression(expression.right)
+        elif isinstance(expression, UnaryOperator):
+            self.resolve_expression(expression.obj)
+
+    def resolve_member(self, expression: Compilable) -> None:
+        """
+        This function resolves the right side of a dot operator. Member names are resolved by the type of the left
+        side when the code is generated, only the expressions that are used by the member (arguments and indexes) are
+        bound.
+        :param expression: the right side of the dot operator.
+        :return: None.
+        """
+        if isinstance(expression, FunctionCall):
+            for argument in expression.arguments:
+                self.resolve_expression(argument)
+        elif isinstance(expression, ArrayIndexer):
+            self.resolve_member(expression.left)
+            self.resolve_expression(expression.right)
+        elif not isinstance(expression, Variable) and not isinstance(expression, PointerVariable):
+            self.resolve_expression(expression)
+
+    def add_dependency(self, name: str, symbol: Symbol, is_function: bool) -> None:
+        """
+        This function records a name that the current function refers to, if it is not declared inside the function.
+        :param name: the name.
+        :param symbol: the symbol the name is bound to, None if the name is not declared.
+        :param is_function: whether the name is called as a function.
+        :return: None.
+        """
+        if self.function is None or (symbol is not None and symbol.scope in self.local_scopes):
+            return
+        if symbol is None:
+            dependency = f"{name}: undeclared"
+        elif is_function:
+            dependency = f"{name}: {symbol.scope.defined_functions[name].signature}"
+        else:
+            dependency = f"{name}: {describe_type(symbol.var_type)}"
+        self.dependencies[dependency] = None
+
+    def enter(self, scope: Scope) -> None:
+        for name, entry in scope.defined_variables.items():
+            symbol = self.get_symbol("variable", scope, name, entry["type"], entry.get("define_line"))
+            self.variables.setdefault(name, []).append(symbol)
+        for name, function in scope.defined_functions.items():
+            symbol = self.get_symbol("function", scope, name, function.return_type)
+            self.functions.setdefault(name, []).append(symbol)
+
+    def exit(self, scope: Scope) -> None:
+        for name in scope.defined_variables:
+            self.variables[name].pop()
+        for name in scope.defined_functions:
+            self.functions[name].pop()
+
+    def get_symbol(self, kind: str, scope: Scope, name: str, var_type, define_line: int = None) -> Symbol:
+        """
+        This function returns the symbol of a declaration, every declaration has a single symbol.
+        :param kind: the kind of the declaration ('argument', 'variable' or 'function').
+        :param scope: the scope that holds the declaration.
+        :param name: the declared name.
+        :param var_type: the type of the declaration.
+        :param define_line: the index of the declaration in the body of the scope.
+        :return: the symbol.
+        """
+        key = (scope, name, kind)
+        if key not in self.symbols:
+            self.symbols[key] = Symbol(name, var_type, scope, define_line)
+        return self.symbols[key]
+
+    @staticmethod
+    def lookup(table: Dict[str, List[Symbol]], name: str) -> Symbol:
+        symbols = table.get(name)
+        return symbols[-1] if symbols else None
@@ -1,10 +1,14 @@
-import re
 from typing import *
 import os
+from compilation.lexer import Lexer, Token, TokenStream
 from compilation.parsing_factories.keywords import *
 from compilation.parsing_factories.operators import *
 from compilation.parsing_factories.valid_tokens import *
 from compilation.type_system.primitives import PrimitiveSyntax, get_default_primitives
+from compilation.type_system.registry import TypeRegistry
+from compilation.module_cache import ModuleCache, DEFAULT_CACHE_DIRECTORY
+from compilation.name_resolution import NameResolver
+from compilation.precompiled import PRECOMPILED_EXTENSION, precompile, read_precompiled
 
 
 class Parser:
@@ -13,66 +17,93 @@ class Parser:
     """
 
     @staticmethod
-    def create_default():
+    def create_default(cache_directory: Optional[str] = DEFAULT_CACHE_DIRECTORY):
         """
         This function creates the default parser for the language.
+        :param cache_directory: the directory of the parsed modules cache, None to only cache modules in memory.
         :return: a default parser.
         """
-        keywords = [{"re": re.compile(r"\s*return\s"), "factory": ReturnFactory()},
-                    # Add int array keyword
-                    {"re": re.compile(r"\s*(\w[\w]*)\s+((\w[\w]*)\s*\((.*)\))\s*{\s*"),
-                     "factory": FunctionDeclarationFactory(), "scopeable": True},
-                    {"re": re.compile(r"\s*class\s*(\w[\w]*)\s*{\s*"), "factory": ElangClassDeclarationFactory(),
-                     "scopeable": True},
-                    {"re": re.compile(r"\s*if\s*\((.*)\)\s*{\s*"), "factory": IfFactory(), "scopeable": True},
-                    {"re": re.compile(r"\s*export\s*{\s*"), "factory": ExportFactory(), "scopeable": True},
-                    {"re": re.compile(r"\s*while\s*\((.*)\)\s*{\s*"), "factory": WhileFactory(), "scopeable": True},
-                    {"re": re.compile(r"\s*include\s*{\s*"), "factory": IncludeFactory(), "scopeable": True}]
-        operators = [{"re": re.compile(r"\s*\+\s*"), "factory": AdditionFactory()},
-                     {"re": re.compile(r"\s*-\s*"), "factory": SubtractionFactory()},
-                     {"re": re.compile(r"\s*\*\s*"), "factory": MultiplicationFactory()},
-                     {"re": re.compile(r"\s*/\s*"), "factory": DivisionFactory()},
-                     {"re": re.compile(r"\s*=\s*"), "factory": AssignmentFactory()},
-                     {"re": re.compile(r"\s*==\s"), "factory": EqualFactory()},
-                     {"re": re.compile(r"\s*>\s"), "factory": LogicalGreaterFactory()},
-                     {"re": re.compile(r"\s*and\s"), "factory": LogicalAndFactory()},
-                     {"re": re.compile(r"\s*or\s"), "factory": LogicalOrFactory()},
-                     {"re": re.compile(r"\s*\[(.*)]\s*"), "factory": ArrayIndexerFactory()},
-                     {"re": re.compile(r"\s*\.\s*"), "factory": DotOperatorFactory()},
-                     {"re": re.compile(r"\s*new\s"), "factory": NewOperatorFactory()}]
-        valid_tokens = [{"re": re.compile(r"\s*((\w[\w]*)\s*\((.*)\))\s*"), "factory": FunctionCallFactory()},
-                        {"re": re.compile(r"\s*([a-zA-Z][\w]*)+"), "factory": VariableFactory()},
-                        {"re": re.compile(r"\s*[\d]+"), "factory": DecimalConstantFactory()},
-                        {"re": re.compile(r"\s*\(\s*"), "factory": LeftParenthesisFactory()},
-                        {"re": re.compile(r"\s*\)\s*"), "factory": RightParenthesisFactory()}]
-        return Parser(keywords=keywords, operators=operators, valid_tokens=valid_tokens).add_primitives(
-            get_default_primitives())
-
-    def __init__(self, keywords: [Dict], operators: [Dict], valid_tokens: [Dict]):
+        keywords = {"return": {"factory": ReturnFactory()},
+                    "class": {"factory": ElangClassDeclarationFactory(), "scopeable": True},
+                    "if": {"factory": IfFactory(), "scopeable": True},
+                    "export": {"factory": ExportFactory(), "scopeable": True},
+                    "while": {"factory": WhileFactory(), "scopeable": True},
+                    "include": {"factory": IncludeFactory(), "scopeable": True}}
+        operators = {"+": {"factory": AdditionFactory()},
+                     "-": {"factory": SubtractionFactory()},
+                     "*": {"factory": MultiplicationFactory()},
+                     "/": {"factory": DivisionFactory()},
+                     "=": {"factory": AssignmentFactory()},
+                     "==": {"factory": EqualFactory()},
+                     ">": {"factory": LogicalGreaterFactory()},
+                     "and": {"factory": LogicalAndFactory()},
+                     "or": {"factory": LogicalOrFactory()},
+                     "[": {"factory": ArrayIndexerFactory()},
+                     ".": {"factory": DotOperatorFactory()},
+                     "new": {"factory": NewOperatorFactory()}}
+        valid_tokens = {"function_declaration": {"factory": FunctionDeclarationFactory(), "scopeable": True},
+                        "constructor": {"factory": ConstructorFactory()},
+                        "function_call": {"factory": FunctionCallFactory()},
+                        "variable": {"factory": VariableFactory()},
+                        "number": {"factory": DecimalConstantFactory()},
+                        "(": {"factory": LeftParenthesisFactory()},
+                        ")": {"factory": RightParenthesisFactory()}}
+        return Parser(keywords=keywords, operators=operators, valid_tokens=valid_tokens,
+                      module_cache=ModuleCache(cache_directory)).add_primitives(get_default_primitives())
+
+    def __init__(self, keywords: Dict[str, Dict], operators: Dict[str, Dict], valid_tokens: Dict[str, Dict],
+                 module_cache: ModuleCache = None):
         """
         Initializes a new parser
-        :param keywords: the keywords in the language, expects a regex and an appropriate factory to detect and create
-        a keyword.
-        :param operators: the operators in the language, expects a regex and an appropriate factory to detect and create
-         an operator.
-        :param valid_tokens: the tokens that are valid, but are not an operator or a keyword. expects a regex and an
-        appropriate factory to detect and create the token
+        :param keywords: the keywords in the language, maps a reserved word to an appropriate factory that creates
+        the keyword.
+        :param operators: the operators in the language, maps the operator text to an appropriate factory that creates
+        the operator.
+        :param valid_tokens: the tokens that are valid, but are not an operator or a keyword. maps the kind of the token
+        to an appropriate factory that creates the token
+        :param module_cache: the cache of the included modules, None to parse every include.
         """
         self.keywords = keywords
         self.operators = operators
         self.valid_tokens = valid_tokens
-        self.defined_types = []
-        self.parsed_classes = {}
+        self.lexer = Lexer(keywords=[word for word in list(keywords) + list(operators) if word.isidentifier()],
+                           symbols=[symbol for symbol in list(operators) + list(valid_tokens) + ["{", "}", "]", ";", ","]
+                                    if not symbol.isidentifier()])
+        self.defined_types = TypeRegistry()
+        self.module_cache = module_cache
         self.produced = {}
         self.path = ''
         self.prog_name = ''
 
     def add_primitives(self, primitives_syntax: List[PrimitiveSyntax]):
         for syntax in primitives_syntax:
-            self.keywords.append({"re": syntax.re, "factory": syntax.parsing_factory})
-            self.defined_types.append(syntax.primitive)
+            self.defined_types.register(syntax.primitive.name, syntax.primitive, syntax.parsing_factory)
         return self
 
+    def add_class(self, elang_class: ElangClass):
+        """
+        This function registers a parsed class as a type, both by its name and by its name prefixed with the module.
+        :param elang_class: the parsed class.
+        :return: None.
+        """
+        factory = TypeFactory(elang_class)
+        self.defined_types.register(elang_class.name, elang_class, factory)
+        self.defined_types.register(self.prog_name + '.' + elang_class.name, elang_class, factory)
+
+    def add_module_classes(self, program: Program):
+        """
+        This function registers the classes of a module that was loaded from the cache, as if it was parsed.
+        :param program: the loaded module.
+        :return: None.
+        """
+        for include in program.includes.values():
+            self.add_module_classes(include.program)
+        for name, elang_class in program.classes.items():
+            if elang_class is not program:
+                factory = TypeFactory(elang_class)
+                self.defined_types.register(name[len(program.name) + 1:], elang_class, factory)
+                self.defined_types.register(name, elang_class, factory)
+
     def parse_file(self, file: str) -> [Program]:
         """
         This function parses a file.
@@ -83,76 +114,203 @@ class Parser:
         prog_name = file.split('/')[-1].split('.')[0]
         self.prog_name, self.path = prog_name, file
         global_scope = Scope(prog_name, None)
-        with open(file, "r") as f:
-            source_code = f.read().strip()
-        program = self.parse_source_code(source_code, parent_scope=global_scope, top_level=True,
+        tokens = TokenStream(list(self.tokenize(file)))
+        program = self.parse_source_code(tokens, parent_scope=global_scope, top_level=True,
                                          prog_name=prog_name, path=file)
+        NameResolver().resolve(program)
         self.path, self.prog_name = path, name
         return program
 
-    def parse_source_code(self, source_code: str, parent_scope: Scope, top_level=False, prog_name='', path=''):
+    def tokenize(self, path_or_stream: Union[str, TextIO]) -> Iterator[Token]:
+        """
+        This function lazily splits a source file into tokens, the file is read in chunks so it is never held in memory
+        entirely. The tokens hold their kind, text, offset and line.
+        :param path_or_stream: the path to the source file, or a text stream of the source code.
+        :return: generator of the tokens in the source code.
+        """
+        if isinstance(path_or_stream, str):
+            with open(path_or_stream, "r") as f:
+                yield from self.lexer.scan(f)
+        else:
+            yield from self.lexer.scan(path_or_stream)
+
+    def parse_module(self, file: str) -> Program:
+        """
+        This function parses an included module, parsed modules are reused through the module cache.
+        Precompiled modules are loaded without parsing.
+        :param file: the path to the module, either a source file or a precompiled module.
+        :return: the parsed module.
+        """
+        if file.endswith(PRECOMPILED_EXTENSION):
+            return self.load_precompiled(file)
+        if self.module_cache is None:
+            return self.parse_file(file)
+        program = self.module_cache.load(file)
+        if program is not None:
+            self.add_module_classes(program)
+            return program
+        program = self.parse_file(file)
+        self.module_cache.store(file, program)
+        return program
+
+    def load_precompiled(self, file: str) -> Program:
+        """
+        This function loads a precompiled module, and registers its classes as if it was parsed.
+        :param file: the path to the precompiled module.
+        :return: the module.
+        """
+        program = read_precompiled(file)["program"]
+        self.add_module_classes(program)
+        return program
+
+    def precompile_file(self, file: str, destination: str = None) -> str:
+        """
+        This function parses a file and writes it as a precompiled module, that can be included instead of the source.
+        :param file: the path to the file to precompile.
+        :param destination: the path of the precompiled module, next to the source file by default.
+        :return: the path of the precompiled module.
         """
-        This function parses a source code into tokens.
-        :param source_code: the source code to parse.
+        if destination is None:
+            destination = os.path.splitext(file)[0] + PRECOMPILED_EXTENSION
+        precompile(self.parse_file(file), destination)
+        return destination
+
+    def parse_source_code(self, tokens: TokenStream, parent_scope: Scope, top_level=False, prog_name='', path=''):
+        """
+        This function parses the tokens of a source code into expressions.
+        :param tokens: the tokens to parse.
         :param parent_scope: the scope that hold the source code.
         :return: list of expressions that have been parsed.
         """
         parsed = []
-        while len(source_code) is not 0:
-            source_code = source_code.strip()
-            next_token, match = self.get_maximal_match(source_code)
+        while len(tokens) is not 0:
+            if tokens[0].text == ";":
+                tokens.advance()
+                continue
+            next_token, match = self.get_next_match(tokens)
             if "scopeable" in next_token:
-                # If the maximal token in the line produces a scope.
-                parsed_token, source_code = next_token["factory"].produce(parser=self, source_code=source_code,
-                                                                          parent_scope=parent_scope,
-                                                                          match=match)
+                # If the first token in the line produces a scope.
+                parsed_token, tokens = next_token["factory"].produce(parser=self, tokens=tokens,
+                                                                     parent_scope=parent_scope, match=match)
                 parsed += parsed_token
             else:
-                # Otherwise if the maximal token does not open a scope
-                # The parser will parse an entire line (until ';') and then produce an expression.
-                factory = next_token["factory"]
-                model, source_code = next_token["factory"].produce_shallow(parser=self, source_code=source_code,
-                                                                           parent_scope=parent_scope, match=match)
-                match_models = [] + model
-                while len(source_code) is not 0 and source_code[0] is not ';':
-                    next_token, match = self.get_maximal_match(source_code)
-                    model, source_code = next_token["factory"].produce_shallow(parser=self, source_code=source_code,
-                                                                               parent_scope=parent_scope, match=match)
-                    match_models += model
-                source_code = source_code[1:]
-                parsed += factory.produce(parser=self, source_code=None,
-                                          parent_scope=parent_scope,
-                                          match=match_models)
+                # Otherwise if the first token does not open a scope
+                # The factory produces the statement from the tokens of the entire line (until ';').
+                statement_end = find_statement_end(tokens)
+                parsed += next_token["factory"].produce(parser=self, tokens=tokens.view(tokens.position, statement_end),
+                                                        parent_scope=parent_scope, match=match)
+                tokens.seek(statement_end).advance()
         if top_level:
             return Program(*self.classify_entities(parsed), prog_name, parent_scope)
         return parsed
 
-    def get_maximal_match(self, text: str) -> Tuple[Dict, Match]:
-        """
-        This function find the maximal regex match in the text.
-        Keywords have a priority over valid tokens and operators.
-        :param text: the text to search in.
-        :return: the next maximal match in the text.
-        """
-        maximal_match, token_entry = None, None
-        for token in self.keywords + self.operators:
-            match = token["re"].match(text)
-            if match is not None and (maximal_match is None or len(maximal_match.group(0)) < len(match.group(0))):
-                maximal_match, token_entry = match, token
-        for token in self.valid_tokens:
-            match = token["re"].match(text)
-            valid = True
-            for candidate in self.keywords + self.operators:
-                if candidate["re"].match(text) is not None:
-                    valid = False
-                    break
-            if valid and match is not None and (
-                    maximal_match is None or len(maximal_match.group(0)) < len(match.group(0))):
-                maximal_match, token_entry = match, token
-        return token_entry, maximal_match
+    def parse_expression(self, tokens: TokenStream, parent_scope: Scope, min_precedence: int = 0) -> Compilable:
+        """
+        This function parses tokens that form an expression, such as a condition or a function argument.
+        The expression is parsed by precedence climbing in a single pass over the tokens: operators that bind tighter
+        than the given precedence are folded into the tree, the others are left for the caller.
+        :param tokens: the tokens of the expression, the stream is advanced past the parsed expression.
+        :param parent_scope: the scope that holds the expression.
+        :param min_precedence: the lowest precedence of an operator that belongs to the expression.
+        :return: the expression tree.
+        """
+        left = self.parse_operand(tokens, parent_scope)
+        while len(tokens) is not 0:
+            position = tokens.position
+            next_token, match = self.get_next_match(tokens)
+            models, tokens = next_token["factory"].produce_shallow(parser=self, tokens=tokens,
+                                                                   parent_scope=parent_scope, match=match)
+            operator = models[0]
+            if not isinstance(operator, BinaryOperator) or operator.left is not None:
+                raise Exception("Expected an operator before '{0}' at line {1}".format(match[0].text, match[0].line))
+            if operator.get_precedence() < min_precedence:
+                tokens.seek(position)
+                break
+            # Operators that enclose their right operand (such as the array indexer) produce it themselves.
+            if operator.right is None:
+                operator.right = self.parse_expression(tokens, parent_scope, operator.get_precedence() + 1)
+            operator.left = left
+            left = operator
+        return left
+
+    def parse_operand(self, tokens: TokenStream, parent_scope: Scope) -> Compilable:
+        """
+        This function parses the next operand of an expression, including the unary operators that apply to it.
+        :param tokens: the tokens of the expression, the stream is advanced past the parsed operand.
+        :param parent_scope: the scope that holds the expression.
+        :return: the operand.
+        """
+        if len(tokens) is 0:
+            raise Exception("Expected an expression")
+        next_token, match = self.get_next_match(tokens)
+        models, tokens = next_token["factory"].produce_shallow(parser=self, tokens=tokens,
+                                                               parent_scope=parent_scope, match=match)
+        operand = models[0]
+        # Operators are produced without their operands, while parenthesis produce a complete expression.
+        if isinstance(operand, UnaryOperator) and operand.obj is None:
+            operand.obj = self.parse_expression(tokens, parent_scope, operand.get_precedence() + 1)
+        elif isinstance(operand, BinaryOperator) and operand.left is None:
+            raise Exception("Expected an operand before '{0}' at line {1}".format(match[0].text, match[0].line))
+        return operand
+
+    def get_next_match(self, tokens: TokenStream) -> Tuple[Dict, List[Token]]:
+        """
+        This function finds the entry that produces the next tokens.
+        Keywords have a priority over types, operators and valid tokens.
+        :param tokens: the tokens to match, starting with the next token.
+        :return: the entry of the next match, and the tokens that were matched.
+        """
+        head = tokens[0]
+        if head.kind == "keyword" and head.text in self.keywords:
+            return self.keywords[head.text], tokens.head(1)
+        if head.kind != "identifier" and head.text in self.operators:
+            return self.operators[head.text], tokens.head(1)
+        if head.kind == "number":
+            return self.valid_tokens["number"], tokens.head(1)
+        if head.kind == "identifier":
+            type_length = self.match_type(tokens)
+            name_length = max(type_length, 1)
+            if len(tokens) > name_length + 1 and tokens[name_length].kind == "identifier" \
+                    and tokens[name_length + 1].text == "(":
+                return self.valid_tokens["function_declaration"], tokens.head(name_length + 1)
+            if type_length != 0 and tokens[type_length].text == "(":
+                return self.valid_tokens["constructor"], tokens.head(type_length)
+            if type_length != 0:
+                type_name = "".join(token.text for token in tokens.head(type_length))
+                return self.defined_types.get_entry(type_name), tokens.head(type_length)
+            if len(tokens) > 1 and tokens[1].text == "(":
+                return self.valid_tokens["function_call"], tokens.head(1)
+            return self.valid_tokens["variable"], tokens.head(1)
+        if head.text in self.valid_tokens:
+            return self.valid_tokens[head.text], tokens.head(1)
+        raise Exception("Unexpected token '{0}'".format(head.text))
+
+    def match_type(self, tokens: TokenStream) -> int:
+        """
+        This function matches the longest (possibly dotted) type name at the start of the tokens.
+        A type name must be followed by a variable name, an array declaration or a constructor call.
+        :param tokens: the tokens to match.
+        :return: the amount of tokens in the type name, 0 if the tokens do not start with a type.
+        """
+        type_length, idx, name = 0, 0, ""
+        while idx < len(tokens) and tokens[idx].kind == "identifier":
+            name += tokens[idx].text
+            if idx + 1 < len(tokens) and tokens[idx + 1].kind == "identifier" \
+                    or idx + 1 < len(tokens) and tokens[idx + 1].text in ("[", "("):
+                if self.get_type(name) is not None:
+                    type_length = idx + 1
+            if idx + 1 < len(tokens) and tokens[idx + 1].text == ".":
+                name += "."
+                idx += 2
+            else:
+                break
+        return type_length
 
     def resolve_type(self, name):
-        return [vtype for vtype in self.defined_types if vtype.name == name][0]
+        vtype = self.get_type(name)
+        if vtype is None:
+            raise Exception("Unknown type '{0}'".format(name))
+        return vtype
 
     def classify_entities(self, tokens):
         globals, globals_initialization, functions, classes, exports, includes = [], [], [], [], [], []
@@ -172,6 +330,8 @@ class Parser:
         return globals, globals_initialization, functions, classes, exports, includes
 
     def get_type(self, name):
-        for type in self.defined_types:
-            if type.name == name:
-                return type
+        return self.defined_types.get_type(name)
+
+    def get_class(self, name):
+        vtype = self.get_type(name)
+        return vtype if isinstance(vtype, ElangClass) else None
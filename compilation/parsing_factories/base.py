@@ -1,5 +1,5 @@
 from compilation.models.keywords import *
-from typing import Match
+from compilation.lexer import Token, TokenStream
 
 
 class Factory:
@@ -7,25 +7,26 @@ class Factory:
     Class that produces models based on parsed tokens.
     """
 
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List):
         """
         Produces a model based on a token from the source code, when the model is the first token in the line.
         :param parser: the parser that parsed the token.
-        :param source_code: the source code.
+        :param tokens: the stream of the source code tokens, positioned at the matched token. Factories that do not
+        open a scope receive a view that ends with the line.
         :param parent_scope: the parent scope of the token.
-        :param match: the token that was matched.
+        :param match: the tokens that were matched.
         :return: list of expressions that were created by the match.
         """
         pass
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         """
-        Produces a model for shunting yard purpose, if it not the first token in the line.
+        Produces a model for expression parsing purpose, if it not the first token in the line.
         :param parser: the parser that parsed the token.
-        :param source_code: the source code.
+        :param tokens: the stream of the source code tokens, positioned at the matched token.
         :param parent_scope: the parent scope of the token.
-        :param match: the token that was matched.
-        :return: (expression, source_code) where expression is the produces shallow expression and source_code is the
-        original source code without the current match.
+        :param match: the tokens that were matched.
+        :return: (expression, tokens) where expression is the produces shallow expression and tokens is the stream,
+        advanced past the current match.
         """
         pass
@@ -1,229 +1,191 @@
-import re
-
 from compilation.parsing_factories.base import *
 from compilation.parsing_factories.utils import *
 from compilation.models.keywords import *
-from compilation.shunting_yard import shunting_yard
 from compilation.models.arrays import ArrayInitializer, Array, HeapLayer, StackLayer
-from typing import Match, Tuple
+from typing import Tuple
+import hashlib
 import os
 from compilation.models.values import FunctionCall
 
 
 class IncludeFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        source_code = source_code[len(match.group(0).strip()):].strip()
-        source_end = find_scope_end(source_code)
-        tokens = [token.strip() for token in source_code[:source_end].split(',')]
-        includes = [Include(token) for token in tokens]
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        tokens.advance(len(match) + 1)
+        source_end = find_scope_end(tokens)
+        includes = [Include("".join(token.text for token in include))
+                    for include in split_arguments(tokens.view(tokens.position, source_end))]
         var_declarations = []
         for include in includes:
             dirname = os.path.dirname(parser.path)
             filename = os.path.join(dirname, include.file_name)
-            include.program = parser.parse_file(filename)
+            include.path = filename
+            include.program = parser.parse_module(filename)
             # TODO: change primitive constructor to reference to parser type
             var_declarations.append(VariableDeclaration(include.module_name, include.program))
-        return includes + var_declarations, source_code[source_end + 1:]
+        return includes + var_declarations, tokens.seek(source_end + 1)
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid include statement.")
 
 
 class ExportFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        source_code = source_code[len(match.group(0).strip()):].strip()
-        source_end = find_scope_end(source_code)
-        tokens = [token.strip() for token in source_code[:source_end].split(',')]
-        return [Export(token) for token in tokens], source_code[source_end + 1:]
-
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        tokens.advance(len(match) + 1)
+        source_end = find_scope_end(tokens)
+        exports = [Export("".join(token.text for token in export))
+                   for export in split_arguments(tokens.view(tokens.position, source_end))]
+        return exports, tokens.seek(source_end + 1)
+
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid export statement.")
 
 
 class ConstructorFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List):
         raise Exception("Invalid position for the constructor function")
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        start, end = find_closing_parenthesis(source_code)
-        arguments_list = source_code[start + 1:end - 1].split(',')
-        arguments = []
-        for arg in arguments_list:
-            if len(arg) is not 0:
-                arguments += parser.parse_source_code(arg, parent_scope)
-        constructor_of = None
-        if match.group(1).strip() in parser.parsed_classes:
-            constructor_of = parser.parsed_classes[match.group(1).strip()]
-        return [FunctionCall(match.group(1), arguments, constructor_of=constructor_of)], source_code[end:]
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        start, end = find_closing_parenthesis(tokens)
+        arguments = [parser.parse_expression(arg, parent_scope) for arg in split_arguments(tokens.view(start + 1, end - 1))]
+        class_name = "".join(token.text for token in match)
+        return [FunctionCall(class_name, arguments, constructor_of=parser.get_class(class_name))], tokens.seek(end)
 
 
 class ReturnFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [Return(shunting_yard(match[1:]))]
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        return [Return(parser.parse_expression(tokens.advance(len(match)), parent_scope))]
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [Return(None)], source_code[len(match.group(0)):].strip()
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        return [Return(None)], tokens.advance()
 
 
 class ElangClassDeclarationFactory(Factory):
     def __init__(self):
-        self.subclass_depth = 0
         self.subclass_prefix = []
 
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        source_code = source_code[len(match.group(0).strip()):].strip()
-        source_end = find_scope_end(source_code)
-        scope = Scope(match.group(1), parent_scope)
-        body, member_variables, member_variables_initialization, functions, sub_classes = [], [], [], [], []
-        self.subclass_depth += 1
-        self.subclass_prefix.append(match.group(1).strip())
-        for token in parser.parse_source_code(source_code[0:source_end], scope):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        class_name = tokens[len(match)].text
+        tokens.advance(len(match) + 2)
+        source_end = find_scope_end(tokens)
+        scope = Scope(class_name, parent_scope)
+        member_variables, member_variables_initialization, functions, sub_classes = [], [], [], []
+        self.subclass_prefix.append(class_name)
+        # The body is parsed once, and every token is sorted into its bucket.
+        for token in parser.parse_source_code(tokens.view(tokens.position, source_end), scope):
             if isinstance(token, ElangClass):
-                token.name = ".".join(self.subclass_prefix) + f"{token.name}"
-                parser.keywords.append(
-                    {"re": re.compile(rf"\s*{token.name.strip()}(\s+|\[)"),
-                     "factory": TypeFactory(token)})
-                parser.keywords.append(
-                    {"re": re.compile(rf"\s*({token.name.strip()})\s*\((.*)\)\s*"),
-                     "factory": ConstructorFactory()})
-                parser.keywords.append(
-                    {"re": re.compile(rf"\s*{parser.prog_name}.{token.name.strip()}(\s+|\[)"),
-                     "factory": TypeFactory(token)})
-                parser.keywords.append(
-                    {"re": re.compile(rf"\s*({parser.prog_name}.{token.name.strip()})\s*\((.*)\)\s*"),
-                     "factory": ConstructorFactory()})
                 sub_classes.append(token)
-                parser.parsed_classes[token.name] = token
-                parser.parsed_classes[parser.prog_name + '.' + token.name] = token
-        member_variables = [token for token in parser.parse_source_code(source_code[0:source_end], scope) if
-                            isinstance(token, VariableDeclaration)]
-
-        member_variables_initialization = [token for token in parser.parse_source_code(source_code[0:source_end], scope)
-                                           if not isinstance(token, VariableDeclaration)
-                                           and not isinstance(token, Function) and not isinstance(token, ElangClass)]
-
-        functions = [token for token in parser.parse_source_code(source_code[0:source_end], scope) if
-                     isinstance(token, Function)]
-        elang_class = ElangClass(match.group(1), scope, functions, member_variables,
+            elif isinstance(token, VariableDeclaration):
+                member_variables.append(token)
+            elif isinstance(token, Function):
+                functions.append(token)
+            else:
+                member_variables_initialization.append(token)
+        # Sub classes are named after their enclosing classes (Foo.SubFoo), so they can be referenced by the
+        # following declarations of the enclosing class.
+        elang_class = ElangClass(".".join(self.subclass_prefix), scope, functions, member_variables,
                                  member_variables_initialization, sub_classes)
-        if self.subclass_depth == 1:
-            parser.keywords.append(
-                {"re": re.compile(rf"\s*{match.group(1).strip()}(\s+|\[)"), "factory": TypeFactory(elang_class)})
-            parser.keywords.append(
-                {"re": re.compile(rf"\s*({match.group(1).strip()})\s*\((.*)\)\s*"),
-                 "factory": ConstructorFactory()})
-            parser.keywords.append(
-                {"re": re.compile(rf"\s*{parser.prog_name}.{match.group(1).strip()}(\s+|\[)"),
-                 "factory": TypeFactory(elang_class)})
-            parser.keywords.append(
-                {"re": re.compile(rf"\s*({parser.prog_name}.{match.group(1).strip()})\s*\((.*)\)\s*"),
-                 "factory": ConstructorFactory()})
-            parser.parsed_classes[elang_class.name] = elang_class
-            parser.parsed_classes[parser.prog_name + '.' + elang_class.name] = elang_class
-        self.subclass_depth -= 1
         self.subclass_prefix = self.subclass_prefix[:-1]
+        parser.add_class(elang_class)
+        return [elang_class], tokens.seek(source_end + 1)
 
-        parser.defined_types.append(elang_class)
-        return [elang_class], source_code[source_end + 1:]
-
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid location to declare a class.")
 
 
 class TypeFactory(Factory):
     def __init__(self, type):
         self.type = type
-        self.array_re_lookahead = re.compile(r"(s*\[(.*)]\s*)+")
 
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        if len(match) < 2:
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        models, tokens = self.produce_shallow(parser, tokens, parent_scope, match)
+        if len(tokens) is 0 or tokens[0].kind != "identifier":
             raise Exception("Invalid position of the '{0}' type".format(self.type.name))
-        if len(match) == 2:
-            if isinstance(match[0].var_type, Array):
-                return [VariableDeclaration(match[1].name, match[0].var_type),
-                        ArrayInitializer(match[0].var_type, match[1].name)]
-            else:
-                return [VariableDeclaration(match[1].name, match[0].var_type)]
-
-        if isinstance(match[0].var_type, Array):
-            return [VariableDeclaration(match[1].name, match[0].var_type),
-                    ArrayInitializer(match[0].var_type, match[1].name), shunting_yard(match[1:])]
-        return [VariableDeclaration(match[1].name, match[0].var_type), shunting_yard(match[1:])]
-
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        lookahead_match = self.array_re_lookahead.match(source_code[len(match.group(0)) - 1:])
-        if lookahead_match is None:
-            return [VariableDeclaration(None, self.type)], source_code[len(match.group(0)):].strip()
+        var_type, name = models[0].var_type, tokens[0].text
+        declaration = [VariableDeclaration(name, var_type)]
+        if isinstance(var_type, Array):
+            declaration.append(ArrayInitializer(var_type, name))
+        # The declared variable starts the initialization expression, if there is one.
+        expression = parser.parse_expression(tokens, parent_scope)
+        if isinstance(expression, Variable):
+            return declaration
+        return declaration + [expression]
+
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        tokens.advance(len(match))
+        if len(tokens) is 0 or tokens[0].text != "[":
+            return [VariableDeclaration(None, self.type)], tokens
         last_stack_layer = 0
         stack_settled = False
         layers = []
         brackets_end = 0
-        for idx, brackets in enumerate(find_bracket_pairs(lookahead_match.group(0))):
+        for idx, brackets in enumerate(find_bracket_pairs(tokens)):
             brackets_start, brackets_end = brackets
             if brackets_start == brackets_end - 1 and not stack_settled:
                 last_stack_layer = idx - 1
                 stack_settled = True
-            if brackets_start == brackets_end - 1 and stack_settled:
+            elif brackets_start != brackets_end - 1 and stack_settled:
                 raise Exception(
                     "Cannot use stack dimension declaration after defining array dimension {0} to be heap based.".format(
                         last_stack_layer + 1))
             if brackets_start != brackets_end - 1:
-                layers.append(StackLayer(shunting_yard(
-                    [token for token in
-                     parser.parse_source_code(lookahead_match.group(0)[brackets_start + 1:brackets_end],
-                                              parent_scope)])))
+                layers.append(StackLayer(parser.parse_expression(tokens.view(brackets_start + 1, brackets_end),
+                                                                 parent_scope)))
             else:
                 layers.append(HeapLayer())
-        return [VariableDeclaration(None, Array(self.type, layers))], source_code[len(match.group(0)) + brackets_end:]
+        return [VariableDeclaration(None, Array(self.type, layers))], tokens.seek(brackets_end + 1)
 
 
 class WhileFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]) -> Tuple[List, str]:
-        source_code = source_code[len(match.group(0).strip()):].strip()
-        source_end = find_scope_end(source_code)
-        scope = Scope(match.group(0), parent_scope)
-        body = [token for token in parser.parse_source_code(source_code[0:source_end], scope)]
-        condition = [token for token in parser.parse_source_code(match.group(1), parent_scope)][0]
-        if len(condition) > 1:
-            raise Exception("Too many expression in an 'while' condition")
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]) \
+            -> Tuple[List, TokenStream]:
+        condition_start, condition_end = find_closing_parenthesis(tokens)
+        condition = parser.parse_expression(tokens.view(condition_start + 1, condition_end - 1), parent_scope)
+        tokens.seek(condition_end + 1)
+        source_end = find_scope_end(tokens)
+        scope = Scope("while", parent_scope)
+        body = [token for token in parser.parse_source_code(tokens.view(tokens.position, source_end), scope)]
         populate_scope(scope, body)
-        return [While(scope, body, condition)], source_code[source_end + 1:]
+        return [While(scope, body, condition)], tokens.seek(source_end + 1)
 
 
 class IfFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]) -> Tuple[List, str]:
-        source_code = source_code[len(match.group(0).strip()):].strip()
-        source_end = find_scope_end(source_code)
-        scope = Scope(match.group(0), parent_scope)
-        body = [token for token in parser.parse_source_code(source_code[0:source_end], scope)]
-        condition = [token for token in parser.parse_source_code(match.group(1), parent_scope)]
-        if len(condition) > 1:
-            raise Exception("Too many expressions in an 'if' condition")
-        condition = condition[0]
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]) \
+            -> Tuple[List, TokenStream]:
+        condition_start, condition_end = find_closing_parenthesis(tokens)
+        condition = parser.parse_expression(tokens.view(condition_start + 1, condition_end - 1), parent_scope)
+        tokens.seek(condition_end + 1)
+        source_end = find_scope_end(tokens)
+        scope = Scope("if", parent_scope)
+        body = [token for token in parser.parse_source_code(tokens.view(tokens.position, source_end), scope)]
         populate_scope(scope, body)
 
-        return [If(scope, body, condition)], source_code[source_end + 1:]
+        return [If(scope, body, condition)], tokens.seek(source_end + 1)
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid 'if' statement.")
 
 
 class FunctionDeclarationFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]) -> Tuple[List, str]:
-        source_code = source_code[len(match.group(0).strip()):].strip()
-        scope_end = find_scope_end(source_code)
-        scope = Scope(match.group(0), parent_scope)
-        function_name = match.group(3)
-        function_source = source_code[0:scope_end].strip()
-        function_body = [token for token in parser.parse_source_code(function_source, scope)]
-        function_arguments = [VariableDeclaration(name=arg.strip().split(' ')[1], var_type=arg.strip().split(' ')[0])
-                              for
-                              arg in match.group(4).split(',') if arg is not '']
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]) \
+            -> Tuple[List, TokenStream]:
+        start = tokens.position
+        return_type = "".join(token.text for token in match[:-1])
+        function_name = match[-1].text
+        arguments_start, arguments_end = find_closing_parenthesis(tokens)
+        function_arguments = [VariableDeclaration(name=arg[-1].text,
+                                                  var_type="".join(t.text for t in arg.head(len(arg) - 1)))
+                              for arg in split_arguments(tokens.view(arguments_start + 1, arguments_end - 1))]
+        signature = "{0} {1}({2})".format(return_type, function_name, ", ".join(
+            f"{arg.var_type} {arg.name}" for arg in function_arguments))
+        tokens.seek(arguments_end + 1)
+        scope_end = find_scope_end(tokens)
+        scope = Scope(signature, parent_scope)
+        function_body = [token for token in parser.parse_source_code(tokens.view(tokens.position, scope_end), scope)]
         populate_scope(scope, function_body)
-        f = Function(scope, function_name, match.group(0).strip().replace('{', ''),
-                     parser.resolve_type(match.group(1).strip()), function_body,
-                     function_arguments)
-        return [f], source_code[scope_end + 1:]
+        structure_hash = hashlib.sha256(" ".join(token.text for token in tokens.tokens[start:scope_end + 1]).encode())
+        f = Function(scope, function_name, signature, parser.resolve_type(return_type), function_body,
+                     function_arguments, structure_hash.hexdigest())
+        return [f], tokens.seek(scope_end + 1)
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid location to declare a function.")
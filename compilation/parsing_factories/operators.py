@@ -1,121 +1,122 @@
 from compilation.parsing_factories.base import *
 from compilation.models.operators import *
-from compilation.shunting_yard import shunting_yard
-from typing import Match, Tuple
+from typing import Tuple
 
 from compilation.parsing_factories.utils import find_closing_brackets
 
 
 class AssignmentFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]) -> Tuple[List, str]:
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]) \
+            -> Tuple[List, TokenStream]:
         raise Exception("Invalid placement of the = operator")
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [Assignment()], source_code[len(match.group(0)):].strip()
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        return [Assignment()], tokens.advance()
 
 
 class SubtractionFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid placement of the * operator")
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [SubtractOperator()], source_code[1:]
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        return [SubtractOperator()], tokens.advance()
 
 
 class MultiplicationFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid placement of the * operator")
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [MultiplicationOperator()], source_code[1:]
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        return [MultiplicationOperator()], tokens.advance()
 
 
 class LogicalAndFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid placement of the * operator")
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [LogicalAnd()], source_code[match.span()[1]:]
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        return [LogicalAnd()], tokens.advance()
 
 
 class LogicalOrFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid placement of the * operator")
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [LogicalOr()], source_code[match.span()[1]:]
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        return [LogicalOr()], tokens.advance()
 
 
 class LogicalGreaterFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid placement of the * operator")
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [LogicalGreater()], source_code[match.span()[1]:]
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        return [LogicalGreater()], tokens.advance()
 
 
 class EqualFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid placement of the == operator")
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [Equal()], source_code[match.span()[1]:]
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        return [Equal()], tokens.advance()
 
 
 class DivisionFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid placement of the / operator")
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [DivisionOperator()], source_code[1:]
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        return [DivisionOperator()], tokens.advance()
 
 
 class AdditionFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid placement of the + operator")
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [AdditionOperator()], source_code[1:]
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        return [AdditionOperator()], tokens.advance()
 
 
 class DotOperatorFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid placement of the . operator")
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [DotOperator()], source_code[len(match.group(0)):]
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        return [DotOperator()], tokens.advance()
 
 
 class NewOperatorFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid placement of the 'new' operator")
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [NewOperator()], source_code[len(match.group(0)):]
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        return [NewOperator()], tokens.advance()
 
 
 class LeftParenthesisFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [LeftParenthesis()], source_code[1:]
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        return [parser.parse_expression(tokens, parent_scope)]
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [LeftParenthesis()], source_code[1:]
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        closing = tokens.find_pair(tokens.position)
+        return [parser.parse_expression(tokens.view(tokens.position + 1, closing), parent_scope)], \
+            tokens.seek(closing + 1)
 
 
 class RightParenthesisFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid parenthesis placement")
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        return [RightParenthesis()], source_code[1:]
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        raise Exception("Invalid parenthesis placement")
 
 
 class ArrayIndexerFactory(Factory):
-    def produce(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
+    def produce(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
         raise Exception("Invalid position for the array indexer opeartor")
 
-    def produce_shallow(self, parser: "Parser", source_code: str, parent_scope: Scope, match: [Match]):
-        bracket_start, bracket_end = find_closing_brackets(source_code)
-        index_expression = shunting_yard(
-            [token for token in parser.parse_source_code(source_code[bracket_start + 1:bracket_end - 1], parent_scope)])
-        return [ArrayIndexer(), index_expression], source_code[bracket_end:]
+    def produce_shallow(self, parser: "Parser", tokens: TokenStream, parent_scope: Scope, match: List[Token]):
+        bracket_start, bracket_end = find_closing_brackets(tokens)
+        index = parser.parse_expression(tokens.view(bracket_start + 1, bracket_end - 1), parent_scope)
+        return [ArrayIndexer(right=index)], tokens.seek(bracket_end)
@@ -1,88 +1,91 @@
 from typing import Tuple, List
 
+from compilation.lexer import TokenStream
 from compilation.models.keywords import VariableDeclaration, Function
 
 
-def find_scope_end(source_code: str) -> int:
+def find_scope_end(tokens: TokenStream) -> int:
     """
     This function find where the current scope ends.
-    :param source_code: the source code.
-    :return: the index of the end of the current scope.
+    :param tokens: the tokens of the scope, starting after the '{' that opens it.
+    :return: the position of the '}' that closes the current scope.
     """
-    count, idx = 1, 0
-    while count is not 0:
-        if source_code[idx] == "{":
-            count += 1
-        elif source_code[idx] == "}":
-            count -= 1
-        if count == 0:
-            return idx
-        idx += 1
+    if tokens.position == 0 or tokens.tokens[tokens.position - 1].text != "{":
+        raise Exception("Expected '{{' at line {0}".format(tokens.tokens[tokens.position - 1].line))
+    return tokens.find_pair(tokens.position - 1)
 
 
-def find_closing_parenthesis(source_code: str) -> Tuple[int, int]:
+def find_statement_end(tokens: TokenStream) -> int:
     """
-    This function find the right parenthesis that closes the current parenthesis.
-    :param source_code: the source code
-    :return: the index of the ')' that closes the current '('
+    This function finds where the current statement ends, parenthesis and brackets are skipped entirely.
+    :param tokens: the tokens of the statement, starting with its first token.
+    :return: the position of the ';' that ends the statement, or the end of the tokens.
     """
-    count, idx = 1, 0
-    start = 0
-    first = True
-    while count is not 0:
-        if source_code[idx] == "(" and first:
-            first = False
-            start = idx
-        elif source_code[idx] == "(" and not first:
-            count += 1
-        elif source_code[idx] == ")":
-            count -= 1
-        if count == 0:
-            return start, idx + 1
+    idx = tokens.position
+    while idx < tokens.end and tokens.tokens[idx].text != ";":
+        if tokens.tokens[idx].text in ("(", "["):
+            idx = tokens.find_pair(idx)
         idx += 1
+    return idx
 
 
-def find_closing_brackets(source_code: str) -> Tuple[int, int]:
+def find_closing_parenthesis(tokens: TokenStream) -> Tuple[int, int]:
     """
     This function find the right parenthesis that closes the current parenthesis.
-    :param source_code: the source code
-    :return: the index of the ')' that closes the current '('
+    :param tokens: the tokens of the source code
+    :return: the position of the first '(' and the position after the ')' that closes it.
     """
-    count, idx = 1, 0
-    start = 0
-    first = True
-    while count is not 0:
-        if source_code[idx] == "[" and first:
-            first = False
-            start = idx
-        elif source_code[idx] == "[" and not first:
-            count += 1
-        elif source_code[idx] == "]":
-            count -= 1
-        if count == 0:
-            return start, idx + 1
-        idx += 1
+    return _find_closing(tokens, "(")
+
+
+def find_closing_brackets(tokens: TokenStream) -> Tuple[int, int]:
+    """
+    This function find the right bracket that closes the current bracket.
+    :param tokens: the tokens of the source code
+    :return: the position of the first '[' and the position after the ']' that closes it.
+    """
+    return _find_closing(tokens, "[")
+
+
+def _find_closing(tokens: TokenStream, opening: str) -> Tuple[int, int]:
+    for idx in range(tokens.position, tokens.end):
+        if tokens.tokens[idx].text == opening:
+            return idx, tokens.find_pair(idx) + 1
+    raise Exception("Expected '{0}'".format(opening))
+
+
+def find_bracket_pairs(tokens: TokenStream):
+    """
+    Helper function for array declaration. Finds all of the consecutive pairs of opening and closing brackets at the
+    start of the tokens.
+    :param tokens: the tokens.
+    :return: yields tuples of (start, end) for every bracket, where end is the position of the closing bracket.
+    """
+    idx = tokens.position
+    while idx < tokens.end and tokens.tokens[idx].text == "[":
+        yield idx, tokens.find_pair(idx)
+        idx = tokens.find_pair(idx) + 1
 
 
-def find_bracket_pairs(text: str) -> List[Tuple[int, int]]:
+def split_arguments(tokens: TokenStream) -> List[TokenStream]:
     """
-    Helper function for array indexing and declaration. Finds all pairs of opening and closing brackets in a given text.
-    :param text: the text.
-    :return: yields tuples of (start, end) for every bracket.
+    This function splits a comma separated list of tokens, commas inside of parenthesis or brackets are ignored.
+    :param tokens: the tokens to split.
+    :return: list of views over the tokens between the commas.
     """
-    count, idx = 1, 1
-    start = 0
-    while idx < len(text):
-        if (text[idx] != "[" and text[idx] != "]") and idx is not 0 and count is 0:
-            break
-        if text[idx] == "[":
-            count += 1
-            start = idx
-        if text[idx] == "]":
-            count -= 1
-            if count == 0:
-                yield (start, idx)
+    arguments, start, idx = [], tokens.position, tokens.position
+    while idx < tokens.end:
+        text = tokens.tokens[idx].text
+        if text in ("(", "["):
+            # Nested parenthesis and brackets are skipped entirely.
+            idx = tokens.find_pair(idx)
+        elif text == ",":
+            arguments.append(tokens.view(start, idx))
+            start = idx + 1
         idx += 1
+    if start != tokens.end:
+        arguments.append(tokens.view(start, tokens.end))
+    return arguments
 
 
 def populate_scope(scope, body):
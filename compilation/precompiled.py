@@ -0,0 +1,136 @@
+import gc
+import importlib
+import io
+import os
+import pickle
+import struct
+import tempfile
+import zlib
+from contextlib import contextmanager
+from typing import Callable, Dict, BinaryIO
+
+from compilation.models.base import Program
+
+PRECOMPILED_EXTENSION = ".elangc"
+MAGIC = b"ELANGC"
+# The version must be bumped whenever the layout of the models changes, older modules must be precompiled again.
+FORMAT_VERSION = 5
+HEADER = struct.Struct("<6sH")
+# The packages whose classes a precompiled module may hold, anything else in a module is rejected when it is read.
+MODEL_PACKAGES = ("compilation.models.", "compilation.type_system.")
+
+
+class PrecompiledFormatError(Exception):
+    """
+    Error for files that are not precompiled modules of the current format version.
+    """
+    pass
+
+
+class ModelUnpickler(pickle.Unpickler):
+    """
+    Unpickler that only creates the models of a program. Precompiled modules and cache entries can come from anyone
+    that can write to the include path, so a module that refers to any other class or function, which pickle would
+    call while the module is read, is rejected instead.
+    """
+
+    def find_class(self, module: str, name: str):
+        if module.startswith(MODEL_PACKAGES):
+            model = getattr(importlib.import_module(module), name, None)
+            if isinstance(model, type):
+                return model
+        raise pickle.UnpicklingError(f"Precompiled module refers to {module}.{name}, which is not a model")
+
+
+@contextmanager
+def paused_gc():
+    """
+    Context manager that pauses the garbage collector. Modules hold millions of models, and the collections that are
+    triggered while they are (de)serialized would only rescan them.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def dump_module(entry: Dict, f: BinaryIO) -> None:
+    """
+    This function serializes a precompiled module: a versioned header, followed by the compressed module.
+    :param entry: the module entry, holds the parsed program under 'program' and any metadata of the module.
+    :param f: the binary file to write to.
+    :return: None.
+    """
+    f.write(HEADER.pack(MAGIC, FORMAT_VERSION))
+    with paused_gc():
+        f.write(zlib.compress(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)))
+
+
+def load_module(f: BinaryIO) -> Dict:
+    """
+    This function deserializes a precompiled module.
+    :param f: the binary file to read from.
+    :return: the module entry.
+    """
+    header = f.read(HEADER.size)
+    if len(header) != HEADER.size or HEADER.unpack(header)[0] != MAGIC:
+        raise PrecompiledFormatError("Not a precompiled elang module")
+    version = HEADER.unpack(header)[1]
+    if version != FORMAT_VERSION:
+        raise PrecompiledFormatError("Precompiled module has format version {0}, expected version {1}".format(
+            version, FORMAT_VERSION))
+    try:
+        with paused_gc():
+            return ModelUnpickler(io.BytesIO(zlib.decompress(f.read()))).load()
+    except (zlib.error, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        raise PrecompiledFormatError("Corrupted precompiled module")
+
+
+def write_atomically(path: str, dump: Callable[[BinaryIO], None]) -> None:
+    """
+    This function writes a file, the file is replaced only once it is fully written.
+    :param path: the path of the file.
+    :param dump: the function that writes the content to a binary file.
+    :return: None.
+    """
+    descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            dump(f)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def write_precompiled(path: str, entry: Dict) -> None:
+    """
+    This function writes a precompiled module to a file, the file is replaced only once the module is fully written.
+    :param path: the path of the precompiled module.
+    :param entry: the module entry.
+    :return: None.
+    """
+    write_atomically(path, lambda f: dump_module(entry, f))
+
+
+def read_precompiled(path: str) -> Dict:
+    """
+    This function reads a precompiled module from a file.
+    :param path: the path of the precompiled module.
+    :return: the module entry.
+    """
+    with open(path, "rb") as f:
+        return load_module(f)
+
+
+def precompile(program: Program, path: str) -> None:
+    """
+    This function writes a parsed program as a precompiled module.
+    :param program: the parsed program.
+    :param path: the path of the precompiled module.
+    :return: None.
+    """
+    write_precompiled(path, {"program": program})
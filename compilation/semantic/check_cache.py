@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Set
+
+from compilation.models.base import Function
+from compilation.module_cache import DEFAULT_CACHE_DIRECTORY
+from compilation.precompiled import FORMAT_VERSION, write_atomically
+
+CHECKS_EXTENSION = ".checks"
+# The results are stored as json, which holds only strings and booleans, so reading them never runs code.
+CHECKS_FORMAT_VERSION = 1
+
+
+class CheckCache:
+    """
+    Cache of the results of the function checks, keyed by the structure hash of a function, the declarations outside of
+    the function that it refers to, and the checks that run on it.
+    Unchanged functions keep their results between builds, and a function is checked again when it changes or when a
+    declaration it depends on changes.
+    """
+
+    def __init__(self, directory: Optional[str] = DEFAULT_CACHE_DIRECTORY):
+        """
+        Initializes a new check cache.
+        :param directory: the directory that stores the results, None to keep the results in memory only.
+        """
+        self.directory = directory
+        self.entries: Dict[str, Dict] = {}
+        self.used: Set[str] = set()
+
+    @staticmethod
+    def get_key(function: Function, function_checklist: List) -> Optional[str]:
+        """
+        This function computes the cache key of a function.
+        :param function: the function.
+        :param function_checklist: the checks that run on the function.
+        :return: the cache key of the function, None if the function has no structure hash.
+        """
+        if function.structure_hash is None:
+            return None
+        checks = ",".join(type(checker).__module__ + "." + type(checker).__qualname__ for checker in function_checklist)
+        digest = hashlib.sha256(f"{FORMAT_VERSION}:{checks}:{function.signature}:{function.structure_hash}:".encode())
+        digest.update("\n".join(function.dependencies).encode())
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Optional[List[str]]:
+        """
+        This function loads the result of a function check.
+        :param key: the cache key of the function.
+        :return: the diagnostics of the function, None if the function is not cached.
+        """
+        entry = self.entries.get(key) if key is not None else None
+        if entry is None:
+            return None
+        self.used.add(key)
+        return entry["diagnostics"]
+
+    def store(self, key: str, diagnostics: List[str]) -> None:
+        """
+        This function stores the result of a function check.
+        :param key: the cache key of the function.
+        :param diagnostics: the diagnostics of the function.
+        :return: None.
+        """
+        if key is None:
+            return
+        self.entries[key] = {"passed": len(diagnostics) is 0, "diagnostics": diagnostics}
+        self.used.add(key)
+
+    def read(self, name: str) -> None:
+        """
+        This function reads the stored results of a program, results that are already in memory are kept.
+        :param name: the name of the program.
+        :return: None.
+        """
+        if self.directory is None:
+            return
+        try:
+            with open(os.path.join(self.directory, name + CHECKS_EXTENSION), "rb") as f:
+                stored = json.loads(f.read().decode())
+            if stored["version"] != CHECKS_FORMAT_VERSION:
+                return
+            entries = {key: {"passed": bool(entry["passed"]),
+                             "diagnostics": [str(diagnostic) for diagnostic in entry["diagnostics"]]}
+                       for key, entry in stored["checks"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Missing or stale results are the same as a cache miss.
+            return
+        for key, entry in entries.items():
+            self.entries.setdefault(key, entry)
+
+    def write(self, name: str) -> None:
+        """
+        This function stores the results that were used by the check of a program, results of functions that no
+        longer exist are dropped.
+        :param name: the name of the program.
+        :return: None.
+        """
+        if self.directory is None:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            stored = {"version": CHECKS_FORMAT_VERSION, "checks": {key: self.entries[key] for key in self.used}}
+            write_atomically(os.path.join(self.directory, name + CHECKS_EXTENSION),
+                             lambda f: f.write(json.dumps(stored).encode()))
+        except OSError:
+            # The results stay cached in memory, the functions will be checked again by the next build.
+            pass
+        self.used = set()
@@ -1,22 +1,166 @@
 from compilation.models.base import Program
 from compilation.models.keywords import *
+from compilation.models.operators import DotOperator, ArrayIndexer
+from compilation.models.values import FunctionCall
+from compilation.semantic.check_cache import CheckCache
 from collections import Counter
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Dict, Tuple, Optional
+
+
+class CheckContext:
+    """
+    The state of a single function check, shared by all of the checks that run on the function.
+    """
+
+    def __init__(self, function: Function, program: Program):
+        """
+        Initializes a new check context.
+        :param function: the function that is checked.
+        :param program: the program that holds the function.
+        """
+        self.function = function
+        self.program = program
+        # The index of the statement that is currently walked, for every scope that is currently walked.
+        self.positions: Dict[Scope, int] = {}
+        # Per function state of the checks, keyed by the check.
+        self.data: Dict["FunctionChecker", object] = {}
+        self.diagnostics: List[str] = []
+
+    def report(self, message: str) -> None:
+        """
+        This function reports a semantic error of the function.
+        :param message: the error message.
+        :return: None.
+        """
+        self.diagnostics.append(message)
 
 
 class FunctionChecker:
     """
     Interface defining methods of a semantic function checker.
+    Checks are visitors: every function is walked once, and the hooks of all of the checks are called on the way.
+    A check only overrides the hooks it needs, and reports errors through the context.
     """
 
-    def check(self, function: Function, program: Program):
+    def begin_function(self, function: Function, context: CheckContext) -> None:
+        """
+        This function is called before the function is walked.
+        :param function: the function.
+        :param context: the check context.
+        :return: None.
+        """
+        pass
+
+    def enter_scope(self, scope: Scope, context: CheckContext) -> None:
+        """
+        This function is called when the walk enters a scope of the function, the function scope included.
+        :param scope: the scope.
+        :param context: the check context.
+        :return: None.
+        """
+        pass
+
+    def visit_statement(self, statement: Compilable, context: CheckContext) -> None:
+        """
+        This function is called for every statement of the function, before its expressions are walked.
+        :param statement: the statement.
+        :param context: the check context.
+        :return: None.
+        """
+        pass
+
+    def visit_mention(self, variable: Compilable, context: CheckContext) -> None:
+        """
+        This function is called for every variable that is mentioned by the function. Members on the right side of a dot
+        operator are not mentions.
+        :param variable: the variable or pointer variable.
+        :param context: the check context.
+        :return: None.
+        """
+        pass
+
+    def check(self, function: Function, program: Program) -> None:
         """
         This function checks a parsed function for a certain semantic criteria.
         Throws exception if the function doesn't pass the check.
         :param function: the function to check.
         :return: None.
         """
-        pass
+        diagnostics = FunctionWalker([self]).walk(function, program)
+        if len(diagnostics) is not 0:
+            raise Exception("\n".join(diagnostics))
+
+
+HOOKS = ("begin_function", "enter_scope", "visit_statement", "visit_mention")
+
+
+class FunctionWalker:
+    """
+    Class that walks a function once and dispatches every node to the hooks of all of the checks.
+    Only the hooks that a check overrides are dispatched, so checks that do not look at a node cost nothing on it.
+    """
+
+    def __init__(self, checklist: List[FunctionChecker]):
+        self.hooks = {hook: [getattr(checker, hook) for checker in checklist
+                             if getattr(type(checker), hook) is not getattr(FunctionChecker, hook)]
+                      for hook in HOOKS}
+
+    def walk(self, function: Function, program: Program) -> List[str]:
+        """
+        This function walks a function with all of the checks.
+        :param function: the function to check.
+        :param program: the program that holds the function.
+        :return: the diagnostics of the function, in the order of the walk.
+        """
+        context = CheckContext(function, program)
+        for hook in self.hooks["begin_function"]:
+            hook(function, context)
+        self.walk_scopeable(function, context)
+        return context.diagnostics
+
+    def walk_scopeable(self, scopeable: Scopeable, context: CheckContext) -> None:
+        for hook in self.hooks["enter_scope"]:
+            hook(scopeable.scope, context)
+        for idx, statement in enumerate(scopeable.body):
+            context.positions[scopeable.scope] = idx
+            for hook in self.hooks["visit_statement"]:
+                hook(statement, context)
+            if isinstance(statement, If) or isinstance(statement, While):
+                self.walk_expression(statement.condition, context)
+                self.walk_scopeable(statement, context)
+            elif isinstance(statement, Return):
+                self.walk_expression(statement.expression, context)
+            elif not isinstance(statement, VariableDeclaration) and not isinstance(statement, Scopeable):
+                self.walk_expression(statement, context)
+        context.positions.pop(scopeable.scope, None)
+
+    def walk_expression(self, expression: Compilable, context: CheckContext) -> None:
+        if isinstance(expression, Variable) or isinstance(expression, PointerVariable):
+            for hook in self.hooks["visit_mention"]:
+                hook(expression, context)
+        elif isinstance(expression, FunctionCall):
+            for argument in expression.arguments:
+                self.walk_expression(argument, context)
+        elif isinstance(expression, DotOperator):
+            self.walk_expression(expression.left, context)
+            self.walk_member(expression.right, context)
+        elif isinstance(expression, BinaryOperator):
+            self.walk_expression(expression.left, context)
+            self.walk_expression(expression.right, context)
+        elif isinstance(expression, UnaryOperator):
+            self.walk_expression(expression.obj, context)
+
+    def walk_member(self, expression: Compilable, context: CheckContext) -> None:
+        if isinstance(expression, FunctionCall):
+            for argument in expression.arguments:
+                self.walk_expression(argument, context)
+        elif isinstance(expression, ArrayIndexer):
+            self.walk_member(expression.left, context)
+            self.walk_expression(expression.right, context)
+        elif not isinstance(expression, Variable) and not isinstance(expression, PointerVariable):
+            self.walk_expression(expression, context)
 
 
 class GlobalChecker:
@@ -53,10 +197,11 @@ class FunctionArgumentShadowing(FunctionChecker):
     This semantic check ensures that function arguments are not being shadowed by local defined variables.
     """
 
-    def check(self, function: Function, program: Program) -> None:
-        for variable in function.get_mentions():
-            if variable in [v.name for v in function.arguments] and variable != "this":
-                raise Exception("Function argument {0} is being shadowed by a variable".format(variable))
+    def enter_scope(self, scope: Scope, context: CheckContext) -> None:
+        arguments = [v.name for v in context.function.arguments]
+        for variable in scope.defined_variables:
+            if variable in arguments and variable != "this":
+                context.report("Function argument {0} is being shadowed by a variable".format(variable))
 
 
 class RepeatingArgumentDeclaration(FunctionChecker):
@@ -64,10 +209,10 @@ class RepeatingArgumentDeclaration(FunctionChecker):
     This semantic check ensures that a function argument is not appearing twice.
     """
 
-    def check(self, function: Function, program: Program) -> None:
+    def begin_function(self, function: Function, context: CheckContext) -> None:
         counter = Counter([argument.name for argument in function.arguments])
         if len(function.arguments) is not 0 and counter.most_common(1)[0][1] > 1:
-            raise Exception("Function argument is declared twice")
+            context.report("Function argument is declared twice")
 
 
 class RepeatingVariableDeclaration(FunctionChecker):
@@ -75,16 +220,14 @@ class RepeatingVariableDeclaration(FunctionChecker):
     This semantic check ensures that there are no variables that are declared twice.
     """
 
-    def check(self, function: Function, program: Program) -> None:
-        all_scopes = [function.scope] + function.scope.get_children()
-        vars_declared = []
-        for scope in all_scopes:
-            for key in scope.defined_variables.keys():
-                if key in vars_declared:
-                    raise Exception(
-                        "Variable {0} declared more than once in function {1}".format(key["name"], function.signature))
-                else:
-                    vars_declared.append(key)
+    def enter_scope(self, scope: Scope, context: CheckContext) -> None:
+        vars_declared = context.data.setdefault(self, set())
+        for key in scope.defined_variables.keys():
+            if key in vars_declared:
+                context.report(
+                    "Variable {0} declared more than once in function {1}".format(key, context.function.signature))
+            else:
+                vars_declared.add(key)
 
 
 class VariableDeclarationCheck(FunctionChecker):
@@ -92,30 +235,70 @@ class VariableDeclarationCheck(FunctionChecker):
     This semantic check ensures that variables are declared before they are used.
     """
 
-    def check(self, function: Function, program: Program) -> None:
-        for idx, statement in enumerate(function.body):
-            if isinstance(statement, VariableDeclaration):
-                continue
-            for variable_mention in statement.get_mentions():
-                if variable_mention in [v.name for v in function.arguments]:
-                    continue
-                if variable_mention in program.variables or variable_mention in program.includes:
-                    continue
-                var_entry = function.scope.search_variable(variable_mention)
-                if var_entry is None or (var_entry["scope"] == function.scope and var_entry["define_line"] > idx) or (
-                        var_entry["scope"] != function.scope and var_entry["scope"].is_child_of(function.scope)):
-                    raise Exception(
-                        "Undefined variable {0}, in function {1}".format(variable_mention, function.signature))
+    def visit_mention(self, variable: Compilable, context: CheckContext) -> None:
+        symbol = variable.symbol
+        # A declaration in a scope that is being walked must come before the statement that is being walked.
+        if symbol is None or (symbol.define_line is not None and symbol.scope in context.positions and
+                              symbol.define_line > context.positions[symbol.scope]):
+            context.report(
+                "Undefined variable {0}, in function {1}".format(variable.name, context.function.signature))
+
+
+def get_checked_functions(program: Program) -> List[Tuple[Function, Program]]:
+    """
+    This function lists all of the functions that are checked with a program: the functions of the program, the methods
+    of its classes, and the functions of the modules it includes. The order is deterministic, diagnostics are merged
+    by it.
+    :param program: the program.
+    :return: list of tuples of a function and the program that holds it.
+    """
+    functions, programs, seen = [], [program], {id(program)}
+    while len(programs) is not 0:
+        current = programs.pop(0)
+        for elang_class in current.classes.values():
+            for function in elang_class.functions.values():
+                functions.append((function, current))
+        for include in current.includes.values():
+            if id(include.program) not in seen:
+                seen.add(id(include.program))
+                programs.append(include.program)
+    return functions
+
+
+def check_functions(program: Program, function_checklist: List[FunctionChecker],
+                    indices: List[int]) -> List[Tuple[int, List[str]]]:
+    """
+    This function checks a part of the functions of a program, it is the task of a checking process.
+    :param program: the program.
+    :param function_checklist: the function checks.
+    :param indices: the indices of the functions to check, in the list of the checked functions.
+    :return: list of tuples of the index of a function and its diagnostics.
+    """
+    functions = get_checked_functions(program)
+    walker = FunctionWalker(function_checklist)
+    return [(idx, walker.walk(*functions[idx])) for idx in indices]
 
 
 class SemanticChecker:
     """
     Class that checks an entire program and it's function based on the requested semantic checks.
+    All of the function checks run in a single walk of every function, and the functions can be split between
+    processes. Functions that did not change since the last build are not checked again.
     """
 
-    def __init__(self, function_checklist: List[FunctionChecker] = [], global_checklist: List[GlobalChecker] = []):
+    def __init__(self, function_checklist: List[FunctionChecker] = [], global_checklist: List[GlobalChecker] = [],
+                 workers: int = 1, cache: CheckCache = None):
+        """
+        Initializes a new semantic checker.
+        :param function_checklist: the checks of every function.
+        :param global_checklist: the checks of the entire program.
+        :param workers: the amount of processes that check functions, functions are checked in this process if it is 1.
+        :param cache: the cache of the function check results, None to check every function.
+        """
         self.function_checklist = function_checklist
         self.global_checklist = global_checklist
+        self.workers = workers
+        self.cache = cache
 
     def check(self, program: Program) -> None:
         """
@@ -123,20 +306,61 @@ class SemanticChecker:
         :param program: the program to check.
         :return: None
         """
-        for checker in self.function_checklist:
-            for f_name in program.functions:
-                checker.check(program.functions[f_name], program)
+        diagnostics = self.check_functions(program)
+        if len(diagnostics) is not 0:
+            raise Exception("\n".join(diagnostics))
         for checker in self.global_checklist:
             checker.check(program)
 
+    def check_functions(self, program: Program) -> List[str]:
+        """
+        This function applies the function checks to all of the checked functions of the program.
+        :param program: the program to check.
+        :return: the diagnostics of all of the functions, ordered by function and then by the walk of the function.
+        """
+        functions = get_checked_functions(program)
+        results, pending, keys = [], [], {}
+        if self.cache is not None:
+            self.cache.read(program.name)
+        for idx, (function, _) in enumerate(functions):
+            cached = None
+            if self.cache is not None:
+                keys[idx] = self.cache.get_key(function, self.function_checklist)
+                cached = self.cache.load(keys[idx])
+            if cached is None:
+                pending.append(idx)
+            else:
+                results.append((idx, cached))
+        if self.workers <= 1 or len(pending) <= 1:
+            checked = check_functions(program, self.function_checklist, pending)
+        else:
+            # Every process receives the program once, and checks every n-th function.
+            chunks = [pending[start::self.workers] for start in range(min(self.workers, len(pending)))]
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                checked = [result for chunk in executor.map(check_functions, repeat(program),
+                                                            repeat(self.function_checklist), chunks)
+                           for result in chunk]
+        if self.cache is not None:
+            for idx, function_diagnostics in checked:
+                self.cache.store(keys[idx], function_diagnostics)
+            self.cache.write(program.name)
+        diagnostics = []
+        results += checked
+        for idx, function_diagnostics in sorted(results, key=lambda result: result[0]):
+            diagnostics += function_diagnostics
+        return diagnostics
+
     @staticmethod
-    def create_default() -> "SemanticChecker":
+    def create_default(workers: int = 1, cache_directory: Optional[str] = None) -> "SemanticChecker":
         """
         This function creates a default semantic checker. It has all of the default semantic checks.
+        :param workers: the amount of processes that check functions.
+        :param cache_directory: the directory that stores the check results between builds, None to only cache results
+        in memory.
         :return: a semantic checker.
         """
         return SemanticChecker([VariableDeclarationCheck(), RepeatingArgumentDeclaration(),
                                 RepeatingVariableDeclaration(),
                                 FunctionArgumentShadowing()],
-                               []
+                               [], workers, CheckCache(cache_directory)
                                )
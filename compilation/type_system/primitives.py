@@ -1,4 +1,3 @@
-import re
 from compilation.parsing_factories.keywords import TypeFactory, Type
 from typing import Dict, List
 
@@ -25,15 +24,12 @@ class PrimitiveSyntax:
     Class for identifying primitives.
     """
 
-    def __init__(self, primitive, regex):
+    def __init__(self, primitive):
         """
         Initializes a primitive syntax
         :param primitive: the primitive
-        :param regex: the regex that detects the primitive
-        :param parsing_factory: the factory that parses the primitive
         """
         self.primitive = primitive
-        self.re = regex
         self.parsing_factory = TypeFactory(primitive)
 
 
@@ -42,6 +38,6 @@ def get_default_primitives() -> List[PrimitiveSyntax]:
     This function returns the default primitives of the language.
     :return: list of the primitive syntax of the language.
     """
-    int_syntax = PrimitiveSyntax(Primitive("int"), re.compile(r"\s*int(\s+|\[)"))
-    char_syntax = PrimitiveSyntax(Primitive("char"), re.compile(r"\s*char(\s+|\[)"))
+    int_syntax = PrimitiveSyntax(Primitive("int"))
+    char_syntax = PrimitiveSyntax(Primitive("char"))
     return [int_syntax, char_syntax]
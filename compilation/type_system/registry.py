@@ -0,0 +1,38 @@
+from typing import Dict, Optional
+
+from compilation.type_system.base import Type
+
+
+class TypeRegistry:
+    """
+    Symbol table of the types that are known to the parser.
+    Type names are resolved with a single hash lookup, so resolving a name does not depend on the amount of types.
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, Dict] = {}
+
+    def register(self, name: str, vtype: Type, factory) -> None:
+        """
+        This function registers a type under a name.
+        :param name: the name that references the type.
+        :param vtype: the type.
+        :param factory: the factory that parses declarations of the type.
+        :return: None.
+        """
+        self.entries[name] = {"type": vtype, "factory": factory}
+
+    def get_entry(self, name: str) -> Optional[Dict]:
+        """
+        This function finds the registry entry of a type name.
+        :param name: the name of the type.
+        :return: the entry of the type, None if the name is not a type.
+        """
+        return self.entries.get(name)
+
+    def get_type(self, name: str) -> Optional[Type]:
+        entry = self.entries.get(name)
+        return entry["type"] if entry is not None else None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
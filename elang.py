@@ -1,17 +1,29 @@
 from compilation.parsing import Parser
 from compilation.semantic.semantic_check import *
 from compilation.IA32.compiler import ProgramCompiler
+from compilation.precompiled import PRECOMPILED_EXTENSION
+from compilation.module_cache import DEFAULT_CACHE_DIRECTORY
 import os
 import sys
 
-if not len(sys.argv) == 3:
-    print("Usage: python3 elang.py source_file.elang destination_file.out")
+# Release binaries are built with --unchecked, their indexers do not check their bounds.
+# Builds store parsed modules and check results in the cache directory, unless they are run with --no-cache.
+FLAGS = ("--unchecked", "--no-cache")
+arguments = [argument for argument in sys.argv[1:] if argument not in FLAGS]
+if not len(arguments) == 2:
+    print("Usage: python3 elang.py [--unchecked] [--no-cache] source_file.elang destination_file.out")
 
-source_path = sys.argv[1]
-destination_path = sys.argv[2]
-p = Parser.create_default()
-sc = SemanticChecker.create_default()
+source_path = arguments[0]
+destination_path = arguments[1]
+cache_directory = None if "--no-cache" in sys.argv else DEFAULT_CACHE_DIRECTORY
+p = Parser.create_default(cache_directory=cache_directory)
+if destination_path.endswith(PRECOMPILED_EXTENSION):
+    # Modules that are only included by other modules are precompiled instead of being linked.
+    p.precompile_file(source_path, destination_path)
+    sys.exit(0)
+sc = SemanticChecker.create_default(cache_directory=cache_directory)
 compiler = ProgramCompiler.create_default()
+compiler.bounds_checks = "--unchecked" not in sys.argv
 program = p.parse_file(source_path)
 sc.check(program)
 compiler.compile(program, f"{source_path}.asm")
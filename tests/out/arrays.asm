@@ -1,89 +1,53 @@
-SECTION .text
+section .text
+extern malloc
 global main
-main:
+arrays_run:
 push ebp
 mov ebp, esp
 sub esp, 116
-lea edi, [ebp - 0]
-mov [edi - 0], dword 5
-mov [edi - 4], dword 4
+lea edi, [ebp - 28]
+mov [edi + 0], dword 5
+mov [edi + 4], dword 4
 push 5
-push 1
-
-lea edi, [ebp - 0]
-push edi
-
-pop edi
-pop eax
-mov ebx, [edi]
-cmp eax, ebx
-jb loc_9C5738
-mov eax, 0
-mov ebx, 0
-int 0x80
-loc_9C5738:
-mov ecx, [edi - 4]
-xor edx, edx
-mul ecx
-sub edi, 8
-sub edi, eax
-push edi
-pop edi
+mov eax, 1
+lea edi, [ebp - 28]
+lea edi, [edi + eax * 4 + 8]
 pop eax
 mov [edi], eax
-lea edi, [ebp - 28]
-mov [edi - 0], dword 4
-mov [edi - 4], dword 20
-mov [edi - 8], dword 3
-mov [edi - 12], dword 4
-mov [edi - 28], dword 3
-mov [edi - 32], dword 4
-mov [edi - 48], dword 3
-mov [edi - 52], dword 4
-mov [edi - 68], dword 3
-mov [edi - 72], dword 4
+lea edi, [ebp - 116]
+mov [edi + 0], dword 4
+mov [edi + 4], dword 20
+mov [edi + 8], dword 3
+mov [edi + 12], dword 4
+mov [edi + 28], dword 3
+mov [edi + 32], dword 4
+mov [edi + 48], dword 3
+mov [edi + 52], dword 4
+mov [edi + 68], dword 3
+mov [edi + 72], dword 4
 push 6
 push 2
-
-push 0
-
-lea edi, [ebp - 28]
-push edi
-
-pop edi
-pop eax
-mov ebx, [edi]
-cmp eax, ebx
-jb loc_EDC816
 mov eax, 0
-mov ebx, 0
-int 0x80
-loc_EDC816:
-mov ecx, [edi - 4]
-xor edx, edx
-mul ecx
-sub edi, 8
-sub edi, eax
-push edi
-
-pop edi
+lea edi, [ebp - 116]
+imul eax, eax, 20
+lea edi, [edi + eax + 8]
 pop eax
-mov ebx, [edi]
-cmp eax, ebx
-jb loc_F88D27
-mov eax, 0
-mov ebx, 0
-int 0x80
-loc_F88D27:
-mov ecx, [edi - 4]
-xor edx, edx
-mul ecx
-sub edi, 8
-sub edi, eax
-push edi
-pop edi
+lea edi, [edi + eax * 4 + 8]
 pop eax
 mov [edi], eax
 leave
 ret
+vt_arrays_run:
+jmp arrays_run
+main:
+mov edi, arrays
+push 0
+call malloc
+add esp, 4
+push eax
 
+pop eax
+mov [edi], eax
+call arrays_main
+section .data
+arrays: times 4 db 0
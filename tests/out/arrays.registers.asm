@@ -0,0 +1,48 @@
+section .text
+extern malloc
+global main
+arrays_run:
+push ebp
+mov ebp, esp
+sub esp, 116
+lea edi, [ebp - 28]
+mov [edi + 0], dword 5
+mov [edi + 4], dword 4
+mov eax, 5
+mov ecx, 1
+lea edx, [ebp - 28]
+mov [edx + ecx * 4 + 8], eax
+lea edi, [ebp - 116]
+mov [edi + 0], dword 4
+mov [edi + 4], dword 20
+mov [edi + 8], dword 3
+mov [edi + 12], dword 4
+mov [edi + 28], dword 3
+mov [edi + 32], dword 4
+mov [edi + 48], dword 3
+mov [edi + 52], dword 4
+mov [edi + 68], dword 3
+mov [edi + 72], dword 4
+mov edx, 6
+mov eax, 2
+mov ecx, 0
+lea ebx, [ebp - 116]
+imul ecx, ecx, 20
+lea ebx, [ebx + ecx + 8]
+mov [ebx + eax * 4 + 8], edx
+leave
+ret
+vt_arrays_run:
+jmp arrays_run
+main:
+mov edi, arrays
+push 0
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call arrays_main
+section .data
+arrays: times 4 db 0
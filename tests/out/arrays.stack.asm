@@ -0,0 +1,53 @@
+section .text
+extern malloc
+global main
+arrays_run:
+push ebp
+mov ebp, esp
+sub esp, 116
+lea edi, [ebp - 28]
+mov [edi + 0], dword 5
+mov [edi + 4], dword 4
+push 5
+mov eax, 1
+lea edi, [ebp - 28]
+lea edi, [edi + eax * 4 + 8]
+pop eax
+mov [edi], eax
+lea edi, [ebp - 116]
+mov [edi + 0], dword 4
+mov [edi + 4], dword 20
+mov [edi + 8], dword 3
+mov [edi + 12], dword 4
+mov [edi + 28], dword 3
+mov [edi + 32], dword 4
+mov [edi + 48], dword 3
+mov [edi + 52], dword 4
+mov [edi + 68], dword 3
+mov [edi + 72], dword 4
+push 6
+push 2
+mov eax, 0
+lea edi, [ebp - 116]
+imul eax, eax, 20
+lea edi, [edi + eax + 8]
+pop eax
+lea edi, [edi + eax * 4 + 8]
+pop eax
+mov [edi], eax
+leave
+ret
+vt_arrays_run:
+jmp arrays_run
+main:
+mov edi, arrays
+push 0
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call arrays_main
+section .data
+arrays: times 4 db 0
@@ -1,14 +1,10 @@
-section .data
-a_global_foo: times 4 db 0
-classes: times 4 db 0
 section .text
 extern malloc
 global main
 classes.Bar_Bar_Func:
 push ebp
 mov ebp, esp
-push 5
-pop eax
+mov eax, 5
 leave
 ret
 vt_classes.Bar_Bar_Func:
@@ -22,14 +18,10 @@ add esp, 4
 push eax
 
 lea edi, [ebp + 8]
-push edi
-pop eax
+mov eax, edi
 mov eax, [eax]
-push eax
-pop eax
 add eax, 4
-push eax
-pop edi
+mov edi, eax
 pop eax
 mov [edi], eax
 leave
@@ -48,10 +40,7 @@ ret
 init_classes.Foo:
 push ebp
 mov ebp, esp
-lea edi, [ebp + 8]
-mov edi, [edi]
-push edi
-pop eax
+mov eax, [ebp + 8]
 lea edi, [eax + 8]
 mov [edi + 0], dword 5
 mov [edi + 4], dword 4
@@ -88,15 +77,9 @@ push eax
 call vt_classes.Foo_constructor
 add esp, 4
 
-lea edi, [ebp - 4]
-push edi
-pop edi
-pop eax
-mov [edi], eax
-lea edi, [ebp - 4]
-mov edi, [edi]
-push edi
 pop eax
+mov [ebp - 4], eax
+mov eax, [ebp - 4]
 leave
 ret
 classes_main:
@@ -105,14 +88,10 @@ mov ebp, esp
 call classes_get_a_foo
 push eax
 lea edi, [ebp + 8]
-push edi
-pop eax
+mov eax, edi
 mov eax, [eax]
-push eax
-pop eax
 add eax, 0
-push eax
-pop edi
+mov edi, eax
 pop eax
 mov [edi], eax
 leave
@@ -128,4 +107,9 @@ call malloc
 add esp, 4
 push eax
 
+pop eax
+mov [edi], eax
 call classes_main
+section .data
+a_global_foo: times 4 db 0
+classes: times 4 db 0
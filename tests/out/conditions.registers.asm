@@ -0,0 +1,139 @@
+section .text
+extern malloc
+global main
+conditions_touch:
+push ebp
+mov ebp, esp
+mov eax, DWORD [calls]
+add eax, 1
+mov DWORD [calls], eax
+mov eax, 1
+leave
+ret
+conditions_main:
+push ebp
+mov ebp, esp
+sub esp, 16
+mov ebx, 0
+mov esi, 0
+jmp loc_conditions_main_whilecondition1
+loc_conditions_main_while0:
+cmp ebx, 8
+ja loc_conditions_main_or3
+cmp ebx, 3
+jne loc_conditions_main_endif2
+push ebx
+push esi
+call conditions_touch
+pop esi
+pop ebx
+cmp eax, 1
+jne loc_conditions_main_endif2
+loc_conditions_main_or3:
+mov eax, esi
+add eax, 1
+mov esi, eax
+loc_conditions_main_endif2:
+cmp ebx, 5
+jbe loc_conditions_main_and6
+cmp ebx, 10
+jb loc_conditions_main_or5
+loc_conditions_main_and6:
+cmp ebx, 0
+jne loc_conditions_main_endif4
+loc_conditions_main_or5:
+mov eax, esi
+add eax, 100
+mov esi, eax
+loc_conditions_main_endif4:
+mov eax, ebx
+add eax, 1
+mov ebx, eax
+loc_conditions_main_whilecondition1:
+cmp ebx, 12
+jb loc_conditions_main_while0
+jmp loc_conditions_main_whilecondition8
+loc_conditions_main_while7:
+mov eax, ebx
+sub eax, 1
+mov ebx, eax
+loc_conditions_main_whilecondition8:
+cmp ebx, 3
+jbe loc_conditions_main_and9
+cmp ebx, 4
+je loc_conditions_main_while7
+push ebx
+push esi
+call conditions_touch
+pop esi
+pop ebx
+cmp eax, 1
+je loc_conditions_main_while7
+loc_conditions_main_and9:
+mov edi, 3
+mov eax, ebx
+add eax, 2
+mov [ebp - 16], eax
+mov eax, [ebp - 16]
+mov ecx, edi
+cmp eax, ecx
+jbe loc_conditions_main_endif10
+mov ecx, esi
+add ecx, 1000
+mov esi, ecx
+loc_conditions_main_endif10:
+mov ecx, [ebp - 16]
+cmp edi, ecx
+jbe loc_conditions_main_endif11
+mov ecx, esi
+add ecx, 2000
+mov esi, ecx
+loc_conditions_main_endif11:
+jmp loc_conditions_main_whilecondition13
+loc_conditions_main_while12:
+mov ecx, edi
+sub ecx, 1
+mov edi, ecx
+loc_conditions_main_whilecondition13:
+push ebx
+push esi
+push edi
+call conditions_touch
+mov ecx, eax
+pop edi
+pop esi
+pop ebx
+cmp edi, ecx
+ja loc_conditions_main_while12
+mov ecx, edi
+imul ecx, ecx, 100000000
+mov eax, ebx
+imul eax, eax, 1000000
+mov edx, DWORD [calls]
+imul edx, edx, 10000
+push edx
+mov edx, esi
+add edx, DWORD [esp]
+add esp, 4
+add edx, eax
+add edx, ecx
+mov eax, edx
+leave
+ret
+vt_conditions_touch:
+jmp conditions_touch
+vt_conditions_main:
+jmp conditions_main
+main:
+mov edi, conditions
+push 4
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call conditions_main
+section .data
+calls: times 4 db 0
+conditions: times 4 db 0
@@ -0,0 +1,140 @@
+section .text
+extern malloc
+global main
+conditions_touch:
+push ebp
+mov ebp, esp
+mov eax, DWORD [calls]
+add eax, 1
+mov DWORD [calls], eax
+mov eax, 1
+leave
+ret
+conditions_main:
+push ebp
+mov ebp, esp
+sub esp, 16
+mov DWORD [ebp - 4], 0
+mov DWORD [ebp - 8], 0
+jmp loc_conditions_main_whilecondition1
+loc_conditions_main_while0:
+mov eax, [ebp - 4]
+cmp eax, 8
+ja loc_conditions_main_or3
+mov eax, [ebp - 4]
+cmp eax, 3
+jne loc_conditions_main_endif2
+call conditions_touch
+cmp eax, 1
+jne loc_conditions_main_endif2
+loc_conditions_main_or3:
+mov eax, [ebp - 8]
+add eax, 1
+mov [ebp - 8], eax
+loc_conditions_main_endif2:
+mov eax, [ebp - 4]
+cmp eax, 5
+jbe loc_conditions_main_and6
+mov eax, [ebp - 4]
+cmp eax, 10
+jb loc_conditions_main_or5
+loc_conditions_main_and6:
+mov eax, [ebp - 4]
+cmp eax, 0
+jne loc_conditions_main_endif4
+loc_conditions_main_or5:
+mov eax, [ebp - 8]
+add eax, 100
+mov [ebp - 8], eax
+loc_conditions_main_endif4:
+mov eax, [ebp - 4]
+add eax, 1
+mov [ebp - 4], eax
+loc_conditions_main_whilecondition1:
+mov eax, [ebp - 4]
+cmp eax, 12
+jb loc_conditions_main_while0
+jmp loc_conditions_main_whilecondition8
+loc_conditions_main_while7:
+mov eax, [ebp - 4]
+sub eax, 1
+mov [ebp - 4], eax
+loc_conditions_main_whilecondition8:
+mov eax, [ebp - 4]
+cmp eax, 3
+jbe loc_conditions_main_and9
+mov eax, [ebp - 4]
+cmp eax, 4
+je loc_conditions_main_while7
+call conditions_touch
+cmp eax, 1
+je loc_conditions_main_while7
+loc_conditions_main_and9:
+mov DWORD [ebp - 12], 3
+mov eax, [ebp - 4]
+add eax, 2
+mov [ebp - 16], eax
+mov eax, [ebp - 16]
+mov ebx, [ebp - 12]
+cmp eax, ebx
+jbe loc_conditions_main_endif10
+mov eax, [ebp - 8]
+add eax, 1000
+mov [ebp - 8], eax
+loc_conditions_main_endif10:
+mov eax, [ebp - 12]
+mov ebx, [ebp - 16]
+cmp eax, ebx
+jbe loc_conditions_main_endif11
+mov eax, [ebp - 8]
+add eax, 2000
+mov [ebp - 8], eax
+loc_conditions_main_endif11:
+jmp loc_conditions_main_whilecondition13
+loc_conditions_main_while12:
+mov eax, [ebp - 12]
+sub eax, 1
+mov [ebp - 12], eax
+loc_conditions_main_whilecondition13:
+mov edi, [ebp - 12]
+push edi
+call conditions_touch
+mov ebx, eax
+pop eax
+cmp eax, ebx
+ja loc_conditions_main_while12
+mov eax, [ebp - 12]
+imul eax, eax, 100000000
+push eax
+mov eax, [ebp - 4]
+imul eax, eax, 1000000
+push eax
+mov eax, DWORD [calls]
+imul eax, eax, 10000
+push eax
+mov eax, [ebp - 8]
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+leave
+ret
+vt_conditions_touch:
+jmp conditions_touch
+vt_conditions_main:
+jmp conditions_main
+main:
+mov edi, conditions
+push 4
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call conditions_main
+section .data
+calls: times 4 db 0
+conditions: times 4 db 0
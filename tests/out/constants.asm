@@ -0,0 +1,59 @@
+section .text
+extern malloc
+global main
+constants_get:
+push ebp
+mov ebp, esp
+mov eax, 7
+leave
+ret
+constants_main:
+push ebp
+mov ebp, esp
+sub esp, 52
+lea edi, [ebp - 40]
+mov [edi + 0], dword 6
+mov [edi + 4], dword 4
+mov DWORD [ebp - 44], 0
+mov DWORD [ebp - 48], 0
+mov eax, [ebp - 44]
+add eax, 6
+mov [ebp - 44], eax
+jmp loc_constants_main_whilecondition2
+loc_constants_main_while1:
+call constants_get
+push eax
+mov eax, [ebp - 44]
+pop ebx
+add eax, ebx
+add eax, 9
+mov [ebp - 44], eax
+mov eax, [ebp - 48]
+add eax, 1
+mov [ebp - 48], eax
+loc_constants_main_whilecondition2:
+mov eax, [ebp - 48]
+cmp eax, 3
+jb loc_constants_main_while1
+mov eax, [ebp - 44]
+add eax, 1
+mov [ebp - 44], eax
+mov eax, [ebp - 44]
+leave
+ret
+vt_constants_get:
+jmp constants_get
+vt_constants_main:
+jmp constants_main
+main:
+mov edi, constants
+push 0
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call constants_main
+section .data
+constants: times 4 db 0
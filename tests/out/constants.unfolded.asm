@@ -0,0 +1,97 @@
+section .text
+extern malloc
+global main
+constants_get:
+push ebp
+mov ebp, esp
+mov eax, 7
+add eax, 0
+leave
+ret
+constants_main:
+push ebp
+mov ebp, esp
+sub esp, 52
+mov eax, 2
+lea eax, [eax + eax * 2]
+mov [ebp - 4], eax
+mov eax, [ebp - 4]
+add eax, 4
+sub eax, 1
+mov [ebp - 8], eax
+lea edi, [ebp - 40]
+mov [edi + 0], dword 6
+mov [edi + 4], dword 4
+mov DWORD [ebp - 44], 0
+mov DWORD [ebp - 48], 0
+mov eax, [ebp - 8]
+mov ecx, 3
+xor edx, edx
+div ecx
+mov [ebp - 52], eax
+mov eax, 1
+cmp eax, 1
+jne loc_constants_main_endif0
+mov eax, [ebp - 4]
+push eax
+mov eax, [ebp - 44]
+pop ebx
+add eax, ebx
+mov [ebp - 44], eax
+loc_constants_main_endif0:
+mov eax, 0
+cmp eax, 1
+jbe loc_constants_main_endif1
+mov DWORD [ebp - 44], 1000
+loc_constants_main_endif1:
+jmp loc_constants_main_whilecondition3
+loc_constants_main_while2:
+mov DWORD [ebp - 44], 2000
+loc_constants_main_whilecondition3:
+jmp loc_constants_main_whilecondition5
+loc_constants_main_while4:
+mov edi, [ebp - 8]
+push edi
+call constants_get
+push eax
+mov eax, [ebp - 44]
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+mov [ebp - 44], eax
+mov eax, [ebp - 48]
+add eax, 1
+mov [ebp - 48], eax
+loc_constants_main_whilecondition5:
+mov eax, [ebp - 52]
+mov ebx, [ebp - 48]
+cmp eax, ebx
+ja loc_constants_main_while4
+mov eax, 0
+sub eax, 1
+cmp eax, 5
+jbe loc_constants_main_endif6
+mov eax, [ebp - 44]
+add eax, 1
+mov [ebp - 44], eax
+loc_constants_main_endif6:
+mov eax, [ebp - 44]
+leave
+ret
+vt_constants_get:
+jmp constants_get
+vt_constants_main:
+jmp constants_main
+main:
+mov edi, constants
+push 0
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call constants_main
+section .data
+constants: times 4 db 0
@@ -1,11 +1,30 @@
-SECTION .text
+section .text
 extern malloc
 global main
-;ElangClassTemplateFactory
-;FunctionTemplateFactory
-main:
+exports.Foo_check:
+push ebp
+mov ebp, esp
+mov eax, 5
+leave
+ret
+vt_exports.Foo_check:
+jmp exports.Foo_check
+exports_check:
 push ebp
 mov ebp, esp
 leave
 ret
+vt_exports_check:
+jmp exports_check
+main:
+mov edi, exports
+push 0
+call malloc
+add esp, 4
+push eax
 
+pop eax
+mov [edi], eax
+call exports_main
+section .data
+exports: times 4 db 0
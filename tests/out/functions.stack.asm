@@ -0,0 +1,55 @@
+section .text
+extern malloc
+global main
+functions_logical_operators:
+push ebp
+mov ebp, esp
+mov eax, 1
+leave
+ret
+functions_return_i_plus_j:
+push ebp
+mov ebp, esp
+sub esp, 8
+mov eax, 11
+leave
+ret
+functions_this_function_calls_i_plus_j:
+push ebp
+mov ebp, esp
+call functions_return_i_plus_j
+leave
+ret
+functions_run:
+push ebp
+mov ebp, esp
+sub esp, 12
+call functions_logical_operators
+mov [ebp - 4], eax
+call functions_return_i_plus_j
+mov [ebp - 8], eax
+call functions_this_function_calls_i_plus_j
+mov [ebp - 12], eax
+mov eax, 1
+leave
+ret
+vt_functions_logical_operators:
+jmp functions_logical_operators
+vt_functions_return_i_plus_j:
+jmp functions_return_i_plus_j
+vt_functions_this_function_calls_i_plus_j:
+jmp functions_this_function_calls_i_plus_j
+vt_functions_run:
+jmp functions_run
+main:
+mov edi, functions
+push 0
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call functions_main
+section .data
+functions: times 4 db 0
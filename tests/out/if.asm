@@ -1,40 +1,32 @@
-section .data
-global_var: db 4 dup ?
 section .text
 extern malloc
 global main
-if_run:
+if_main:
 push ebp
 mov ebp, esp
 sub esp, 4
-push 0
-lea edi, [ebp - 4]
-pop eax
-mov [edi], eax
-push 5
-mov edi, global_var
-pop eax
-mov DWORD [edi], eax
-push 6
-mov edi, DWORD [global_var]
-push edi
-pop ebx
-pop eax
-xor ecx, ecx
-cmp eax, ebx
-jbe loc_41173F
-mov ecx, 1
-loc_41173F:
-push ecx
-pop eax
-test eax, eax
-jz loc_9B820E
-push 5
-lea edi, [ebp - 4]
-pop eax
-mov [edi], eax
-loc_9B820E:
+mov DWORD [ebp - 4], 0
+mov DWORD [global_var], 5
+mov eax, DWORD [global_var]
+cmp eax, 6
+jae loc_if_main_endif0
+mov eax, 5
+mov [ebp - 4], eax
+loc_if_main_endif0:
 leave
 ret
-vt_if_run:
-jmp if_run
+vt_if_main:
+jmp if_main
+main:
+mov edi, if
+push 4
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call if_main
+section .data
+global_var: times 4 db 0
+if: times 4 db 0
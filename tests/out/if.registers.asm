@@ -0,0 +1,32 @@
+section .text
+extern malloc
+global main
+if_main:
+push ebp
+mov ebp, esp
+sub esp, 4
+mov ebx, 0
+mov DWORD [global_var], 5
+mov eax, DWORD [global_var]
+cmp eax, 6
+jae loc_if_main_endif0
+mov eax, 5
+mov ebx, eax
+loc_if_main_endif0:
+leave
+ret
+vt_if_main:
+jmp if_main
+main:
+mov edi, if
+push 4
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call if_main
+section .data
+global_var: times 4 db 0
+if: times 4 db 0
@@ -1,14 +1,10 @@
-section .data
-exports: times 4 db 0
-includes: times 4 db 0
 section .text
 extern malloc
 global main
 exports.Foo_check:
 push ebp
 mov ebp, esp
-push 5
-pop eax
+mov eax, 5
 leave
 ret
 vt_exports.Foo_check:
@@ -24,29 +20,20 @@ includes_main:
 push ebp
 mov ebp, esp
 sub esp, 8
-mov edi, exports
-push edi
-pop eax
+mov eax, exports
 mov eax, [eax]
 push eax
 call vt_exports_check
-push eax
-lea edi, [ebp - 4]
-pop eax
-mov [edi], eax
+mov [ebp - 4], eax
 push 0
 call malloc
 add esp, 4
 push eax
 
-lea edi, [ebp - 8]
-push edi
-pop edi
 pop eax
-mov [edi], eax
+mov [ebp - 8], eax
 lea edi, [ebp - 8]
-push edi
-pop eax
+mov eax, edi
 mov eax, [eax]
 push eax
 call vt_exports.Foo_check
@@ -73,3 +60,6 @@ push eax
 pop eax
 mov [edi], eax
 call includes_main
+section .data
+exports: times 4 db 0
+includes: times 4 db 0
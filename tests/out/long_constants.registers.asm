@@ -0,0 +1,29 @@
+section .text
+extern malloc
+global main
+long_constants_main:
+push ebp
+mov ebp, esp
+sub esp, 8
+mov ebx, 3
+mov esi, 0
+mov eax, ebx
+add eax, 1
+mov ebx, eax
+mov eax, 900
+leave
+ret
+vt_long_constants_main:
+jmp long_constants_main
+main:
+mov edi, long_constants
+push 0
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call long_constants_main
+section .data
+long_constants: times 4 db 0
@@ -0,0 +1,30 @@
+section .text
+extern malloc
+global main
+long_constants_main:
+push ebp
+mov ebp, esp
+sub esp, 8
+mov DWORD [ebp - 4], 3
+mov DWORD [ebp - 8], 0
+mov eax, [ebp - 4]
+add eax, 1
+mov [ebp - 4], eax
+mov DWORD [ebp - 8], 900
+mov eax, [ebp - 8]
+leave
+ret
+vt_long_constants_main:
+jmp long_constants_main
+main:
+mov edi, long_constants
+push 0
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call long_constants_main
+section .data
+long_constants: times 4 db 0
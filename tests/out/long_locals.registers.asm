@@ -0,0 +1,928 @@
+section .text
+extern malloc
+global main
+long_locals_main:
+push ebp
+mov ebp, esp
+sub esp, 8
+mov ebx, 3
+mov esi, 0
+mov eax, ebx
+add eax, 1
+mov ebx, eax
+mov eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+add eax, ebx
+leave
+ret
+vt_long_locals_main:
+jmp long_locals_main
+main:
+mov edi, long_locals
+push 0
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call long_locals_main
+section .data
+long_locals: times 4 db 0
@@ -0,0 +1,3625 @@
+section .text
+extern malloc
+global main
+long_locals_main:
+push ebp
+mov ebp, esp
+sub esp, 8
+mov DWORD [ebp - 4], 3
+mov DWORD [ebp - 8], 0
+mov eax, [ebp - 4]
+add eax, 1
+mov [ebp - 4], eax
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov edi, [ebp - 4]
+push edi
+mov ebx, [ebp - 4]
+mov eax, [ebp - 4]
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+mov [ebp - 8], eax
+mov eax, [ebp - 8]
+leave
+ret
+vt_long_locals_main:
+jmp long_locals_main
+main:
+mov edi, long_locals
+push 0
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call long_locals_main
+section .data
+long_locals: times 4 db 0
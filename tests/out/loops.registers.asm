@@ -0,0 +1,103 @@
+section .text
+extern malloc
+global main
+loops_seven:
+push ebp
+mov ebp, esp
+mov eax, 7
+leave
+ret
+loops_main:
+push ebp
+mov ebp, esp
+sub esp, 24
+mov ebx, 0
+mov esi, 0
+mov edi, 1
+jmp loc_loops_main_whilecondition1
+loc_loops_main_while0:
+mov eax, ebx
+shr eax, 1
+push eax
+push ebx
+push esi
+push edi
+call loops_seven
+mov ecx, eax
+pop edi
+pop esi
+pop ebx
+pop eax
+mov edx, ebx
+lea edx, [edx + edx * 2]
+push edx
+mov edx, esi
+add edx, DWORD [esp]
+add esp, 4
+add edx, ecx
+sub edx, eax
+mov esi, edx
+cmp ebx, 4
+je loc_loops_main_or3
+cmp ebx, 7
+jne loc_loops_main_endif2
+loc_loops_main_or3:
+mov edx, edi
+shl edx, 1
+add edx, 1
+mov edi, edx
+loc_loops_main_endif2:
+mov edx, ebx
+shl edx, 3
+add edx, 2
+lea edx, [edx + edx * 2]
+mov eax, edi
+sub eax, edx
+mov edx, esi
+sub edx, eax
+mov eax, ebx
+add eax, 3
+sub eax, 3
+mov ecx, ebx
+add ecx, 2
+push ecx
+mov ecx, ebx
+add ecx, 1
+imul ecx, DWORD [esp]
+add esp, 4
+imul ecx, eax
+add ecx, edx
+mov edx, DWORD [total]
+add edx, ecx
+mov DWORD [total], edx
+mov edx, ebx
+add edx, 1
+mov ebx, edx
+loc_loops_main_whilecondition1:
+cmp ebx, 10
+jb loc_loops_main_while0
+mov edx, DWORD [total]
+mov ecx, edi
+imul ecx, ecx, 1000
+mov eax, esi
+add eax, ecx
+add eax, edx
+leave
+ret
+vt_loops_seven:
+jmp loops_seven
+vt_loops_main:
+jmp loops_main
+main:
+mov edi, loops
+push 4
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call loops_main
+section .data
+total: times 4 db 0
+loops: times 4 db 0
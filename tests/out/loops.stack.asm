@@ -0,0 +1,117 @@
+section .text
+extern malloc
+global main
+loops_seven:
+push ebp
+mov ebp, esp
+mov eax, 7
+leave
+ret
+loops_main:
+push ebp
+mov ebp, esp
+sub esp, 24
+mov DWORD [ebp - 4], 0
+mov DWORD [ebp - 8], 0
+mov DWORD [ebp - 12], 1
+jmp loc_loops_main_whilecondition1
+loc_loops_main_while0:
+mov eax, [ebp - 4]
+shr eax, 1
+push eax
+call loops_seven
+push eax
+mov eax, [ebp - 4]
+lea eax, [eax + eax * 2]
+push eax
+mov eax, [ebp - 8]
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+pop ebx
+sub eax, ebx
+mov [ebp - 8], eax
+mov eax, [ebp - 4]
+cmp eax, 4
+je loc_loops_main_or3
+mov eax, [ebp - 4]
+cmp eax, 7
+jne loc_loops_main_endif2
+loc_loops_main_or3:
+mov eax, [ebp - 12]
+shl eax, 1
+add eax, 1
+mov [ebp - 12], eax
+loc_loops_main_endif2:
+mov eax, [ebp - 4]
+shl eax, 3
+add eax, 2
+lea eax, [eax + eax * 2]
+push eax
+mov eax, [ebp - 12]
+pop ebx
+sub eax, ebx
+push eax
+mov eax, [ebp - 8]
+pop ebx
+sub eax, ebx
+push eax
+mov eax, [ebp - 4]
+add eax, 3
+sub eax, 3
+push eax
+mov eax, [ebp - 4]
+add eax, 2
+push eax
+mov eax, [ebp - 4]
+add eax, 1
+pop ecx
+xor edx, edx
+mul ecx
+pop ecx
+xor edx, edx
+mul ecx
+pop ebx
+add eax, ebx
+push eax
+mov eax, DWORD [total]
+pop ebx
+add eax, ebx
+mov DWORD [total], eax
+mov eax, [ebp - 4]
+add eax, 1
+mov [ebp - 4], eax
+loc_loops_main_whilecondition1:
+mov eax, [ebp - 4]
+cmp eax, 10
+jb loc_loops_main_while0
+mov edi, DWORD [total]
+push edi
+mov eax, [ebp - 12]
+imul eax, eax, 1000
+push eax
+mov eax, [ebp - 8]
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+leave
+ret
+vt_loops_seven:
+jmp loops_seven
+vt_loops_main:
+jmp loops_main
+main:
+mov edi, loops
+push 4
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call loops_main
+section .data
+total: times 4 db 0
+loops: times 4 db 0
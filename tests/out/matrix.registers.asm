@@ -0,0 +1,272 @@
+section .text
+extern malloc
+global main
+matrix_main:
+push ebp
+mov ebp, esp
+sub esp, 372
+lea edi, [ebp - 120]
+mov [edi + 0], dword 4
+mov [edi + 4], dword 28
+mov [edi + 8], dword 5
+mov [edi + 12], dword 4
+mov [edi + 36], dword 5
+mov [edi + 40], dword 4
+mov [edi + 64], dword 5
+mov [edi + 68], dword 4
+mov [edi + 92], dword 5
+mov [edi + 96], dword 4
+lea edi, [ebp - 228]
+mov [edi + 0], dword 5
+mov [edi + 4], dword 20
+mov [edi + 8], dword 3
+mov [edi + 12], dword 4
+mov [edi + 28], dword 3
+mov [edi + 32], dword 4
+mov [edi + 48], dword 3
+mov [edi + 52], dword 4
+mov [edi + 68], dword 3
+mov [edi + 72], dword 4
+mov [edi + 88], dword 3
+mov [edi + 92], dword 4
+lea edi, [ebp - 316]
+mov [edi + 0], dword 4
+mov [edi + 4], dword 20
+mov [edi + 8], dword 3
+mov [edi + 12], dword 4
+mov [edi + 28], dword 3
+mov [edi + 32], dword 4
+mov [edi + 48], dword 3
+mov [edi + 52], dword 4
+mov [edi + 68], dword 3
+mov [edi + 72], dword 4
+lea edi, [ebp - 356]
+mov [edi + 0], dword 8
+mov [edi + 4], dword 4
+mov ebx, 0
+mov esi, 0
+mov edi, 0
+mov DWORD [ebp - 372], 0
+jmp loc_matrix_main_whilecondition1
+loc_matrix_main_while0:
+mov esi, 0
+jmp loc_matrix_main_whilecondition3
+loc_matrix_main_while2:
+mov eax, ebx
+add eax, esi
+mov ecx, esi
+mov edx, ebx
+push edx
+lea edx, [ebp - 120]
+push edx
+mov edx, [edx + 4]
+imul edx, [esp + 4]
+add edx, [esp]
+add edx, 8
+add esp, 4
+add esp, 4
+mov [edx + ecx * 4 + 8], eax
+mov edx, esi
+add edx, 1
+mov esi, edx
+loc_matrix_main_whilecondition3:
+cmp esi, 5
+jb loc_matrix_main_while2
+mov edx, ebx
+add edx, 1
+mov ebx, edx
+loc_matrix_main_whilecondition1:
+cmp ebx, 4
+jb loc_matrix_main_while0
+mov ebx, 0
+jmp loc_matrix_main_whilecondition5
+loc_matrix_main_while4:
+mov esi, 0
+jmp loc_matrix_main_whilecondition7
+loc_matrix_main_while6:
+mov edx, ebx
+imul edx, esi
+add edx, 1
+mov eax, esi
+mov ecx, ebx
+push ecx
+lea ecx, [ebp - 228]
+push ecx
+mov ecx, [ecx + 4]
+imul ecx, [esp + 4]
+add ecx, [esp]
+add ecx, 8
+add esp, 4
+add esp, 4
+mov [ecx + eax * 4 + 8], edx
+mov ecx, esi
+add ecx, 1
+mov esi, ecx
+loc_matrix_main_whilecondition7:
+cmp esi, 3
+jb loc_matrix_main_while6
+mov ecx, ebx
+add ecx, 1
+mov ebx, ecx
+loc_matrix_main_whilecondition5:
+cmp ebx, 5
+jb loc_matrix_main_while4
+mov ecx, 0
+mov ebx, ecx
+jmp loc_matrix_main_whilecondition9
+loc_matrix_main_while8:
+mov ecx, 0
+mov esi, ecx
+jmp loc_matrix_main_whilecondition11
+loc_matrix_main_while10:
+mov ecx, 0
+mov edx, esi
+mov eax, ebx
+push eax
+lea eax, [ebp - 316]
+push eax
+mov eax, [eax + 4]
+imul eax, [esp + 4]
+add eax, [esp]
+add eax, 8
+add esp, 4
+add esp, 4
+mov [eax + edx * 4 + 8], ecx
+mov edi, 0
+jmp loc_matrix_main_whilecondition13
+loc_matrix_main_while12:
+mov eax, esi
+mov ecx, edi
+lea edx, [ebp - 228]
+imul ecx, ecx, 20
+lea edx, [edx + ecx + 8]
+mov edx, [edx + eax * 4 + 8]
+mov eax, edi
+mov ecx, ebx
+push ecx
+lea ecx, [ebp - 120]
+push ecx
+mov ecx, [ecx + 4]
+imul ecx, [esp + 4]
+add ecx, [esp]
+add ecx, 8
+add esp, 4
+add esp, 4
+mov ecx, [ecx + eax * 4 + 8]
+imul ecx, edx
+mov edx, esi
+mov eax, ebx
+push eax
+lea eax, [ebp - 316]
+push eax
+mov eax, [eax + 4]
+imul eax, [esp + 4]
+add eax, [esp]
+add eax, 8
+add esp, 4
+add esp, 4
+mov eax, [eax + edx * 4 + 8]
+add eax, ecx
+mov ecx, esi
+mov edx, ebx
+push edx
+lea edx, [ebp - 316]
+push edx
+mov edx, [edx + 4]
+imul edx, [esp + 4]
+add edx, [esp]
+add edx, 8
+add esp, 4
+add esp, 4
+mov [edx + ecx * 4 + 8], eax
+mov edx, edi
+add edx, 1
+mov edi, edx
+loc_matrix_main_whilecondition13:
+cmp edi, 5
+jb loc_matrix_main_while12
+mov edx, ebx
+lea edx, [edx + edx * 2]
+add edx, esi
+add edx, 1
+mov eax, esi
+mov ecx, ebx
+push ecx
+lea ecx, [ebp - 316]
+push ecx
+mov ecx, [ecx + 4]
+imul ecx, [esp + 4]
+add ecx, [esp]
+add ecx, 8
+add esp, 4
+add esp, 4
+mov ecx, [ecx + eax * 4 + 8]
+imul ecx, edx
+mov edx, [ebp - 372]
+add edx, ecx
+mov [ebp - 372], edx
+mov edx, esi
+add edx, 1
+mov esi, edx
+loc_matrix_main_whilecondition11:
+cmp esi, 3
+jb loc_matrix_main_while10
+mov edx, ebx
+add edx, 1
+mov ebx, edx
+loc_matrix_main_whilecondition9:
+cmp ebx, 4
+jb loc_matrix_main_while8
+mov ebx, 0
+jmp loc_matrix_main_whilecondition15
+loc_matrix_main_while14:
+mov edx, ebx
+add edx, 1
+mov ebx, edx
+mov edx, ebx
+imul edx, ebx
+mov ecx, ebx
+lea eax, [ebp - 356]
+cmp ecx, 8
+jb loc_matrix_main_inbounds16
+mov eax, 0
+mov ebx, 0
+int 0x80
+loc_matrix_main_inbounds16:
+mov [eax + ecx * 4 + 8], edx
+loc_matrix_main_whilecondition15:
+cmp ebx, 7
+jb loc_matrix_main_while14
+mov eax, ebx
+lea edx, [ebp - 356]
+cmp eax, 8
+jb loc_matrix_main_inbounds17
+mov eax, 0
+mov ebx, 0
+int 0x80
+loc_matrix_main_inbounds17:
+mov edx, [edx + eax * 4 + 8]
+imul edx, edx, 10000000
+mov eax, 7
+lea ecx, [ebp - 356]
+mov ecx, [ecx + eax * 4 + 8]
+imul ecx, ecx, 100000
+mov eax, [ebp - 372]
+add eax, ecx
+add eax, edx
+leave
+ret
+vt_matrix_main:
+jmp matrix_main
+main:
+mov edi, matrix
+push 0
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call matrix_main
+section .data
+matrix: times 4 db 0
@@ -0,0 +1,301 @@
+section .text
+extern malloc
+global main
+matrix_main:
+push ebp
+mov ebp, esp
+sub esp, 372
+lea edi, [ebp - 120]
+mov [edi + 0], dword 4
+mov [edi + 4], dword 28
+mov [edi + 8], dword 5
+mov [edi + 12], dword 4
+mov [edi + 36], dword 5
+mov [edi + 40], dword 4
+mov [edi + 64], dword 5
+mov [edi + 68], dword 4
+mov [edi + 92], dword 5
+mov [edi + 96], dword 4
+lea edi, [ebp - 228]
+mov [edi + 0], dword 5
+mov [edi + 4], dword 20
+mov [edi + 8], dword 3
+mov [edi + 12], dword 4
+mov [edi + 28], dword 3
+mov [edi + 32], dword 4
+mov [edi + 48], dword 3
+mov [edi + 52], dword 4
+mov [edi + 68], dword 3
+mov [edi + 72], dword 4
+mov [edi + 88], dword 3
+mov [edi + 92], dword 4
+lea edi, [ebp - 316]
+mov [edi + 0], dword 4
+mov [edi + 4], dword 20
+mov [edi + 8], dword 3
+mov [edi + 12], dword 4
+mov [edi + 28], dword 3
+mov [edi + 32], dword 4
+mov [edi + 48], dword 3
+mov [edi + 52], dword 4
+mov [edi + 68], dword 3
+mov [edi + 72], dword 4
+lea edi, [ebp - 356]
+mov [edi + 0], dword 8
+mov [edi + 4], dword 4
+mov DWORD [ebp - 360], 0
+mov DWORD [ebp - 364], 0
+mov DWORD [ebp - 368], 0
+mov DWORD [ebp - 372], 0
+jmp loc_matrix_main_whilecondition1
+loc_matrix_main_while0:
+mov DWORD [ebp - 364], 0
+jmp loc_matrix_main_whilecondition3
+loc_matrix_main_while2:
+mov ebx, [ebp - 364]
+mov eax, [ebp - 360]
+add eax, ebx
+push eax
+mov edi, [ebp - 364]
+push edi
+mov edi, [ebp - 360]
+push edi
+lea edi, [ebp - 120]
+pop eax
+imul eax, eax, 28
+lea edi, [edi + eax + 8]
+pop eax
+lea edi, [edi + eax * 4 + 8]
+pop eax
+mov [edi], eax
+mov eax, [ebp - 364]
+add eax, 1
+mov [ebp - 364], eax
+loc_matrix_main_whilecondition3:
+mov eax, [ebp - 364]
+cmp eax, 5
+jb loc_matrix_main_while2
+mov eax, [ebp - 360]
+add eax, 1
+mov [ebp - 360], eax
+loc_matrix_main_whilecondition1:
+mov eax, [ebp - 360]
+cmp eax, 4
+jb loc_matrix_main_while0
+mov DWORD [ebp - 360], 0
+jmp loc_matrix_main_whilecondition5
+loc_matrix_main_while4:
+mov DWORD [ebp - 364], 0
+jmp loc_matrix_main_whilecondition7
+loc_matrix_main_while6:
+mov ecx, [ebp - 364]
+mov eax, [ebp - 360]
+xor edx, edx
+mul ecx
+add eax, 1
+push eax
+mov edi, [ebp - 364]
+push edi
+mov edi, [ebp - 360]
+push edi
+lea edi, [ebp - 228]
+pop eax
+imul eax, eax, 20
+lea edi, [edi + eax + 8]
+pop eax
+lea edi, [edi + eax * 4 + 8]
+pop eax
+mov [edi], eax
+mov eax, [ebp - 364]
+add eax, 1
+mov [ebp - 364], eax
+loc_matrix_main_whilecondition7:
+mov eax, [ebp - 364]
+cmp eax, 3
+jb loc_matrix_main_while6
+mov eax, [ebp - 360]
+add eax, 1
+mov [ebp - 360], eax
+loc_matrix_main_whilecondition5:
+mov eax, [ebp - 360]
+cmp eax, 5
+jb loc_matrix_main_while4
+mov DWORD [ebp - 360], 0
+jmp loc_matrix_main_whilecondition9
+loc_matrix_main_while8:
+mov DWORD [ebp - 364], 0
+jmp loc_matrix_main_whilecondition11
+loc_matrix_main_while10:
+push 0
+mov edi, [ebp - 364]
+push edi
+mov edi, [ebp - 360]
+push edi
+lea edi, [ebp - 316]
+pop eax
+imul eax, eax, 20
+lea edi, [edi + eax + 8]
+pop eax
+lea edi, [edi + eax * 4 + 8]
+pop eax
+mov [edi], eax
+mov DWORD [ebp - 368], 0
+jmp loc_matrix_main_whilecondition13
+loc_matrix_main_while12:
+mov edi, [ebp - 364]
+push edi
+mov edi, [ebp - 368]
+push edi
+lea edi, [ebp - 228]
+pop eax
+imul eax, eax, 20
+lea edi, [edi + eax + 8]
+pop eax
+lea edi, [edi + eax * 4 + 8]
+push DWORD [edi]
+mov edi, [ebp - 368]
+push edi
+mov edi, [ebp - 360]
+push edi
+lea edi, [ebp - 120]
+pop eax
+imul eax, eax, 28
+lea edi, [edi + eax + 8]
+pop eax
+lea edi, [edi + eax * 4 + 8]
+mov eax, DWORD [edi]
+pop ecx
+xor edx, edx
+mul ecx
+push eax
+mov edi, [ebp - 364]
+push edi
+mov edi, [ebp - 360]
+push edi
+lea edi, [ebp - 316]
+pop eax
+imul eax, eax, 20
+lea edi, [edi + eax + 8]
+pop eax
+lea edi, [edi + eax * 4 + 8]
+mov eax, DWORD [edi]
+pop ebx
+add eax, ebx
+push eax
+mov edi, [ebp - 364]
+push edi
+mov edi, [ebp - 360]
+push edi
+lea edi, [ebp - 316]
+pop eax
+imul eax, eax, 20
+lea edi, [edi + eax + 8]
+pop eax
+lea edi, [edi + eax * 4 + 8]
+pop eax
+mov [edi], eax
+mov eax, [ebp - 368]
+add eax, 1
+mov [ebp - 368], eax
+loc_matrix_main_whilecondition13:
+mov eax, [ebp - 368]
+cmp eax, 5
+jb loc_matrix_main_while12
+mov edi, [ebp - 364]
+push edi
+mov eax, [ebp - 360]
+lea eax, [eax + eax * 2]
+pop ebx
+add eax, ebx
+add eax, 1
+push eax
+mov edi, [ebp - 364]
+push edi
+mov edi, [ebp - 360]
+push edi
+lea edi, [ebp - 316]
+pop eax
+imul eax, eax, 20
+lea edi, [edi + eax + 8]
+pop eax
+lea edi, [edi + eax * 4 + 8]
+mov eax, DWORD [edi]
+pop ecx
+xor edx, edx
+mul ecx
+push eax
+mov eax, [ebp - 372]
+pop ebx
+add eax, ebx
+mov [ebp - 372], eax
+mov eax, [ebp - 364]
+add eax, 1
+mov [ebp - 364], eax
+loc_matrix_main_whilecondition11:
+mov eax, [ebp - 364]
+cmp eax, 3
+jb loc_matrix_main_while10
+mov eax, [ebp - 360]
+add eax, 1
+mov [ebp - 360], eax
+loc_matrix_main_whilecondition9:
+mov eax, [ebp - 360]
+cmp eax, 4
+jb loc_matrix_main_while8
+mov DWORD [ebp - 360], 0
+jmp loc_matrix_main_whilecondition15
+loc_matrix_main_while14:
+mov eax, [ebp - 360]
+add eax, 1
+mov [ebp - 360], eax
+mov ecx, [ebp - 360]
+mov eax, [ebp - 360]
+xor edx, edx
+mul ecx
+push eax
+mov edi, [ebp - 360]
+push edi
+lea edi, [ebp - 356]
+pop eax
+lea edi, [edi + eax * 4 + 8]
+pop eax
+mov [edi], eax
+loc_matrix_main_whilecondition15:
+mov eax, [ebp - 360]
+cmp eax, 7
+jb loc_matrix_main_while14
+mov edi, [ebp - 360]
+push edi
+lea edi, [ebp - 356]
+pop eax
+lea edi, [edi + eax * 4 + 8]
+mov eax, DWORD [edi]
+imul eax, eax, 10000000
+push eax
+mov eax, 7
+lea edi, [ebp - 356]
+lea edi, [edi + eax * 4 + 8]
+mov eax, DWORD [edi]
+imul eax, eax, 100000
+push eax
+mov eax, [ebp - 372]
+pop ebx
+add eax, ebx
+pop ebx
+add eax, ebx
+leave
+ret
+vt_matrix_main:
+jmp matrix_main
+main:
+mov edi, matrix
+push 0
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call matrix_main
+section .data
+matrix: times 4 db 0
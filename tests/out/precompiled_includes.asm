@@ -0,0 +1,65 @@
+section .text
+extern malloc
+global main
+exports.Foo_check:
+push ebp
+mov ebp, esp
+mov eax, 5
+leave
+ret
+vt_exports.Foo_check:
+jmp exports.Foo_check
+exports_check:
+push ebp
+mov ebp, esp
+leave
+ret
+vt_exports_check:
+jmp exports_check
+precompiled_includes_main:
+push ebp
+mov ebp, esp
+sub esp, 8
+mov eax, exports
+mov eax, [eax]
+push eax
+call vt_exports_check
+mov [ebp - 4], eax
+push 0
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [ebp - 8], eax
+lea edi, [ebp - 8]
+mov eax, edi
+mov eax, [eax]
+push eax
+call vt_exports.Foo_check
+push eax
+leave
+ret
+vt_precompiled_includes_main:
+jmp precompiled_includes_main
+main:
+mov edi, precompiled_includes
+push 4
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+mov edi, exports
+push 0
+call malloc
+add esp, 4
+push eax
+
+pop eax
+mov [edi], eax
+call precompiled_includes_main
+section .data
+exports: times 4 db 0
+precompiled_includes: times 4 db 0
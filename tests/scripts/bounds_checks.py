@@ -0,0 +1,20 @@
+from compilation.parsing import Parser
+from compilation.semantic.semantic_check import *
+from compilation.IA32.compiler import ProgramCompiler
+
+p = Parser.create_default()
+sc = SemanticChecker.create_default()
+# The kernel returns 494905910, with or without bounds checks. The indexes of the matrices are bounded by the loop
+# conditions, only the two indexes of d that follow the increment of i keep their check.
+program = p.parse_file("../src/matrix.elang")
+sc.check(program)
+for backend in ["stack", "registers"]:
+    for bounds_checks in [True, False]:
+        compiler = ProgramCompiler.create_default(backend)
+        compiler.bounds_checks = bounds_checks
+        destination = f"../out/matrix.{backend}.asm" if bounds_checks else f"../out/matrix.{backend}.unchecked.asm"
+        compiler.compile(program, destination)
+        with open(destination) as f:
+            checks = f.read().count("int 0x80")
+        if checks != (2 if bounds_checks else 0):
+            raise Exception(f"{destination} has {checks} bounds checks")
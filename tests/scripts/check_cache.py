@@ -0,0 +1,72 @@
+import os
+import tempfile
+from typing import List
+
+from compilation.parsing import Parser
+from compilation.semantic.semantic_check import *
+from compilation.semantic.check_cache import CheckCache
+
+SOURCE = """
+int helper({arguments}) {{
+    return 1;
+}}
+int caller() {{
+    return helper();
+}}
+int other() {{
+    int x = 2;
+    return x;
+}}
+int main() {{
+    return other();
+}}
+"""
+
+checked = []
+
+
+class RecordingCheck(FunctionChecker):
+    """
+    Check that records the functions that are checked, instead of loaded from the cache.
+    """
+
+    def begin_function(self, function, context) -> None:
+        checked.append(function.name)
+
+
+def build(directory: str, arguments: str) -> List[str]:
+    """
+    This function checks the program as a new build does, with a cache that starts from the results on the disk.
+    :return: the names of the functions that were checked.
+    """
+    path = os.path.join(directory, "rebuilt.elang")
+    with open(path, "w") as f:
+        f.write(SOURCE.format(arguments=arguments))
+    program = Parser.create_default(cache_directory=None).parse_file(path)
+    checker = SemanticChecker(SemanticChecker.create_default().function_checklist + [RecordingCheck()],
+                              cache=CheckCache(os.path.join(directory, "cache")))
+    checked.clear()
+    checker.check(program)
+    return sorted(set(checked))
+
+
+with tempfile.TemporaryDirectory() as directory:
+    if build(directory, "") != ["caller", "helper", "main", "other"]:
+        raise Exception("The first build did not check every function")
+    if build(directory, "") != []:
+        raise Exception("A build without changes checked functions again")
+    # The signature of helper changes, so helper and the functions that call it are checked again.
+    if build(directory, "int unused") != ["caller", "helper"]:
+        raise Exception("A changed signature did not check exactly its function and its callers again")
+
+# The default checker keeps its results in memory, and writes nothing to the working directory.
+with tempfile.TemporaryDirectory() as directory:
+    program = Parser.create_default(cache_directory=None).parse_file("../src/conditions.elang")
+    previous_directory = os.getcwd()
+    os.chdir(directory)
+    try:
+        SemanticChecker.create_default().check(program)
+    finally:
+        os.chdir(previous_directory)
+    if len(os.listdir(directory)) is not 0:
+        raise Exception("The default checker wrote to the working directory")
@@ -0,0 +1,26 @@
+import os
+import sys
+import tempfile
+import time
+
+from compilation.parsing import Parser
+from compilation.IA32.compiler import ProgramCompiler
+from parsing_benchmark import generate_source
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [2 ** 14, 2 ** 17, 2 ** 20]
+    workers = os.cpu_count() or 1
+    print(f"{'size (KB)':>10} {'backend':>10} {'1 proc (s)':>10} {f'{workers} procs':>10}")
+    for size in sizes:
+        with tempfile.NamedTemporaryFile("w", suffix=".elang", delete=False) as source_file:
+            source_file.write(generate_source(size))
+        program = Parser.create_default(cache_directory=None).parse_file(source_file.name)
+        os.remove(source_file.name)
+        for backend in ["stack", "registers"]:
+            timings = []
+            for compiler in [ProgramCompiler.create_default(backend), ProgramCompiler.create_default(backend, workers)]:
+                start = time.perf_counter()
+                compiler.compile(program, source_file.name + ".asm")
+                timings.append(time.perf_counter() - start)
+            os.remove(source_file.name + ".asm")
+            print(f"{size // 2 ** 10:>10} {backend:>10} {timings[0]:>10.3f} {timings[1]:>10.3f}")
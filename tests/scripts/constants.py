@@ -0,0 +1,23 @@
+from compilation.parsing import Parser
+from semantic.semantic_check import *
+from compilation.IA32.compiler import ProgramCompiler
+
+p = Parser.create_default()
+sc = SemanticChecker.create_default()
+compiler = ProgramCompiler.create_default()
+program = p.parse_file("../src/constants.elang")
+sc.check(program)
+compiler.compile(program, "../out/constants.asm")
+
+# The compiler folds a copy, the program keeps its constants for a compiler that does not fold.
+unfolded = ProgramCompiler.create_default()
+unfolded.constant_folder = None
+parsed = p.parse_file("../src/constants.elang")
+sc.check(parsed)
+unfolded.compile(parsed, "../out/constants.unfolded.asm")
+with open("../out/constants.unfolded.asm") as file:
+    expected = file.read()
+unfolded.compile(program, "../out/constants.unfolded.asm")
+with open("../out/constants.unfolded.asm") as file:
+    if file.read() != expected:
+        raise Exception("Compiling the program folded its constants")
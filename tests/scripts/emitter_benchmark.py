@@ -0,0 +1,58 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from compilation.parsing import Parser
+from compilation.IA32.compiler import ProgramCompiler
+from compilation.IA32.emitter import Emitter
+from parsing_benchmark import generate_source
+
+
+def compile_in_memory(compiler: ProgramCompiler, program, destination_file: str) -> None:
+    """
+    This function compiles a program into a single string before it is written, as the compiler did before it
+    streamed its output.
+    """
+    if compiler.constant_folder is not None:
+        program = compiler.fold_constants(program)
+    bundle = {"scope": program.scope, "size_bundle": compiler.size_bundle, "program": program,
+              "verbose": compiler.verbose, "branch_conditions": compiler.branch_conditions,
+              "bounds_checks": compiler.bounds_checks}
+    emitter = Emitter()
+    data_segment, init_statements = compiler.compile_program(program, bundle, emitter)
+    text_segment = emitter.getvalue() + f"main:\n{init_statements}call {program.name}_main\n"
+    if compiler.peephole is not None:
+        text_segment = compiler.peephole.optimize(text_segment)
+    with open(destination_file, "w") as out:
+        out.write(f"section .text\nextern malloc\nglobal main\n{text_segment}section .data\n{data_segment}"
+                  f"{program.name}: times 4 db 0\n")
+
+
+def measure(compile_function, compiler, program, destination_file: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    compile_function(compiler, program, destination_file)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [2 ** 14, 2 ** 17, 2 ** 20]
+    print(f"{'size (KB)':>10} {'backend':>10} {'memory (s)':>10} {'memory (MB)':>12} {'stream (s)':>10}"
+          f" {'stream (MB)':>12}")
+    for size in sizes:
+        with tempfile.NamedTemporaryFile("w", suffix=".elang", delete=False) as source_file:
+            source_file.write(generate_source(size))
+        program = Parser.create_default(cache_directory=None).parse_file(source_file.name)
+        os.remove(source_file.name)
+        for backend in ["stack", "registers"]:
+            compiler = ProgramCompiler.create_default(backend)
+            in_memory = measure(compile_in_memory, compiler, program, source_file.name + ".asm")
+            streamed = measure(ProgramCompiler.compile, compiler, program, source_file.name + ".asm")
+            os.remove(source_file.name + ".asm")
+            print(f"{size // 2 ** 10:>10} {backend:>10} {in_memory[0]:>10.3f} {in_memory[1] / 2 ** 20:>12.2f}"
+                  f" {streamed[0]:>10.3f} {streamed[1] / 2 ** 20:>12.2f}")
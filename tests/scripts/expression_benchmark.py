@@ -0,0 +1,83 @@
+import os
+import sys
+import tempfile
+import time
+
+from compilation.parsing import Parser
+from compilation.semantic.semantic_check import SemanticChecker
+from compilation.IA32.compiler import ProgramCompiler
+
+OPERATORS = ["+", "*", "-"]
+# The operands of a statement, longer expressions would exceed the recursion limit of the tree walks.
+STATEMENT_OPERANDS = 100
+SOURCE_TEMPLATE = """
+int h(int a) {{
+    return 1;
+}}
+
+int g(int a) {{
+    return 2;
+}}
+
+int f(int a, int b) {{
+    return 3;
+}}
+
+int main() {{
+    int i = 1;
+    int[16] arr;
+    int x = 0;
+{statements}
+    return x;
+}}
+"""
+
+
+def generate_expression(operands: int, first: int) -> str:
+    """
+    This function generates the source code of a flat expression with the given amount of operands.
+    Every tenth operand is a nested function call, so the arguments are parsed as well.
+    :param operands: the amount of operands in the expression.
+    :param first: the index of the first operand in the generated source.
+    :return: the source code of the expression.
+    """
+    expression = ["i"]
+    for idx in range(first + 1, first + operands):
+        expression.append(OPERATORS[idx % len(OPERATORS)])
+        if idx % 10 == 0:
+            expression.append("f(g(h({0})), arr[i])".format(idx))
+        else:
+            expression.append(str(idx) if idx % 2 == 0 else "i")
+    return " ".join(expression)
+
+
+def generate_source(operands: int) -> str:
+    """
+    This function generates a program whose main function assigns flat expressions with the given amount of
+    operands in total.
+    :param operands: the amount of operands in the expressions.
+    :return: the source code of the program.
+    """
+    statements = [f"    x = x + {generate_expression(min(STATEMENT_OPERANDS, operands - first), first)};"
+                  for first in range(0, operands, STATEMENT_OPERANDS)]
+    return SOURCE_TEMPLATE.format(statements="\n".join(statements))
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+    print(f"{'operands':>10} {'parse (s)':>10} {'check (s)':>10} {'compile (s)':>11} {'ns/operand':>10}")
+    for size in sizes:
+        with tempfile.NamedTemporaryFile("w", suffix=".elang", delete=False) as source_file:
+            source_file.write(generate_source(size))
+        # parse_file includes building the scopes and resolving the names of the expressions.
+        start = time.perf_counter()
+        program = Parser.create_default(cache_directory=None).parse_file(source_file.name)
+        parsed = time.perf_counter()
+        SemanticChecker.create_default(cache_directory=None).check(program)
+        checked = time.perf_counter()
+        ProgramCompiler.create_default().compile(program, source_file.name[:-len(".elang")] + ".asm")
+        compiled = time.perf_counter()
+        os.remove(source_file.name)
+        os.remove(source_file.name[:-len(".elang")] + ".asm")
+        print(f"{size:>10} {parsed - start:>10.3f} {checked - parsed:>10.3f} {compiled - checked:>11.3f}"
+              f" {(compiled - start) * 10 ** 9 / size:>10.1f}")
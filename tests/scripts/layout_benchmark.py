@@ -0,0 +1,71 @@
+import os
+import sys
+import tempfile
+import time
+
+from compilation.parsing import Parser
+from compilation.IA32.compiler import ProgramCompiler
+from compilation.IA32.emitter import Emitter
+from compilation.IA32.layout import LayoutEngine
+from compilation.IA32.utils import LabelAllocator
+
+MEMBERS = 64
+
+CLASS_TEMPLATE = """class Record{idx} {{
+{members}
+    int constructor() {{
+{assignments}
+    }}
+}}
+
+"""
+
+
+def generate_source(size: int) -> str:
+    """
+    This function generates a source code with classes that access all of their member variables.
+    :param size: the size of the source code in bytes.
+    :return: the generated source code.
+    """
+    members = "".join(f"    int member{m};\n" for m in range(MEMBERS))
+    assignments = "".join(f"        this.member{m} = {m};\n" for m in range(MEMBERS))
+    classes = []
+    length, idx = 0, 0
+    while length < size:
+        elang_class = CLASS_TEMPLATE.format(idx=idx, members=members, assignments=assignments)
+        classes.append(elang_class)
+        length += len(elang_class)
+        idx += 1
+    return "".join(classes) + "int main() {\n    return 0;\n}\n"
+
+
+class RecomputingLayoutEngine(LayoutEngine):
+    """
+    Layout engine that computes the layout of a class on every member access, as the compiler did before the
+    layouts were kept for the whole compilation.
+    """
+
+    def get_class_layout(self, elang_class):
+        return self.produce_class_layout(elang_class)
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [2 ** 14, 2 ** 17, 2 ** 20]
+    print(f"{'size (KB)':>10} {'recompute (s)':>14} {'memoized (s)':>14}")
+    for size in sizes:
+        with tempfile.NamedTemporaryFile("w", suffix=".elang", delete=False) as source_file:
+            source_file.write(generate_source(size))
+        program = Parser.create_default(cache_directory=None).parse_file(source_file.name)
+        os.remove(source_file.name)
+        timings = []
+        for engine in [RecomputingLayoutEngine, LayoutEngine]:
+            compiler = ProgramCompiler.create_default()
+            folded = compiler.fold_constants(program)
+            bundle = {"scope": folded.scope, "size_bundle": compiler.size_bundle, "program": folded,
+                      "verbose": compiler.verbose, "labels": LabelAllocator(),
+                      "branch_conditions": compiler.branch_conditions, "bounds_checks": compiler.bounds_checks,
+                      "layouts": engine(compiler.size_bundle, compiler.packing)}
+            start = time.perf_counter()
+            compiler.compile_program(folded, bundle, Emitter())
+            timings.append(time.perf_counter() - start)
+        print(f"{size // 2 ** 10:>10} {timings[0]:>14.3f} {timings[1]:>14.3f}")
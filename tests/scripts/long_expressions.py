@@ -0,0 +1,17 @@
+from compilation.parsing import Parser
+from compilation.semantic.semantic_check import *
+from compilation.IA32.compiler import ProgramCompiler
+
+# Expressions far deeper than the recursion limit of the tree walks, one operator per term.
+p = Parser.create_default(cache_directory=None)
+sc = SemanticChecker.create_default()
+compilers = {"stack": ProgramCompiler.create_default(), "registers": ProgramCompiler.create_default("registers")}
+for name, term in [("constants", "1"), ("locals", "i")]:
+    source = "int main(){\n    int i = 3;\n    int x = 0;\n    i = i + 1;\n    x = %s;\n    return x;\n}\n" % \
+             " + ".join([term] * 900)
+    with open(f"../out/long_{name}.elang", "w") as file:
+        file.write(source)
+    program = p.parse_file(f"../out/long_{name}.elang")
+    sc.check(program)
+    for backend, compiler in compilers.items():
+        compiler.compile(program, f"../out/long_{name}.{backend}.asm")
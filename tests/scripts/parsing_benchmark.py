@@ -0,0 +1,64 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from compilation.parsing import Parser
+
+FUNCTION_TEMPLATE = """
+int function_{idx}() {{
+    int i = {idx};
+    int[4] values;
+    values[1] = (i + 3) * 2 - i / 5;
+    while (i > 0) {{
+        i = i - 1;
+    }}
+    if (values[1] == i) {{
+        i = i + function_{previous}();
+    }}
+    return i;
+}}
+"""
+
+
+def generate_source(size: int) -> str:
+    """
+    This function generates a source code that is at least the given size.
+    :param size: the size of the source code in bytes.
+    :return: the generated source code.
+    """
+    functions = []
+    length, idx = 0, 0
+    while length < size:
+        function = FUNCTION_TEMPLATE.format(idx=idx, previous=max(idx - 1, 0))
+        functions.append(function)
+        length += len(function)
+        idx += 1
+    return "".join(functions)
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [2 ** 10, 2 ** 14, 2 ** 17, 2 ** 20, 10 * 2 ** 20]
+    print(f"{'size (KB)':>10} {'parse (s)':>10} {'us/KB':>10} {'peak (MB)':>10} {'load (s)':>10}")
+    for size in sizes:
+        with tempfile.NamedTemporaryFile("w", suffix=".elang", delete=False) as source_file:
+            source_file.write(generate_source(size))
+        start = time.perf_counter()
+        Parser.create_default().parse_file(source_file.name)
+        elapsed = time.perf_counter() - start
+        # The peak memory is measured by a second parse, so tracing does not slow down the timed parse.
+        tracemalloc.start()
+        program = Parser.create_default().parse_file(source_file.name)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del program
+        # Loading the precompiled module skips the parser entirely.
+        precompiled = Parser.create_default().precompile_file(source_file.name)
+        start = time.perf_counter()
+        Parser.create_default().load_precompiled(precompiled)
+        load_elapsed = time.perf_counter() - start
+        os.remove(precompiled)
+        os.remove(source_file.name)
+        print(f"{size // 2 ** 10:>10} {elapsed:>10.3f} {elapsed * 10 ** 6 / (size / 2 ** 10):>10.1f}"
+              f" {peak / 2 ** 20:>10.1f} {load_elapsed:>10.3f}")
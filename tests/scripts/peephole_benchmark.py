@@ -0,0 +1,38 @@
+import os
+import sys
+import tempfile
+import time
+
+from compilation.parsing import Parser
+from compilation.IA32.compiler import ProgramCompiler
+from parsing_benchmark import generate_source
+
+
+def count_instructions(path: str) -> int:
+    with open(path) as assembly:
+        return sum(1 for line in assembly if line.strip() and not line.rstrip().endswith(":"))
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [2 ** 14, 2 ** 17, 2 ** 20]
+    print(f"{'size (KB)':>10} {'backend':>10} {'before':>10} {'after':>10} {'peephole (s)':>12}")
+    for size in sizes:
+        with tempfile.NamedTemporaryFile("w", suffix=".elang", delete=False) as source_file:
+            source_file.write(generate_source(size))
+        program = Parser.create_default(cache_directory=None).parse_file(source_file.name)
+        os.remove(source_file.name)
+        for backend in ["stack", "registers"]:
+            compiler = ProgramCompiler.create_default(backend)
+            peephole, compiler.peephole = compiler.peephole, None
+            compiler.compile(program, source_file.name + ".asm")
+            before = count_instructions(source_file.name + ".asm")
+            with open(source_file.name + ".asm") as assembly:
+                text = assembly.read()
+            start = time.perf_counter()
+            after = peephole.optimize(text)
+            elapsed = time.perf_counter() - start
+            os.remove(source_file.name + ".asm")
+            print(f"{size // 2 ** 10:>10} {backend:>10} {before:>10} "
+                  f"{sum(1 for line in after.splitlines() if line.strip() and not line.endswith(':')):>10}"
+                  f" {elapsed:>12.3f}")
+            print(peephole.report(), end="")
@@ -0,0 +1,28 @@
+import os
+import pickle
+import tempfile
+import zlib
+
+from compilation.parsing import Parser
+from compilation.semantic.semantic_check import *
+from compilation.IA32.compiler import ProgramCompiler
+from compilation.precompiled import HEADER, MAGIC, FORMAT_VERSION, PrecompiledFormatError, read_precompiled
+
+p = Parser.create_default()
+sc = SemanticChecker.create_default()
+compiler = ProgramCompiler.create_default()
+p.precompile_file("../src/exports.elang")
+program = Parser.create_default().parse_file("../src/precompiled_includes.elang")
+sc.check(program)
+compiler.compile(program, "../out/precompiled_includes.asm")
+
+# A module that refers to anything but the models is rejected, pickle would have called it while reading the module.
+with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, "untrusted.elangc")
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION) + zlib.compress(pickle.dumps({"program": os.getcwd})))
+    try:
+        read_precompiled(path)
+        raise Exception("Precompiled module that refers to os.getcwd was read")
+    except PrecompiledFormatError:
+        pass
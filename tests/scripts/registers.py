@@ -0,0 +1,12 @@
+from compilation.parsing import Parser
+from compilation.semantic.semantic_check import *
+from compilation.IA32.compiler import ProgramCompiler
+
+p = Parser.create_default()
+sc = SemanticChecker.create_default()
+compilers = {"stack": ProgramCompiler.create_default(), "registers": ProgramCompiler.create_default("registers")}
+for name in ["loops", "functions", "arrays", "if", "conditions"]:
+    program = p.parse_file(f"../src/{name}.elang")
+    sc.check(program)
+    for backend, compiler in compilers.items():
+        compiler.compile(program, f"../out/{name}.{backend}.asm")
@@ -0,0 +1,47 @@
+from compilation.models.base import Scope, ScopeTree
+from compilation.parsing import Parser
+
+
+def get_children(scope: Scope):
+    # The recursive definition of Scope.get_children.
+    children = []
+    for child in scope.children:
+        children += get_children(child)
+    return children + scope.children
+
+
+def is_child_of(scope: Scope, parent: Scope):
+    p = scope.parent_scope
+    while p is not None and p is not parent:
+        p = p.parent_scope
+    return p is not None
+
+
+# A tree whose scopes have siblings, so the first parent of a scope is often not the one that is looked for.
+root = Scope("root", None)
+first, second = Scope("first", root), Scope("second", root)
+first_a, first_b = Scope("first_a", first), Scope("first_b", first)
+first_a_deep = Scope("first_a_deep", first_a)
+second_a = Scope("second_a", second)
+scopes = [root, first, second, first_a, first_b, first_a_deep, second_a]
+
+program = Parser.create_default().parse_file("../src/conditions.elang")
+for tree_root, tree_scopes in [(root, scopes), (program.scope, [program.scope] + program.scope.get_children())]:
+    tree = ScopeTree(tree_root)
+    for scope in tree_scopes:
+        if scope not in tree:
+            raise Exception(f"Scope {scope.name} is not in the tree")
+        if scope.get_children() != get_children(scope):
+            raise Exception(f"Children of {scope.name} are out of order")
+        if list(tree.subtree(scope)) != [scope] + [child for child in tree.order if is_child_of(child, scope)]:
+            raise Exception(f"Subtree of {scope.name} is wrong")
+        if list(tree.subtree(scope, include_root=False)) != list(tree.subtree(scope))[1:]:
+            raise Exception(f"Subtree of {scope.name} includes its root")
+        for other in tree_scopes:
+            expected = is_child_of(other, scope)
+            if scope.is_child_of(other) is not is_child_of(scope, other):
+                raise Exception(f"{scope.name}.is_child_of({other.name}) is wrong")
+            if tree.is_ancestor(scope, other) is not expected or tree.is_descendant(other, scope) is not expected:
+                raise Exception(f"Ancestry of {scope.name} and {other.name} is wrong")
+if Scope("outside", None) in ScopeTree(root):
+    raise Exception("Scope outside of the tree is in the tree")
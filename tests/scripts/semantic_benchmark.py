@@ -0,0 +1,42 @@
+import os
+import sys
+import tempfile
+import time
+
+from compilation.parsing import Parser
+from compilation.semantic.semantic_check import SemanticChecker, FunctionChecker
+from parsing_benchmark import generate_source
+
+
+class NoOpCheck(FunctionChecker):
+    """
+    Check that looks at every mention and reports nothing, it measures the cost of an additional rule.
+    """
+
+    def visit_mention(self, variable, context) -> None:
+        pass
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [2 ** 14, 2 ** 17, 2 ** 20]
+    workers = os.cpu_count() or 1
+    print(f"{'size (KB)':>10} {'functions':>10} {'check (s)':>10} {'+10 rules':>10} {f'{workers} procs':>10}"
+          f" {'cached (s)':>10}")
+    for size in sizes:
+        with tempfile.NamedTemporaryFile("w", suffix=".elang", delete=False) as source_file:
+            source_file.write(generate_source(size))
+        program = Parser.create_default(cache_directory=None).parse_file(source_file.name)
+        os.remove(source_file.name)
+        default_checklist = SemanticChecker.create_default().function_checklist
+        # The last checker runs after the first one filled the shared cache, as in a rebuild without changes.
+        cached = SemanticChecker.create_default(cache_directory=None)
+        timings = []
+        for checker in [cached,
+                        SemanticChecker(default_checklist + [NoOpCheck() for _ in range(10)]),
+                        SemanticChecker(default_checklist, workers=workers),
+                        cached]:
+            start = time.perf_counter()
+            checker.check_functions(program)
+            timings.append(time.perf_counter() - start)
+        print(f"{size // 2 ** 10:>10} {len(program.functions):>10} {timings[0]:>10.3f} {timings[1]:>10.3f}"
+              f" {timings[2]:>10.3f} {timings[3]:>10.3f}")
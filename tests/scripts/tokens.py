@@ -0,0 +1,6 @@
+from compilation.parsing import Parser
+
+p = Parser.create_default()
+with open("../out/classes.tokens", "w") as out:
+    for token in p.tokenize("../src/classes.elang"):
+        out.write(f"{token.line}:{token.position} {token.kind} {token.text}\n")